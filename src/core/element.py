@@ -3,22 +3,40 @@ Element data structure with properties and confidence scores.
 """
 
 from dataclasses import dataclass
-from typing import Optional, Dict
-from enum import Enum
+from typing import NamedTuple, Optional, Dict, Tuple
+from enum import IntEnum
 
 
-class ElementStatus(Enum):
+# Lower-case status names, indexed by ElementStatus value
+_STATUS_NAMES = (
+    "observed",
+    "synthesis_planned",
+    "predicted",
+    "supercritical",
+    "impossible",
+)
+
+
+class ElementStatus(IntEnum):
     """
     Classification of element based on experimental observation and theoretical viability.
+
+    Integer-valued (ordered by increasing Z range) so status checks and
+    filters are plain int compares; use `.label` for the string name.
     """
-    OBSERVED = "observed"  # Z=1-118, experimentally confirmed
-    SYNTHESIS_PLANNED = "synthesis_planned"  # Z=119-120, active attempts
-    PREDICTED = "predicted"  # Z=121-137, theoretical predictions
-    SUPERCRITICAL = "supercritical"  # Z=138-172, QED unstable
-    IMPOSSIBLE = "impossible"  # Z≥173, spontaneous pair creation
+    OBSERVED = 0  # Z=1-118, experimentally confirmed
+    SYNTHESIS_PLANNED = 1  # Z=119-120, active attempts
+    PREDICTED = 2  # Z=121-137, theoretical predictions
+    SUPERCRITICAL = 3  # Z=138-172, QED unstable
+    IMPOSSIBLE = 4  # Z≥173, spontaneous pair creation
 
+    @property
+    def label(self) -> str:
+        """Lower-case status name, e.g. "synthesis_planned"."""
+        return _STATUS_NAMES[self]
 
-@dataclass
+
+@dataclass(slots=True)
 class Element:
     """
     Element with computed properties and confidence scores.
@@ -68,8 +86,30 @@ class Element:
     def __repr__(self) -> str:
         return (
             f"Element(Z={self.atomic_number}, symbol='{self.symbol}', "
-            f"config='{self.electron_configuration}', status={self.status.value})"
+            f"config='{self.electron_configuration}', status={_STATUS_NAMES[self.status]})"
         )
 
     def __str__(self) -> str:
         return f"{self.name} ({self.symbol}, Z={self.atomic_number})"
+
+
+class ElementView(NamedTuple):
+    """
+    Read-only, lightweight counterpart of Element (see
+    ElementGenerator.generate_view()).
+
+    Holds the generated fields only, with confidence scores as a tuple in
+    src.theory.confidence.PROPERTY_NAMES order instead of a dict.
+    """
+    atomic_number: int
+    symbol: str
+    name: str
+    electron_configuration: str
+    valence_electrons: int
+    block: str
+    status: ElementStatus
+    confidence: Tuple[float, ...]
+    electronegativity: Optional[float] = None
+
+    def __str__(self) -> str:
+        return f"{self.name} ({self.symbol}, Z={self.atomic_number})"
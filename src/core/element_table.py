@@ -0,0 +1,218 @@
+"""
+Column-oriented (struct-of-arrays) table of elements for bulk scans.
+
+A list of Element objects is convenient for single-item access but slow to
+sweep: every predicate walks boxed instances and looks up an attribute on
+each. ElementTable stores one column per attribute instead - numeric columns
+as typed `array` buffers, strings as tuples - so table-wide filters and sorts
+touch only the column they need. Element remains the single-item API;
+`to_elements()` converts back.
+"""
+
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+import math
+import operator
+
+from src.core.element import Element, ElementStatus
+
+
+# Comparison suffixes accepted by ElementTable.filter(), e.g. atomic_number__lt
+_FILTER_OPS = {
+    "lt": operator.lt,
+    "le": operator.le,
+    "gt": operator.gt,
+    "ge": operator.ge,
+    "eq": operator.eq,
+    "ne": operator.ne,
+}
+
+# Optional Element attributes kept as plain per-row columns
+_OPTIONAL_FIELDS = (
+    "group",
+    "period",
+    "atomic_radius",
+    "ionization_energy",
+    "oxidation_states",
+    "half_life",
+    "most_stable_isotope",
+)
+
+
+class ElementTable:
+    """
+    Elements stored as parallel columns.
+
+    Columns:
+        atomic_number: array('h')
+        valence_electrons: array('h')
+        status: array('b') of ElementStatus values
+        block: array('B') of block letter codes (ord('s'), ord('p'), ...)
+        electronegativity: array('d'), NaN where unknown
+        symbol, name, electron_configuration: tuples of str
+        group, period, ...: tuples for the remaining optional attributes
+
+    Confidence dicts are stored as one flat (N, K) row-major array('d')
+    with a shared `property_names` index: the score of property k for row i
+    is confidence[i * K + k], NaN where the element had no such key.
+
+    Usage:
+        >>> table = ElementTable.from_elements(gen.generate(Z) for Z in range(1, 174))
+        >>> mask = table.filter(atomic_number__gt=118, block='p')
+        >>> superheavy = table.to_elements(mask)
+    """
+
+    def __init__(
+        self,
+        atomic_number: array,
+        symbol: Tuple[str, ...],
+        name: Tuple[str, ...],
+        electron_configuration: Tuple[str, ...],
+        valence_electrons: array,
+        block: array,
+        status: array,
+        electronegativity: array,
+        confidence: array,
+        property_names: Tuple[str, ...],
+        optional: Optional[Dict[str, Tuple[Any, ...]]] = None
+    ):
+        """
+        Initialize from prebuilt columns; use from_elements() in most cases.
+        """
+        self.atomic_number = atomic_number
+        self.symbol = symbol
+        self.name = name
+        self.electron_configuration = electron_configuration
+        self.valence_electrons = valence_electrons
+        self.block = block
+        self.status = status
+        self.electronegativity = electronegativity
+        self.confidence = confidence
+        self.property_names = property_names
+
+        size = len(atomic_number)
+        optional = optional or {}
+        for field_name in _OPTIONAL_FIELDS:
+            setattr(self, field_name, optional.get(field_name, (None,) * size))
+
+    @classmethod
+    def from_elements(cls, elements: Iterable[Element]) -> "ElementTable":
+        """
+        Build a table from Element objects (one row per element, in order).
+
+        The confidence index is the union of all confidence keys, in first-seen
+        order.
+        """
+        elements = list(elements)
+
+        property_names: Dict[str, int] = {}
+        for elem in elements:
+            for key in elem.confidence:
+                if key not in property_names:
+                    property_names[key] = len(property_names)
+        num_props = len(property_names)
+
+        confidence = array('d', [math.nan]) * (len(elements) * num_props)
+        for i, elem in enumerate(elements):
+            base = i * num_props
+            for key, score in elem.confidence.items():
+                confidence[base + property_names[key]] = score
+
+        return cls(
+            atomic_number=array('h', [e.atomic_number for e in elements]),
+            symbol=tuple(e.symbol for e in elements),
+            name=tuple(e.name for e in elements),
+            electron_configuration=tuple(e.electron_configuration for e in elements),
+            valence_electrons=array('h', [e.valence_electrons for e in elements]),
+            block=array('B', [ord(e.block) for e in elements]),
+            status=array('b', [e.status for e in elements]),
+            electronegativity=array('d', [
+                math.nan if e.electronegativity is None else e.electronegativity
+                for e in elements
+            ]),
+            confidence=confidence,
+            property_names=tuple(property_names),
+            optional={
+                field_name: tuple(getattr(e, field_name) for e in elements)
+                for field_name in _OPTIONAL_FIELDS
+            }
+        )
+
+    def __len__(self) -> int:
+        return len(self.atomic_number)
+
+    def column(self, name: str) -> Sequence[Any]:
+        """
+        Return a column by attribute name.
+
+        `block` and `status` are returned as their raw integer codes, so
+        predicates on them stay integer compares.
+        """
+        if name == "confidence" or name == "property_names" or not hasattr(self, name):
+            raise KeyError(name)
+        return getattr(self, name)
+
+    def confidence_column(self, property_name: str) -> array:
+        """Confidence scores of one property for every row (NaN where missing)."""
+        k = self.property_names.index(property_name)
+        return self.confidence[k::len(self.property_names)]
+
+    def filter(self, **predicates: Any) -> List[bool]:
+        """
+        Row mask for the conjunction of column predicates.
+
+        Keys are `column` (equality) or `column__op` with op in
+        lt/le/gt/ge/eq/ne. Block letters and ElementStatus members are
+        converted to the stored codes.
+
+        Examples:
+            >>> table.filter(atomic_number__lt=118)
+            >>> table.filter(status=ElementStatus.PREDICTED, block='g')
+
+        Raises:
+            KeyError: If a column or comparison is unknown
+        """
+        mask = [True] * len(self)
+        for key, value in predicates.items():
+            name, _, op_name = key.partition("__")
+            op = _FILTER_OPS[op_name or "eq"]
+            column = self.column(name)
+            if name == "block" and isinstance(value, str):
+                value = ord(value)
+            mask = [m and op(x, value) for m, x in zip(mask, column)]
+        return mask
+
+    def to_elements(self, mask: Optional[Sequence[bool]] = None) -> List[Element]:
+        """
+        Materialize rows back into Element objects (all rows if mask is None).
+        """
+        rows = range(len(self)) if mask is None else [i for i, keep in enumerate(mask) if keep]
+        return [self._row(i) for i in rows]
+
+    def _row(self, i: int) -> Element:
+        """Build the Element for row i."""
+        num_props = len(self.property_names)
+        base = i * num_props
+        confidence = {}
+        for k, key in enumerate(self.property_names):
+            score = self.confidence[base + k]
+            if not math.isnan(score):
+                confidence[key] = score
+
+        electronegativity = self.electronegativity[i]
+
+        return Element(
+            atomic_number=self.atomic_number[i],
+            symbol=self.symbol[i],
+            name=self.name[i],
+            electron_configuration=self.electron_configuration[i],
+            valence_electrons=self.valence_electrons[i],
+            block=chr(self.block[i]),
+            status=ElementStatus(self.status[i]),
+            confidence=confidence,
+            electronegativity=None if math.isnan(electronegativity) else electronegativity,
+            **{field_name: getattr(self, field_name)[i] for field_name in _OPTIONAL_FIELDS}
+        )
+
+    def __repr__(self) -> str:
+        return f"ElementTable(rows={len(self)}, properties={len(self.property_names)})"
@@ -11,12 +11,54 @@ This detector is domain-agnostic. It works on any system where:
 3. You have actual ground truth (experiment, expensive calculation, etc.)
 """
 
-from dataclasses import dataclass
-from typing import Dict, List, Tuple, Optional, Any, Callable
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from dataclasses import dataclass, fields, replace
+from typing import Dict, Iterable, List, Tuple, Optional, Any, Callable, ClassVar, NamedTuple, Union
 import math
+import random
 
+# Optional compiled connectivity for very large graphs
+try:
+    import numpy as np
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import connected_components
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
 
-@dataclass
+
+# Graphs at least this large count components with SciPy when it is
+# installed; below it the array conversion costs more than the Python DFS
+SCIPY_MIN_NODES = 2000
+
+# Violations below this fraction of |actual| (or absolute, for |actual| < 1)
+# are numerical noise: the system decomposes cleanly and is not analyzed
+NEGLIGIBLE_VIOLATION = 1e-9
+
+# In clustering_mode="auto", graphs with more atoms than this get the
+# sampled (approximate) clustering coefficient
+APPROX_CLUSTERING_MIN_NODES = 5000
+
+_CLUSTERING_MODES = ("auto", "exact", "approx")
+
+# BFS depth limit for ring detection: resolves rings of up to
+# 2 * RING_SEARCH_DEPTH = 16 atoms, which covers everything from cyclopropane
+# to common macrocycles
+RING_SEARCH_DEPTH = 8
+MAX_RESOLVED_RING_SIZE = 2 * RING_SEARCH_DEPTH
+
+# max_cycle_size of a cyclic graph whose rings are all larger than
+# MAX_RESOLVED_RING_SIZE: a lower bound ("at least 17"), not a measured size
+RING_SIZE_BEYOND_SEARCH = MAX_RESOLVED_RING_SIZE + 1
+
+# Reasoning labels, indexed by (abs_rel > 5%) + (abs_rel > 10%) and (violation < 0)
+_MAGNITUDE_LABELS = ("Small", "Moderate", "Large")
+_DIRECTION_LABELS = ("destabilization", "stabilization")
+
+
+@dataclass(slots=True)
 class AdditivityViolation:
     """
     Result of measuring how much actual properties deviate from naive composition.
@@ -28,7 +70,8 @@ class AdditivityViolation:
         relative_violation: Violation as fraction of actual value
         confidence: Uncertainty in the measurement (0.0 to 1.0)
         classification: Type of violation ("decomposes_cleanly", "must_cache", "uncertain")
-        structural_features: Features extracted from the structure
+        structural_features: Features extracted from the structure (supports
+                             dict-style access, e.g. features['num_cycles'])
         reasoning: Human-readable explanation
     """
     naive_value: float
@@ -37,7 +80,7 @@ class AdditivityViolation:
     relative_violation: float  # violation / abs(actual)
     confidence: float  # 0.0 to 1.0
     classification: str  # "decomposes_cleanly" | "must_cache" | "uncertain"
-    structural_features: Dict[str, Any]
+    structural_features: "StructuralFeatures"
     reasoning: str
 
     def is_significant(self, threshold: float = 0.05) -> bool:
@@ -60,7 +103,7 @@ class AdditivityViolation:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class StructuralFeatures:
     """
     Graph-theoretic and topological features of a structure.
@@ -69,14 +112,16 @@ class StructuralFeatures:
 
     Attributes:
         num_nodes: Number of nodes (atoms, particles, components)
-        num_edges: Number of edges (bonds, interactions)
+        num_edges: Number of unique edges (bonds, interactions); duplicate
+                   bonds and self-loops are not counted
         num_cycles: Number of cycles in the graph
-        max_cycle_size: Size of largest cycle
+        max_cycle_size: Size of largest cycle of at most MAX_RESOLVED_RING_SIZE
+                        atoms (RING_SIZE_BEYOND_SEARCH if every ring is larger)
         symmetry_order: Order of symmetry group (1 = no symmetry)
         planarity: Whether graph is planar (True/False)
         conjugation: Degree of conjugation/delocalization (0.0 to 1.0)
         density: Edge density = edges / max_possible_edges
-        clustering: Average clustering coefficient
+        clustering: Global clustering coefficient (transitivity)
         custom: Domain-specific features (dict)
     """
     num_nodes: int
@@ -90,6 +135,9 @@ class StructuralFeatures:
     clustering: float
     custom: Dict[str, Any]
 
+    # Names exposed through as_dict() / dict-style access (filled in below)
+    _KEYS: ClassVar[frozenset] = frozenset()
+
     def has_resonance(self) -> bool:
         """Check if structure likely has resonance/delocalization."""
         return self.conjugation > 0.5 or (self.num_cycles > 0 and self.max_cycle_size >= 5)
@@ -98,6 +146,22 @@ class StructuralFeatures:
         """Check if structure has significant symmetry."""
         return self.symmetry_order > 1
 
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the features as a plain dict (shallow; `custom` is shared)."""
+        return {f.name: getattr(self, f.name) for f in fields(self) if f.init}
+
+    def __getitem__(self, key: str) -> Any:
+        """Dict-style access, e.g. features['num_cycles']."""
+        if key not in self._KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style access with a default, e.g. features.get('conjugation', 0.0)."""
+        if key not in self._KEYS:
+            return default
+        return getattr(self, key)
+
     def __repr__(self) -> str:
         return (
             f"StructuralFeatures(nodes={self.num_nodes}, edges={self.num_edges}, "
@@ -105,6 +169,9 @@ class StructuralFeatures:
         )
 
 
+StructuralFeatures._KEYS = frozenset(f.name for f in fields(StructuralFeatures) if f.init)
+
+
 class CrystallizationDetector:
     """
     Detects when compositional boundaries should form by measuring additivity violations.
@@ -134,15 +201,51 @@ class CrystallizationDetector:
         ...     print(f"Cache this! Violation: {violation.relative_violation:.1%}")
     """
 
-    def __init__(self, violation_threshold: float = 0.05):
+    def __init__(
+        self,
+        violation_threshold: float = 0.05,
+        feature_cache_size: int = 4096,
+        clustering_mode: str = "auto",
+        clustering_samples: int = 10000
+    ):
         """
         Initialize detector.
 
         Args:
             violation_threshold: Relative violation threshold for "must_cache"
                                 (default 5%)
+            feature_cache_size: Number of graphs whose structural features are
+                                memoized (LRU); 0 disables the cache
+            clustering_mode: "exact" counts every triangle; "approx" estimates
+                             the clustering coefficient from randomly sampled
+                             wedges; "auto" uses approx above
+                             APPROX_CLUSTERING_MIN_NODES atoms
+            clustering_samples: Number of wedges sampled in approx mode
+                                (standard error ~ 0.5 / sqrt(samples))
+
+        Raises:
+            ValueError: If clustering_mode is unknown
         """
-        self.violation_threshold = violation_threshold
+        if clustering_mode not in _CLUSTERING_MODES:
+            raise ValueError(
+                f"clustering_mode must be one of {_CLUSTERING_MODES}, got {clustering_mode!r}"
+            )
+
+        self.violation_threshold = violation_threshold  # also sets the 2x "large" cutoff
+        self.feature_cache_size = feature_cache_size
+        self.clustering_mode = clustering_mode
+        self.clustering_samples = clustering_samples
+        self._feature_cache: OrderedDict = OrderedDict()
+
+    @property
+    def violation_threshold(self) -> float:
+        """Relative violation threshold; twice this value counts as "large"."""
+        return self._threshold_low
+
+    @violation_threshold.setter
+    def violation_threshold(self, value: float) -> None:
+        self._threshold_low = value
+        self._threshold_high = 2 * value
 
     def measure_additivity_violation(
         self,
@@ -169,6 +272,8 @@ class CrystallizationDetector:
             - violation > 0: System is MORE stable than naive prediction (benzene)
             - violation < 0: System is LESS stable than naive prediction (strained rings)
             - violation ≈ 0: Additivity works fine, decomposition is valid
+              (below NEGLIGIBLE_VIOLATION the violation is not classified
+              or explained, but the structure's features are still reported)
 
         Examples:
             >>> # Benzene: aromatic stabilization
@@ -192,13 +297,91 @@ class CrystallizationDetector:
         # Compute naive additive prediction
         naive_value = naive_fn(structure)
 
+        return self._build_violation(structure, naive_value, actual_value, confidence)
+
+    def measure_additivity_violations(
+        self,
+        structures: Iterable[Any],
+        naive_fns: Union[Callable[[Any], float], Iterable[Callable[[Any], float]]],
+        actual_values: Iterable[float],
+        confidences: Optional[Iterable[float]] = None
+    ) -> List[AdditivityViolation]:
+        """
+        Measure additivity violations for a batch of structures.
+
+        Equivalent to calling measure_additivity_violation() per structure,
+        but binds the per-call machinery once for the whole batch. Repeated
+        graphs in the batch are served from the structural feature cache.
+
+        Args:
+            structures: Structures to analyze
+            naive_fns: One naive composition function shared by every
+                       structure, or one function per structure
+            actual_values: Ground truth value per structure
+            confidences: Uncertainty per structure (default 1.0 for all)
+
+        Returns:
+            List of AdditivityViolation objects, in input order
+
+        Raises:
+            ValueError: If the per-structure inputs differ in length
+
+        Examples:
+            >>> violations = detector.measure_additivity_violations(
+            ...     structures=molecules,
+            ...     naive_fns=naive_bond_energy,
+            ...     actual_values=[m.actual_energy for m in molecules]
+            ... )
+        """
+        structures = list(structures)
+
+        if callable(naive_fns):
+            naive_fns = [naive_fns] * len(structures)
+        if confidences is None:
+            confidences = [1.0] * len(structures)
+
+        build = self._build_violation
+        return [
+            build(structure, naive_fn(structure), actual_value, confidence)
+            for structure, naive_fn, actual_value, confidence
+            in zip(structures, naive_fns, actual_values, confidences, strict=True)
+        ]
+
+    def _build_violation(
+        self,
+        structure: Any,
+        naive_value: float,
+        actual_value: float,
+        confidence: float
+    ) -> AdditivityViolation:
+        """Assemble an AdditivityViolation once the naive value is known."""
         # Compute violation
         violation = actual_value - naive_value
-        relative_violation = violation / abs(actual_value) if actual_value != 0 else 0.0
+        abs_violation = abs(violation)
+        abs_actual = abs(actual_value)
 
-        # Extract structural features
+        # Extract structural features (memoized, so cheap for repeated graphs)
         features = self.extract_structural_features(structure)
 
+        # Exact additivity: nothing to classify or explain
+        if abs_violation < NEGLIGIBLE_VIOLATION * max(abs_actual, 1.0):
+            return AdditivityViolation(
+                naive_value=naive_value,
+                actual_value=actual_value,
+                violation=violation,
+                relative_violation=0.0,
+                confidence=confidence,
+                classification="decomposes_cleanly",
+                structural_features=features,
+                reasoning="negligible violation"
+            )
+
+        if abs_actual:
+            relative_violation = violation / abs_actual
+            abs_relative = abs_violation / abs_actual
+        else:
+            relative_violation = abs_relative = 0.0
+
         # Classify the violation
         classification = self.classify_violation(
             violation=violation,
@@ -211,7 +394,8 @@ class CrystallizationDetector:
             violation=violation,
             relative_violation=relative_violation,
             classification=classification,
-            features=features
+            features=features,
+            abs_relative=abs_relative
         )
 
         return AdditivityViolation(
@@ -221,7 +405,7 @@ class CrystallizationDetector:
             relative_violation=relative_violation,
             confidence=confidence,
             classification=classification,
-            structural_features=features.__dict__,
+            structural_features=features,
             reasoning=reasoning
         )
 
@@ -240,59 +424,98 @@ class CrystallizationDetector:
         Notes:
             - Override this method for domain-specific feature extraction
             - Default implementation works for molecular graphs
+            - Molecular graph features are memoized by _structure_key(), so
+              repeated graphs skip the analysis entirely
         """
         # Extract basic graph properties
         # Structure is expected to have: atoms (list), bonds (list of tuples)
 
         if hasattr(structure, 'atoms') and hasattr(structure, 'bonds'):
-            num_nodes = len(structure.atoms)
-            num_edges = len(structure.bonds)
-
-            # Detect cycles using simple depth-first search
-            num_cycles, max_cycle_size = self._detect_cycles(structure)
-
-            # Estimate symmetry order (simple heuristic for now)
-            symmetry_order = self._estimate_symmetry(structure)
-
-            # Check planarity (heuristic: cycles > 0 and small)
-            planarity = (num_cycles == 0) or (max_cycle_size <= 6)
-
-            # Estimate conjugation (alternating double bonds in cycles)
-            conjugation = self._estimate_conjugation(structure)
-
-            # Compute graph density
-            max_edges = num_nodes * (num_nodes - 1) / 2 if num_nodes > 1 else 1
-            density = num_edges / max_edges if max_edges > 0 else 0.0
-
-            # Clustering coefficient (simplified)
-            clustering = self._compute_clustering(structure)
-
-            return StructuralFeatures(
-                num_nodes=num_nodes,
-                num_edges=num_edges,
-                num_cycles=num_cycles,
-                max_cycle_size=max_cycle_size,
-                symmetry_order=symmetry_order,
-                planarity=planarity,
-                conjugation=conjugation,
-                density=density,
-                clustering=clustering,
-                custom={}
-            )
+            # Features depend only on the graph, so identical graphs share
+            # one analysis; hand out a copy so callers may fill in `custom`
+            if self.feature_cache_size <= 0:
+                return self._graph_features(structure)
+
+            key = self._structure_key(structure)
+            features = self._feature_cache.get(key)
+            if features is None:
+                features = self._graph_features(structure)
+                self._feature_cache[key] = features
+                if len(self._feature_cache) > self.feature_cache_size:
+                    self._feature_cache.popitem(last=False)
+            else:
+                self._feature_cache.move_to_end(key)
+
+            return replace(features, custom=dict(features.custom))
         else:
             # Generic structure without atoms/bonds - return default features
-            return StructuralFeatures(
-                num_nodes=0,
-                num_edges=0,
-                num_cycles=0,
-                max_cycle_size=0,
-                symmetry_order=1,
-                planarity=True,
-                conjugation=0.0,
-                density=0.0,
-                clustering=0.0,
-                custom={}
-            )
+            return self._default_features()
+
+    @staticmethod
+    def _default_features() -> StructuralFeatures:
+        """Features reported when the structure is not analyzed."""
+        return StructuralFeatures(
+            num_nodes=0,
+            num_edges=0,
+            num_cycles=0,
+            max_cycle_size=0,
+            symmetry_order=1,
+            planarity=True,
+            conjugation=0.0,
+            density=0.0,
+            clustering=0.0,
+            custom={}
+        )
+
+    def _graph_features(self, structure: Any) -> StructuralFeatures:
+        """Compute StructuralFeatures for a structure with atoms and bonds."""
+        # Single fused pass over the graph; every feature derives from it
+        analysis = self._analyze(structure)
+        num_nodes = analysis.num_nodes
+        num_edges = analysis.num_edges
+        num_cycles = analysis.num_cycles
+        max_cycle_size = analysis.max_cycle_size
+
+        # Check planarity (heuristic: cycles > 0 and small)
+        planarity = (num_cycles == 0) or (max_cycle_size <= 6)
+
+        # Compute graph density
+        max_edges = num_nodes * (num_nodes - 1) / 2 if num_nodes > 1 else 1
+        density = num_edges / max_edges if max_edges > 0 else 0.0
+
+        return StructuralFeatures(
+            num_nodes=num_nodes,
+            num_edges=num_edges,
+            num_cycles=num_cycles,
+            max_cycle_size=max_cycle_size,
+            symmetry_order=self._symmetry_order(analysis),
+            planarity=planarity,
+            conjugation=self._conjugation_score(analysis),
+            density=density,
+            clustering=self._clustering_coefficient(analysis),
+            custom={}
+        )
+
+    @staticmethod
+    def _structure_key(structure: Any) -> Tuple:
+        """
+        Canonical hashable key for a molecular graph.
+
+        Two structures with the same atom count and the same set of
+        (undirected) bonds and bond orders map to the same key, regardless
+        of the order in which bonds are listed.
+        """
+        return (
+            len(structure.atoms),
+            tuple(sorted(
+                (i, j, order) if i <= j else (j, i, order)
+                for i, j, order in structure.bonds
+            ))
+        )
+
+    def clear_feature_cache(self) -> None:
+        """Drop all memoized structural features."""
+        self._feature_cache.clear()
 
     def classify_violation(
         self,
@@ -319,18 +542,18 @@ class CrystallizationDetector:
         abs_relative = abs(relative_violation)
 
         # Large violation → must cache
-        if abs_relative > self.violation_threshold * 2:  # 10% threshold
+        if abs_relative > self._threshold_high:  # 10% threshold
             return "must_cache"
 
-        # Small violation + simple structure → decomposes cleanly
-        if abs_relative < self.violation_threshold:  # 5% threshold
-            if not features.has_resonance() and not features.is_symmetric():
-                return "decomposes_cleanly"
+        special = features.has_resonance() or features.is_symmetric()
+
+        # Small violation: decomposes cleanly unless the structure is special
+        if abs_relative < self._threshold_low:  # 5% threshold
+            return "uncertain" if special else "decomposes_cleanly"
 
         # Moderate violation + special structure → must cache
-        if abs_relative > self.violation_threshold:
-            if features.has_resonance() or features.is_symmetric():
-                return "must_cache"
+        if special and abs_relative > self._threshold_low:
+            return "must_cache"
 
         # Borderline → uncertain
         return "uncertain"
@@ -340,22 +563,29 @@ class CrystallizationDetector:
         violation: float,
         relative_violation: float,
         classification: str,
-        features: StructuralFeatures
+        features: StructuralFeatures,
+        abs_relative: Optional[float] = None
     ) -> str:
         """Generate human-readable explanation of the violation."""
-        abs_rel = abs(relative_violation)
+        abs_rel = abs(relative_violation) if abs_relative is None else abs_relative
 
-        direction = "stabilization" if violation < 0 else "destabilization"
-        magnitude = "large" if abs_rel > 0.10 else "moderate" if abs_rel > 0.05 else "small"
+        # Table lookups indexed by comparison results instead of chained ternaries
+        magnitude = _MAGNITUDE_LABELS[(abs_rel > 0.05) + (abs_rel > 0.10)]
+        direction = _DIRECTION_LABELS[violation < 0]
+        summary = f"{magnitude} {direction} ({abs_rel:.1%})"
 
-        reasoning_parts = [
-            f"{magnitude.capitalize()} {direction} ({abs_rel:.1%})",
-        ]
+        has_resonance = features.has_resonance()
+        is_symmetric = features.is_symmetric()
 
-        if features.has_resonance():
+        if not (has_resonance or is_symmetric or features.num_cycles > 0):
+            return f"{summary}, → {classification}"
+
+        reasoning_parts = [summary]
+
+        if has_resonance:
             reasoning_parts.append("resonance/delocalization detected")
 
-        if features.is_symmetric():
+        if is_symmetric:
             reasoning_parts.append(f"symmetry order {features.symmetry_order}")
 
         if features.num_cycles > 0:
@@ -365,51 +595,124 @@ class CrystallizationDetector:
 
         return ", ".join(reasoning_parts)
 
-    def _detect_cycles(self, structure: Any) -> Tuple[int, int]:
+    def _analyze(self, structure: Any) -> "_GraphAnalysis":
         """
-        Detect cycles in the graph structure.
+        Gather every graph quantity the feature helpers need in a single pass.
+
+        The per-bond arrays come from _bond_arrays(). The edges are packed
+        into CSR arrays and everything else is computed by the flat numeric
+        kernel _graph_kernel().
 
         Returns:
-            (num_cycles, max_cycle_size)
+            _GraphAnalysis with raw counts for the structure
         """
-        # Simplified cycle detection
-        # For now, just count if there are more edges than nodes-1 (tree condition)
-        num_nodes = len(structure.atoms)
-        num_edges = len(structure.bonds)
+        bond_arrays = self._bond_arrays(structure)
+        num_nodes = bond_arrays.num_atoms
+        num_edges = len(bond_arrays.edges)  # Duplicate bonds and self-loops excluded
+        degrees = bond_arrays.degrees
+        edges = bond_arrays.edges
+        orders = bond_arrays.orders
+
+        indptr, indices = self._build_csr(num_nodes, edges)
+
+        (num_components, num_cycles, max_cycle_size, double_bonds,
+         aromatic_bonds, triangles, triples) = _graph_kernel(
+            indptr, indices, orders, self._clustering_samples_for(num_nodes)
+        )
 
-        # Tree has n-1 edges, cycles add extra edges
-        if num_edges >= num_nodes:
-            # Heuristic: number of "extra" edges estimates cycle count
-            num_cycles = num_edges - num_nodes + 1
+        return _GraphAnalysis(
+            num_nodes=num_nodes,
+            num_edges=num_edges,
+            num_bonds=len(orders),
+            degrees=degrees,
+            indptr=indptr,
+            indices=indices,
+            num_components=num_components,
+            num_cycles=num_cycles,
+            max_cycle_size=max_cycle_size,
+            double_bonds=double_bonds,
+            aromatic_bonds=aromatic_bonds,
+            triangles=triangles,
+            triples=triples
+        )
 
-            # Heuristic for max cycle size based on graph size
-            max_cycle_size = min(num_nodes, 6)  # Assume typical rings are size 3-6
+    def _clustering_samples_for(self, num_nodes: int) -> int:
+        """Wedge samples for the clustering estimate; 0 means count exactly."""
+        if self.clustering_mode == "exact":
+            return 0
+        if self.clustering_mode == "auto" and num_nodes <= APPROX_CLUSTERING_MIN_NODES:
+            return 0
+        return self.clustering_samples
 
-            return (num_cycles, max_cycle_size)
-        else:
-            return (0, 0)
+    def _bond_arrays(self, structure: Any) -> "_BondArrays":
+        """
+        Per-bond arrays of a structure.
 
-    def _estimate_symmetry(self, structure: Any) -> int:
+        One loop over the bonds tallies degrees, collects the unique edges and
+        the bond orders. Nothing is kept between calls, so bonds edited in
+        place are always seen; repeated graphs are instead served by the
+        feature cache, keyed on content by _structure_key().
         """
-        Estimate symmetry order (number of symmetry operations).
+        bonds = structure.bonds
+        num_atoms = len(structure.atoms)
+
+        degrees = [0] * num_atoms
+        orders = array('d', bytes(8 * len(bonds)))
+        edges = []
+        seen = set()
+
+        for k, (i, j, order) in enumerate(bonds):
+            degrees[i] += 1
+            degrees[j] += 1
+            orders[k] = order
+            pair = (i, j) if i < j else (j, i)
+            if pair not in seen and i != j:
+                seen.add(pair)
+                edges.append(pair)
+
+        return _BondArrays(
+            num_atoms=num_atoms,
+            degrees=degrees,
+            edges=edges,
+            orders=orders
+        )
 
-        Returns:
-            Symmetry order (1 = no symmetry)
+    @staticmethod
+    def _build_csr(num_nodes: int, edges: List[Tuple[int, int]]) -> Tuple[array, array]:
         """
-        # Simplified heuristic based on structure size and regularity
-        num_nodes = len(structure.atoms)
-        num_edges = len(structure.bonds)
+        Pack undirected edges into compressed sparse row arrays.
 
-        # Perfect regularity heuristic: if all atoms have same degree
-        if num_nodes > 0 and num_edges > 0:
-            # Count degree of each atom
-            degrees = [0] * num_nodes
-            for i, j, _ in structure.bonds:
-                degrees[i] += 1
-                degrees[j] += 1
+        The neighbours of vertex v are indices[indptr[v]:indptr[v + 1]],
+        sorted ascending so neighbour lists can be intersected by merging.
+        """
+        indptr = array('i', bytes(4 * (num_nodes + 1)))
+        for u, v in edges:
+            indptr[u + 1] += 1
+            indptr[v + 1] += 1
+        for v in range(num_nodes):
+            indptr[v + 1] += indptr[v]
+
+        indices = array('i', bytes(4 * indptr[num_nodes]))
+        cursor = indptr[:-1]
+        for u, v in sorted(edges):
+            indices[cursor[u]] = v
+            cursor[u] += 1
+            indices[cursor[v]] = u
+            cursor[v] += 1
+
+        return indptr, indices
+
+    @staticmethod
+    def _symmetry_order(analysis: "_GraphAnalysis") -> int:
+        """Estimate symmetry order from the degree sequence (1 = no symmetry)."""
+        num_nodes = analysis.num_nodes
+        degrees = analysis.degrees
 
+        # Perfect regularity heuristic: if all atoms have same degree
+        if num_nodes > 0 and analysis.num_edges > 0:
             # If all degrees are equal, structure might be symmetric
-            if len(set(degrees)) == 1:
+            # (list.count scans in C and avoids building a set of degrees)
+            if degrees.count(degrees[0]) == num_nodes:
                 # Benzene-like: 6 atoms, order 6 symmetry
                 if num_nodes == 6 and degrees[0] == 2:
                     return 6
@@ -421,36 +724,27 @@ class CrystallizationDetector:
 
         return 1  # No symmetry detected
 
-    def _estimate_conjugation(self, structure: Any) -> float:
-        """
-        Estimate degree of conjugation/delocalization.
-
-        Returns:
-            Conjugation score (0.0 to 1.0)
-        """
-        # Heuristic: alternating single/double bonds in cycles suggests conjugation
-        # Also: fractional bond orders (like 1.5 in benzene) indicate delocalization
-        if not hasattr(structure, 'bonds'):
-            return 0.0
-
-        # Count double bonds and aromatic bonds (fractional order)
-        double_bonds = 0
-        aromatic_bonds = 0
-        for _, _, order in structure.bonds:
-            if order == 2:
-                double_bonds += 1
-            elif 1 < order < 2:  # Fractional order (aromatic/delocalized)
-                aromatic_bonds += 1
-
-        total_bonds = len(structure.bonds)
+    @staticmethod
+    def _conjugation_score(analysis: "_GraphAnalysis") -> float:
+        """Score conjugation (0.0 to 1.0) from a full graph analysis."""
+        return CrystallizationDetector._conjugation_from_counts(
+            analysis.num_bonds, analysis.double_bonds,
+            analysis.aromatic_bonds, analysis.num_cycles
+        )
 
+    @staticmethod
+    def _conjugation_from_counts(
+        total_bonds: int,
+        double_bonds: int,
+        aromatic_bonds: int,
+        num_cycles: int
+    ) -> float:
+        """Score conjugation (0.0 to 1.0) from bond-order counts and cycles."""
         if total_bonds == 0:
             return 0.0
 
         # High ratio of double/aromatic bonds + cycles → high conjugation
-        conjugated_bonds = double_bonds + aromatic_bonds
-        conjugated_ratio = conjugated_bonds / total_bonds
-        num_cycles, _ = self._detect_cycles(structure)
+        conjugated_ratio = (double_bonds + aromatic_bonds) / total_bonds
 
         # Aromatic bonds in cycles = strong conjugation signal
         if num_cycles > 0 and aromatic_bonds > 0:
@@ -460,36 +754,311 @@ class CrystallizationDetector:
         else:
             return conjugated_ratio
 
+    @staticmethod
+    def _clustering_coefficient(analysis: "_GraphAnalysis") -> float:
+        """
+        Global clustering coefficient (transitivity), 0.0 to 1.0.
+
+        Transitivity = 3 * triangles / connected triples, where a node of
+        degree d is the centre of d(d-1)/2 connected triples.
+        """
+        if analysis.num_nodes < 3:
+            return 0.0
+
+        triples = analysis.triples
+
+        return 3 * analysis.triangles / triples if triples > 0 else 0.0
+
+    def _detect_cycles(self, structure: Any) -> Tuple[int, int]:
+        """
+        Detect cycles in the graph structure.
+
+        Returns:
+            (num_cycles, max_cycle_size)
+        """
+        analysis = self._analyze(structure)
+        return (analysis.num_cycles, analysis.max_cycle_size)
+
+    def _estimate_symmetry(self, structure: Any) -> int:
+        """
+        Estimate symmetry order (number of symmetry operations).
+
+        Returns:
+            Symmetry order (1 = no symmetry)
+        """
+        return self._symmetry_order(self._analyze(structure))
+
+    def _estimate_conjugation(self, structure: Any, num_cycles: Optional[int] = None) -> float:
+        """
+        Estimate degree of conjugation/delocalization.
+
+        Args:
+            structure: The structure to analyze
+            num_cycles: Cycle count if the caller already has it; the score
+                        then needs only the bond orders, not a graph analysis
+
+        Returns:
+            Conjugation score (0.0 to 1.0)
+        """
+        # Heuristic: alternating single/double bonds in cycles suggests conjugation
+        # Also: fractional bond orders (like 1.5 in benzene) indicate delocalization
+        if not hasattr(structure, 'bonds'):
+            return 0.0
+
+        if num_cycles is None:
+            return self._conjugation_score(self._analyze(structure))
+
+        orders = self._bond_arrays(structure).orders
+        double_bonds, aromatic_bonds = _count_bond_orders(orders)
+        return self._conjugation_from_counts(len(orders), double_bonds, aromatic_bonds, num_cycles)
+
     def _compute_clustering(self, structure: Any) -> float:
         """
-        Compute average clustering coefficient.
+        Compute global clustering coefficient (transitivity).
 
         Returns:
             Clustering coefficient (0.0 to 1.0)
         """
-        # Simplified version: fraction of nodes in triangles
         if not hasattr(structure, 'bonds'):
             return 0.0
 
-        num_nodes = len(structure.atoms)
-        if num_nodes < 3:
-            return 0.0
+        return self._clustering_coefficient(self._analyze(structure))
+
+
+class _BondArrays(NamedTuple):
+    """Per-bond data produced by CrystallizationDetector._bond_arrays()."""
+    num_atoms: int
+    degrees: List[int]  # Bond count per atom (duplicate bonds included)
+    edges: List[Tuple[int, int]]  # Unique undirected edges (i < j)
+    orders: array  # Bond order of every bond, in input order
+
+
+class _GraphAnalysis(NamedTuple):
+    """Raw graph counts produced by CrystallizationDetector._analyze()."""
+    num_nodes: int
+    num_edges: int  # Unique undirected edges, as in the CSR arrays
+    num_bonds: int  # Bonds as listed, duplicates included (bond-order counts)
+    degrees: List[int]
+    indptr: array  # CSR row pointers, length num_nodes + 1
+    indices: array  # CSR neighbour lists, sorted per vertex
+    num_components: int
+    num_cycles: int
+    max_cycle_size: int
+    double_bonds: int
+    aromatic_bonds: int
+    triangles: int  # Estimated from sampled wedges in approx clustering mode
+    triples: int  # Connected triples (paths of length 2)
+
+
+def _graph_kernel(
+    indptr: array,
+    indices: array,
+    orders: array,
+    clustering_samples: int = 0
+) -> Tuple[int, ...]:
+    """
+    Numeric core of CrystallizationDetector._analyze().
 
-        # Build adjacency
-        adj = [set() for _ in range(num_nodes)]
-        for i, j, _ in structure.bonds:
-            adj[i].add(j)
-            adj[j].add(i)
+    Works only on flat integer/float buffers: the CSR adjacency (indptr,
+    indices) and the bond orders. Kept free of Python objects beyond lists
+    of ints so it stays a tight loop nest.
 
-        # Count triangles
-        triangles = 0
-        for i in range(num_nodes):
-            for j in adj[i]:
-                if j > i:  # Avoid double counting
-                    common = adj[i] & adj[j]
-                    triangles += len(common)
+    With clustering_samples > 0 the triangle count is not enumerated but
+    estimated from that many sampled wedges (see _sample_transitivity).
 
-        # Normalize by possible triangles
-        max_triangles = num_nodes * (num_nodes - 1) * (num_nodes - 2) / 6
+    Returns:
+        (num_components, num_cycles, max_cycle_size, double_bonds,
+         aromatic_bonds, triangles, triples)
+    """
+    num_nodes = len(indptr) - 1
+    num_edges = indptr[num_nodes] // 2  # Unique edges; each appears twice in CSR
+
+    double_bonds, aromatic_bonds = _count_bond_orders(orders)
+
+    num_components = _count_components(indptr, indices)
+
+    # Cycle-space dimension: independent cycles = E - V + C
+    num_cycles = max(num_edges - num_nodes + num_components, 0)
+
+    # Largest ring in the smallest-ring sense (e.g. 6 for naphthalene, not
+    # the 10-atom perimeter). BFS from each non-leaf root labels vertices
+    # with the root neighbour they descend from; a non-tree edge joining two
+    # branches closes a ring of depth[u] + depth[v] + 1 through the root.
+    # Search buffers are shared across roots and reset via `touched`.
+    max_cycle_size = 0
+    girth = 0
+    if num_cycles > 0:
+        depth = [-1] * num_nodes
+        branch = [0] * num_nodes
+        for root in range(num_nodes):
+            if indptr[root + 1] - indptr[root] < 2:  # Leaves cannot lie on a ring
+                continue
+            depth[root] = 0
+            branch[root] = root
+            touched = [root]
+            frontier = [root]
+            best = 0
+            for level in range(RING_SEARCH_DEPTH):
+                next_frontier = []
+                for u in frontier:
+                    for k in range(indptr[u], indptr[u + 1]):
+                        v = indices[k]
+                        if depth[v] < 0:
+                            depth[v] = level + 1
+                            branch[v] = v if u == root else branch[u]
+                            touched.append(v)
+                            next_frontier.append(v)
+                        elif branch[v] != branch[u] and v != root and u != root:
+                            ring = depth[u] + depth[v] + 1
+                            if best == 0 or ring < best:
+                                best = ring
+                # Rings found later can only be at least as large
+                if best or not next_frontier:
+                    break
+                frontier = next_frontier
+            for v in touched:
+                depth[v] = -1
+            if best > max_cycle_size:
+                max_cycle_size = best
+            if best and (girth == 0 or best < girth):
+                girth = best
+        if max_cycle_size == 0:
+            # Every ring lies beyond the search horizon: report the bound
+            max_cycle_size = RING_SIZE_BEYOND_SEARCH
+
+    # Triangles: for each edge u < v, merge the two sorted neighbour lists.
+    # Connected triples: a vertex of degree d centres d(d-1)/2 of them.
+    # Without a 3-ring (girth != 3, true of most molecules) there is nothing
+    # to find, so the merge is skipped and only triples are tallied.
+    has_triangles = girth == 3
+    count_triangles = has_triangles and not clustering_samples
+    closed = 0
+    triples = 0
+    for u in range(num_nodes):
+        a_start, a_end = indptr[u], indptr[u + 1]
+        d = a_end - a_start
+        # A triangle or triple through u needs two neighbours, so leaves
+        # (e.g. terminal H atoms) are skipped outright
+        if d < 2:
+            continue
+        triples += d * (d - 1) // 2
+        if not count_triangles:
+            continue
+        for k in range(a_start, a_end):
+            v = indices[k]
+            if v < u:
+                continue
+            a = a_start
+            b, b_end = indptr[v], indptr[v + 1]
+            if b_end - b < 2:
+                continue
+            while a < a_end and b < b_end:
+                x = indices[a]
+                y = indices[b]
+                if x == y:
+                    closed += 1
+                    a += 1
+                    b += 1
+                elif x < y:
+                    a += 1
+                else:
+                    b += 1
+    triangles = closed // 3  # Every triangle is closed by each of its 3 edges
+
+    if has_triangles and clustering_samples:
+        # Transitivity = 3 * triangles / triples, so invert the estimate
+        transitivity = _sample_transitivity(indptr, indices, clustering_samples)
+        triangles = round(transitivity * triples / 3)
+
+    return (num_components, num_cycles, max_cycle_size, double_bonds,
+            aromatic_bonds, triangles, triples)
+
+
+def _sample_transitivity(indptr: array, indices: array, samples: int, seed: int = 0) -> float:
+    """
+    Estimate transitivity as the closed fraction of uniformly sampled wedges.
 
-        return triangles / max_triangles if max_triangles > 0 else 0.0
+    A wedge (path u-x-y centred on x) is drawn by picking the centre with
+    probability proportional to its d(d-1)/2 wedges and then two distinct
+    neighbours; it is closed if x and y are adjacent (binary search in the
+    sorted CSR neighbour list). The fixed seed keeps features reproducible.
+    """
+    num_nodes = len(indptr) - 1
+    centres = []
+    cum_weights = []
+    total = 0
+    for u in range(num_nodes):
+        d = indptr[u + 1] - indptr[u]
+        if d >= 2:
+            total += d * (d - 1) // 2
+            centres.append(u)
+            cum_weights.append(total)
+    if total == 0 or samples <= 0:
+        return 0.0
+
+    rng = random.Random(seed)
+    closed = 0
+    for u in rng.choices(centres, cum_weights=cum_weights, k=samples):
+        start = indptr[u]
+        d = indptr[u + 1] - start
+        i = rng.randrange(d)
+        j = rng.randrange(d - 1)
+        if j >= i:
+            j += 1
+        x = indices[start + i]
+        y = indices[start + j]
+        lo, hi = indptr[x], indptr[x + 1]
+        k = bisect_left(indices, y, lo, hi)
+        if k < hi and indices[k] == y:
+            closed += 1
+    return closed / samples
+
+
+def _count_bond_orders(orders: array) -> Tuple[int, int]:
+    """Count (double_bonds, aromatic_bonds) among the bond orders."""
+    double_bonds = 0
+    aromatic_bonds = 0
+    for order in orders:
+        if order == 2:
+            double_bonds += 1
+        elif 1 < order < 2:  # Fractional order (aromatic/delocalized)
+            aromatic_bonds += 1
+    return double_bonds, aromatic_bonds
+
+
+def _count_components(indptr: array, indices: array) -> int:
+    """
+    Number of connected components of the CSR graph.
+
+    Large graphs go through scipy.sparse.csgraph when SciPy is available
+    (the CSR buffers are already symmetric and are shared without copying);
+    otherwise components are found by depth-first labelling.
+    """
+    num_nodes = len(indptr) - 1
+
+    if SCIPY_AVAILABLE and num_nodes >= SCIPY_MIN_NODES:
+        matrix = csr_matrix(
+            (np.ones(len(indices), dtype=np.int8),
+             np.frombuffer(indices, dtype=np.intc),
+             np.frombuffer(indptr, dtype=np.intc)),
+            shape=(num_nodes, num_nodes)
+        )
+        num_components, _ = connected_components(matrix, directed=False)
+        return int(num_components)
+
+    component = [-1] * num_nodes
+    num_components = 0
+    for start in range(num_nodes):
+        if component[start] >= 0:
+            continue
+        component[start] = num_components
+        stack = [start]
+        while stack:
+            u = stack.pop()
+            for k in range(indptr[u], indptr[u + 1]):
+                v = indices[k]
+                if component[v] < 0:
+                    component[v] = num_components
+                    stack.append(v)
+        num_components += 1
+    return num_components
@@ -12,12 +12,123 @@ References:
 - Petrucci et al. (2016). General Chemistry: Principles and Modern Applications
 """
 
-from dataclasses import dataclass
-from typing import Dict
+from array import array
+from collections.abc import Mapping
+from dataclasses import dataclass, field, replace
+from enum import IntEnum
+from functools import lru_cache
+from typing import Any, Dict, Optional, Sequence, Tuple, Union
+import math
+
 from src.core.element import Element
+from src.core.element_table import ElementTable
+
+
+# Bond type names, indexed by BondType value
+_BOND_TYPE_NAMES = ("nonpolar_covalent", "polar_covalent", "ionic", "none", "unknown")
+
+
+class BondType(IntEnum):
+    """
+    Bond type as an integer code, as used internally and in batch tables.
+
+    BondPrediction.bond_type and classify_bond_type() keep the string names
+    at the API boundary; use `.label` to convert.
+    """
+    NONPOLAR_COVALENT = 0  # ΔEN < 0.5
+    POLAR_COVALENT = 1  # 0.5 ≤ ΔEN < 1.7
+    IONIC = 2  # ΔEN ≥ 1.7
+    NONE = 3  # noble gas, no bond
+    UNKNOWN = 4  # electronegativity unavailable
+
+    @property
+    def label(self) -> str:
+        """Bond type name, e.g. "polar_covalent"."""
+        return _BOND_TYPE_NAMES[self]
+
+
+# Bond type name -> code, for callers passing strings
+_BOND_TYPE_CODES = {name: BondType(code) for code, name in enumerate(_BOND_TYPE_NAMES)}
+
+# Bond symbols indexed by bond order (order 0: no bond, no symbol)
+_BOND_SYMBOLS = ("", "-", "=", "≡")
+
+# Properties whose confidences make up a bond prediction's
+# confidence_breakdown, in the order of its scores and of the batch
+# breakdown columns
+_BREAKDOWN_KEYS = ("electron_configuration", "electronegativity")
 
 
-@dataclass
+def _stability_row(base: float) -> Tuple[float, float, float, float]:
+    """Default stability by bond order: single preferred, higher orders scaled down."""
+    return (0.5, base, base * 0.90, base * 0.75)
+
+
+# Stability lookup tables for compute_stability_score(). Each row is indexed
+# by bond order 1-3; slot 0 holds the value for any other order.
+#
+# Ionic bonds strongly prefer single bonds, whatever the elements
+_IONIC_STABILITY = (0.20, 0.90, 0.20, 0.20)
+
+# Element-specific bond order preferences (empirical patterns from
+# chemistry), keyed by the canonical pair (lower Z, higher Z); see _pair_key()
+_PAIR_STABILITY: Dict[Tuple[int, int], Tuple[float, float, float, float]] = {
+    (6, 6): (0.5, 0.90, 0.88, 0.85),  # C-C: all orders stable, single slightly preferred
+    (1, 6): (0.10, 0.92, 0.10, 0.10),  # C-H: only single bonds
+    (6, 8): (0.5, 0.85, 0.95, 0.20),  # C-O: double bond preferred (carbonyl)
+    (6, 7): (0.5, 0.88, 0.86, 0.82),  # C-N: all orders reasonably stable
+    (7, 7): (0.5, 0.70, 0.80, 0.95),  # N-N: triple bond preferred (N₂)
+    (8, 8): (0.5, 0.82, 0.92, 0.05),  # O-O: double (O₂) very stable, single (peroxide) too
+    (7, 8): (0.5, 0.82, 0.88, 0.60),  # N-O: double bond common
+}
+
+# Base stability by bond type, indexed by BondType value (0.5 for any
+# other type)
+_BASE_STABILITY = (0.85, 0.85, 0.80, 0.0, 0.0)
+
+# Default rows by bond type (base stability × order factor), precomputed
+# from _BASE_STABILITY so a lookup is a single tuple subscript
+_STABILITY_BY_CODE = tuple(_stability_row(base) for base in _BASE_STABILITY)
+_UNLISTED_TYPE_STABILITY = _stability_row(0.5)
+
+
+def _pair_key(z_a: int, z_b: int) -> Tuple[int, int]:
+    """Order-independent key for an element pair: (lower Z, higher Z)."""
+    return (z_a, z_b) if z_a <= z_b else (z_b, z_a)
+
+
+class _ConfidenceBreakdown(Mapping):
+    """
+    Read-only {property: confidence} mapping over a tuple of scores.
+
+    The property names are a shared module-level tuple, so a prediction's
+    breakdown costs one small tuple instead of a dict. Reads, iteration and
+    comparison behave like the dict it replaces; use dict() for a mutable
+    or JSON-serializable copy.
+    """
+    __slots__ = ("names", "scores")
+
+    def __init__(self, names: Tuple[str, ...], scores: Tuple[float, ...]):
+        self.names = names
+        self.scores = scores
+
+    def __getitem__(self, prop: str) -> float:
+        try:
+            return self.scores[self.names.index(prop)]
+        except ValueError:
+            raise KeyError(prop) from None
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __repr__(self) -> str:
+        return repr(dict(zip(self.names, self.scores)))
+
+
+@dataclass(slots=True, frozen=True)
 class BondPrediction:
     """
     Prediction of bond formation between two elements.
@@ -28,16 +139,46 @@ class BondPrediction:
         bond_order: Bond order (1=single, 2=double, 3=triple)
         stability_score: Estimated stability (0.0 to 1.0, higher = more stable)
         confidence: Overall prediction confidence (0.0 to 1.0)
-        confidence_breakdown: Per-property confidence scores
-        reasoning: Human-readable explanation of the prediction
+        confidence_breakdown: Per-property confidence scores (a read-only
+            mapping for computed predictions; any mapping is accepted)
+        reasoning: Human-readable explanation of the prediction ("" if it
+            was not built; see explain())
+        explain_args: Formatter and arguments that explain() uses to build
+            the reasoning on demand
+
+    Predictions are immutable and slotted, so large caches of them stay small
+    and can be shared safely.
     """
     can_bond: bool
     bond_type: str  # "nonpolar_covalent" | "polar_covalent" | "ionic" | "none"
     bond_order: int  # 1 (single), 2 (double), 3 (triple)
     stability_score: float  # 0.0 to 1.0, higher = more stable
     confidence: float  # Overall prediction confidence (0.0 to 1.0)
-    confidence_breakdown: Dict[str, float]  # Per-property confidence
+    confidence_breakdown: Mapping[str, float]  # Per-property confidence
     reasoning: str  # Human-readable explanation
+    explain_args: Tuple[Any, ...] = field(default=(), repr=False, compare=False)
+
+    def explain(self) -> str:
+        """
+        Human-readable explanation, built now if it was skipped.
+
+        Predictions made with build_reasoning=False keep only the inputs of
+        the explanation, so the formatting cost is paid only by callers
+        that read it. The shared no-bond predictions carry no inputs and
+        return their stored reasoning as-is.
+        """
+        if self.reasoning or not self.explain_args:
+            return self.reasoning
+        formatter, *args = self.explain_args
+        return formatter(*args)
+
+    @property
+    def breakdown(self) -> Tuple[float, ...]:
+        """Per-property confidence scores, in confidence_breakdown order."""
+        scores = self.confidence_breakdown
+        if isinstance(scores, _ConfidenceBreakdown):
+            return scores.scores
+        return tuple(scores.values())
 
     def is_reliable(self, threshold: float = 0.5) -> bool:
         """
@@ -59,16 +200,175 @@ class BondPrediction:
         return self.confidence >= threshold
 
     def __repr__(self) -> str:
-        bond_symbols = {1: "-", 2: "=", 3: "≡"}
+        symbol = _BOND_SYMBOLS[self.bond_order] if 0 <= self.bond_order <= 3 else ""
         return (
             f"BondPrediction(can_bond={self.can_bond}, "
-            f"order={self.bond_order}{bond_symbols.get(self.bond_order, '')}, "
+            f"order={self.bond_order}{symbol}, "
             f"type='{self.bond_type}', "
             f"stability={self.stability_score:.2f}, "
             f"confidence={self.confidence:.2f})"
         )
 
 
+def _valence_reasoning(
+    symbol_a: str,
+    symbol_b: str,
+    valence_a: int,
+    valence_b: int,
+    delta_en: float,
+    bond_type: str,
+    bond_order: int
+) -> str:
+    """Reasoning text of BondingRules.can_bond() for a bondable pair."""
+    return (
+        f"{symbol_a}{_BOND_SYMBOLS[bond_order]}{symbol_b}: "
+        f"ΔEN={delta_en:.2f} → {bond_type}, "
+        f"valence: {symbol_a}({valence_a}) {symbol_b}({valence_b})"
+    )
+
+
+def _order_reasoning(
+    symbol_a: str,
+    symbol_b: str,
+    delta_en: float,
+    bond_type: str,
+    bond_order: int,
+    stability_score: float
+) -> str:
+    """Reasoning text of BondingRules.predict_all_bond_orders() for one order."""
+    return (
+        f"{symbol_a}{_BOND_SYMBOLS[bond_order]}{symbol_b}: "
+        f"ΔEN={delta_en:.2f} → {bond_type}, "
+        f"order={bond_order}, stability={stability_score:.2f}"
+    )
+
+
+# Shared "no bond" predictions for the early exits of BondingRules.can_bond().
+# BondPrediction is frozen, so one instance can be handed to every caller.
+_NOBLE_PREDICTION = BondPrediction(
+    can_bond=False,
+    bond_type="none",
+    bond_order=0,
+    stability_score=1.0,  # Noble gas is "stable" as-is
+    confidence=1.0,
+    confidence_breakdown=_ConfidenceBreakdown(("valence",), (1.0,)),
+    reasoning=""
+)
+
+
+@lru_cache(maxsize=128)
+def _noble_rejection(symbol: str) -> BondPrediction:
+    """_NOBLE_PREDICTION with reasoning naming the noble gas, one per symbol."""
+    return replace(_NOBLE_PREDICTION, reasoning=f"{symbol} is a noble gas (full valence shell)")
+
+
+_UNKNOWN_PREDICTION = BondPrediction(
+    can_bond=None,
+    bond_type="unknown",
+    bond_order=0,
+    stability_score=0.0,
+    confidence=0.0,
+    confidence_breakdown=_ConfidenceBreakdown((), ()),
+    reasoning="Electronegativity data unavailable"
+)
+_UNKNOWN_PREDICTION_NO_REASONING = replace(_UNKNOWN_PREDICTION, reasoning="")
+
+
+@dataclass(slots=True)
+class BondPredictionBatch:
+    """
+    can_bond() results for many pairs, stored column-wise.
+
+    Produced by BondingRules.can_bond_matrix(). Holds the same fields as a
+    list of BondPrediction objects (minus the reasoning text) in flat
+    arrays; indexing materializes a single BondPrediction on demand.
+
+    Attributes:
+        can_bond: 1/0 per pair, -1 where unknown (BondPrediction has None)
+        bond_type: BondType code per pair
+        bond_order: Most likely bond order per pair (0 for no bond)
+        stability: Stability score per pair
+        confidence: Prediction confidence per pair
+        breakdown: Per-property confidence, row-major (pairs, _BREAKDOWN_KEYS);
+            0.0 for NONE (noble gas) and UNKNOWN pairs, whose predictions
+            do not use these properties (check bond_type before reading)
+    """
+    can_bond: array  # 'b'
+    bond_type: array  # 'b'
+    bond_order: array  # 'b'
+    stability: array  # 'd'
+    confidence: array  # 'd'
+    breakdown: array  # 'd', len(self) * len(_BREAKDOWN_KEYS)
+
+    def __len__(self) -> int:
+        return len(self.bond_type)
+
+    def __getitem__(self, k: int) -> BondPrediction:
+        """BondPrediction for pair k, equal to can_bond(..., build_reasoning=False)."""
+        code = self.bond_type[k]
+        if code == BondType.NONE:
+            return _NOBLE_PREDICTION
+        if code == BondType.UNKNOWN:
+            return _UNKNOWN_PREDICTION_NO_REASONING
+
+        width = len(_BREAKDOWN_KEYS)
+        scores = tuple(self.breakdown[k * width:(k + 1) * width])
+        return BondPrediction(
+            can_bond=bool(self.can_bond[k]),
+            bond_type=_BOND_TYPE_NAMES[code],
+            bond_order=self.bond_order[k],
+            stability_score=self.stability[k],
+            confidence=self.confidence[k],
+            confidence_breakdown=_ConfidenceBreakdown(_BREAKDOWN_KEYS, scores),
+            reasoning=""
+        )
+
+
+@dataclass(slots=True)
+class BondOrderTable:
+    """
+    Bond predictions for every ordered pair of a list of elements.
+
+    Produced by BondingRules.batch_predict_all(). Entries are stored in flat
+    arrays instead of BondPrediction objects: pair (i, j) lives at
+    k = i * n + j, and bond order o (1-3) of that pair at 3 * k + o - 1.
+
+    Attributes:
+        atomic_numbers: Z of each element, in input order
+        bond_type: BondType code per pair
+        max_order: Highest valence-valid bond order per pair (0 if none)
+        can_bond: 1 if the pair can bond at that order, else 0
+        stability: Stability score per pair and order (NaN above max_order)
+        confidence: Prediction confidence per pair
+    """
+    atomic_numbers: Tuple[int, ...]
+    bond_type: array  # 'b', n * n
+    max_order: array  # 'b', n * n
+    can_bond: array  # 'b', n * n * 3
+    stability: array  # 'd', n * n * 3
+    confidence: array  # 'd', n * n
+
+    def index(self, i: int, j: int) -> int:
+        """Flat pair index of elements i and j (positions in the input list)."""
+        return i * len(self.atomic_numbers) + j
+
+    def bond_type_name(self, i: int, j: int) -> str:
+        """Bond type of pair (i, j) as returned by BondingRules.classify_bond_type."""
+        return _BOND_TYPE_NAMES[self.bond_type[self.index(i, j)]]
+
+    def bond_orders(self, i: int, j: int) -> range:
+        """Valence-valid bond orders of pair (i, j), as in predict_all_bond_orders."""
+        return range(1, self.max_order[self.index(i, j)] + 1)
+
+    def can_bond_at(self, i: int, j: int, bond_order: int) -> bool:
+        """Whether pair (i, j) satisfies the octet rule at this bond order."""
+        return bool(self.can_bond[3 * self.index(i, j) + bond_order - 1])
+
+    def stability_at(self, i: int, j: int, bond_order: int) -> float:
+        """Stability score of pair (i, j) at this bond order."""
+        return self.stability[3 * self.index(i, j) + bond_order - 1]
+
+
 class BondingRules:
     """
     Stateless bonding prediction using Level 0 element properties.
@@ -111,7 +411,11 @@ class BondingRules:
     """
 
     @staticmethod
-    def can_bond(elem_a: Element, elem_b: Element) -> BondPrediction:
+    def can_bond(
+        elem_a: Element,
+        elem_b: Element,
+        build_reasoning: bool = True
+    ) -> BondPrediction:
         """
         Predict if two elements can form a stable bond.
 
@@ -125,6 +429,8 @@ class BondingRules:
         Args:
             elem_a: First element (from ElementGenerator)
             elem_b: Second element (from ElementGenerator)
+            build_reasoning: Format the `reasoning` string; pass False for bulk
+                             queries that never read it (reasoning is then "")
 
         Returns:
             BondPrediction with confidence score
@@ -147,67 +453,32 @@ class BondingRules:
             >>> bond.bond_type
             'none'
         """
-        # Step 1: Check if noble gases (don't bond)
-        if BondingRules.is_noble_gas(elem_a):
-            return BondPrediction(
-                can_bond=False,
-                bond_type="none",
-                bond_order=0,
-                stability_score=1.0,  # Noble gas is "stable" as-is
-                confidence=1.0,
-                confidence_breakdown={"valence": 1.0},
-                reasoning=f"{elem_a.symbol} is a noble gas (full valence shell)"
-            )
+        # Step 1: Check if noble gases (don't bond). The prediction only
+        # depends on which gas is named in the reasoning, so it is shared
+        if _is_noble(elem_a.atomic_number, elem_a.valence_electrons):
+            return _noble_rejection(elem_a.symbol) if build_reasoning else _NOBLE_PREDICTION
 
-        if BondingRules.is_noble_gas(elem_b):
-            return BondPrediction(
-                can_bond=False,
-                bond_type="none",
-                bond_order=0,
-                stability_score=1.0,
-                confidence=1.0,
-                confidence_breakdown={"valence": 1.0},
-                reasoning=f"{elem_b.symbol} is a noble gas (full valence shell)"
-            )
+        if _is_noble(elem_b.atomic_number, elem_b.valence_electrons):
+            return _noble_rejection(elem_b.symbol) if build_reasoning else _NOBLE_PREDICTION
 
         # Step 2: Check if electronegativity is available
         if elem_a.electronegativity is None or elem_b.electronegativity is None:
             # Cannot predict without electronegativity
-            return BondPrediction(
-                can_bond=None,
-                bond_type="unknown",
-                bond_order=0,
-                stability_score=0.0,
-                confidence=0.0,
-                confidence_breakdown={},
-                reasoning="Electronegativity data unavailable"
-            )
-
-        # Step 3: Determine most likely bond order
-        bond_order = BondingRules.predict_bond_order(elem_a, elem_b)
-
-        # Step 4: Classify bond type
-        bond_type = BondingRules.classify_bond_type(elem_a, elem_b)
-        delta_en = abs(elem_a.electronegativity - elem_b.electronegativity)
-
-        # Step 5: Check valence compatibility
-        can_form_bond = BondingRules.satisfies_octet(elem_a, elem_b)
+            return _UNKNOWN_PREDICTION if build_reasoning else _UNKNOWN_PREDICTION_NO_REASONING
 
-        # Step 6: Compute stability score
-        stability_score = BondingRules.compute_stability_score(
-            elem_a, elem_b, bond_order, bond_type
-        )
+        # Steps 3-6: bond order, bond type, valence compatibility and
+        # stability, computed on plain scalars by the numeric core
+        can_form_bond, type_code, bond_order, stability_score, delta_en = _element_bond_core(elem_a, elem_b)
+        bond_type = _BOND_TYPE_NAMES[type_code]
 
         # Step 7: Compute confidence (minimum rule)
-        confidence, breakdown = BondingRules._compute_confidence(elem_a, elem_b)
-
-        # Step 8: Generate reasoning
-        bond_symbols = {1: "-", 2: "=", 3: "≡"}
-        reasoning = (
-            f"{elem_a.symbol}{bond_symbols.get(bond_order, '?')}{elem_b.symbol}: "
-            f"ΔEN={delta_en:.2f} → {bond_type}, "
-            f"valence: {elem_a.symbol}({elem_a.valence_electrons}) "
-            f"{elem_b.symbol}({elem_b.valence_electrons})"
+        confidence, breakdown = _pair_confidence(elem_a, elem_b)
+
+        # Step 8: Generate reasoning (or keep its inputs for explain())
+        explain_args = (
+            _valence_reasoning, elem_a.symbol, elem_b.symbol,
+            elem_a.valence_electrons, elem_b.valence_electrons,
+            delta_en, bond_type, bond_order
         )
 
         return BondPrediction(
@@ -217,11 +488,16 @@ class BondingRules:
             stability_score=stability_score,
             confidence=confidence,
             confidence_breakdown=breakdown,
-            reasoning=reasoning
+            reasoning=_valence_reasoning(*explain_args[1:]) if build_reasoning else "",
+            explain_args=() if build_reasoning else explain_args
         )
 
     @staticmethod
-    def predict_all_bond_orders(elem_a: Element, elem_b: Element) -> list[BondPrediction]:
+    def predict_all_bond_orders(
+        elem_a: Element,
+        elem_b: Element,
+        build_reasoning: bool = True
+    ) -> list[BondPrediction]:
         """
         Generate ALL possible bond orders for two elements (systematic enumeration).
 
@@ -231,6 +507,8 @@ class BondingRules:
         Args:
             elem_a: First element
             elem_b: Second element
+            build_reasoning: Format each `reasoning` string; pass False when
+                             filling caches (reasoning is then "")
 
         Returns:
             List of BondPrediction objects, one for each valid bond order
@@ -252,14 +530,15 @@ class BondingRules:
         predictions = []
 
         # Check for noble gases
-        if BondingRules.is_noble_gas(elem_a) or BondingRules.is_noble_gas(elem_b):
+        if (_is_noble(elem_a.atomic_number, elem_a.valence_electrons)
+                or _is_noble(elem_b.atomic_number, elem_b.valence_electrons)):
             # Noble gases don't bond - return single "no bond" prediction
-            return [BondingRules.can_bond(elem_a, elem_b)]
+            return [BondingRules.can_bond(elem_a, elem_b, build_reasoning)]
 
         # Check for electronegativity availability
         if elem_a.electronegativity is None or elem_b.electronegativity is None:
             # Can't predict - return single "unknown" prediction
-            return [BondingRules.can_bond(elem_a, elem_b)]
+            return [BondingRules.can_bond(elem_a, elem_b, build_reasoning)]
 
         # Determine maximum possible bond order based on valence
         max_order = min(elem_a.valence_electrons, elem_b.valence_electrons, 3)
@@ -273,28 +552,29 @@ class BondingRules:
         if elem_a.atomic_number == 8 and elem_b.atomic_number == 8:
             max_order = min(max_order, 2)
 
-        # Generate predictions for all valid bond orders
-        bond_type = BondingRules.classify_bond_type(elem_a, elem_b)
+        # Generate predictions for all valid bond orders. Everything that
+        # doesn't depend on the order is computed once, with module-level
+        # helpers rather than BondingRules lookups
+        type_code = _classify_bond_type_code(elem_a.electronegativity, elem_b.electronegativity)
+        bond_type = _BOND_TYPE_NAMES[type_code]
         delta_en = abs(elem_a.electronegativity - elem_b.electronegativity)
-        confidence, breakdown = BondingRules._compute_confidence(elem_a, elem_b)
+        confidence, breakdown = _pair_confidence(elem_a, elem_b)
+        stability_row = _stability_row_for(elem_a.atomic_number, elem_b.atomic_number, type_code)
 
         for bond_order in range(1, max_order + 1):
             # Check if this bond order satisfies valence requirements
-            can_form_bond = BondingRules.satisfies_octet_with_order(
-                elem_a, elem_b, bond_order
+            can_form_bond = _octet_with_order(
+                elem_a.atomic_number, elem_b.atomic_number,
+                elem_a.valence_electrons, elem_b.valence_electrons, bond_order
             )
 
-            # Compute stability score for this specific bond order
-            stability_score = BondingRules.compute_stability_score(
-                elem_a, elem_b, bond_order, bond_type
-            )
+            # Stability score for this specific bond order
+            stability_score = stability_row[bond_order]
 
-            # Generate reasoning
-            bond_symbols = {1: "-", 2: "=", 3: "≡"}
-            reasoning = (
-                f"{elem_a.symbol}{bond_symbols.get(bond_order, '?')}{elem_b.symbol}: "
-                f"ΔEN={delta_en:.2f} → {bond_type}, "
-                f"order={bond_order}, stability={stability_score:.2f}"
+            # Generate reasoning (or keep its inputs for explain())
+            explain_args = (
+                _order_reasoning, elem_a.symbol, elem_b.symbol,
+                delta_en, bond_type, bond_order, stability_score
             )
 
             predictions.append(BondPrediction(
@@ -304,11 +584,349 @@ class BondingRules:
                 stability_score=stability_score,
                 confidence=confidence,
                 confidence_breakdown=breakdown,
-                reasoning=reasoning
+                reasoning=_order_reasoning(*explain_args[1:]) if build_reasoning else "",
+                explain_args=() if build_reasoning else explain_args
             ))
 
         return predictions
 
+    @staticmethod
+    def batch_predict_all(elements: Sequence[Element]) -> BondOrderTable:
+        """
+        Enumerate bond orders for every ordered pair of elements at once.
+
+        Equivalent to calling predict_all_bond_orders() on each pair, but the
+        per-element quantities (electronegativity, valence, octet target,
+        noble-gas flag, confidences) are read once up front and the results
+        land in flat arrays rather than n² lists of BondPrediction objects.
+        Use this to build the comprehensive pair cache.
+
+        Args:
+            elements: Elements to pair up (both axes of the table)
+
+        Returns:
+            BondOrderTable indexed by positions in `elements`
+
+        Examples:
+            >>> table = BondingRules.batch_predict_all([c, o])
+            >>> list(table.bond_orders(0, 1))  # C-O, C=O, C≡O
+            [1, 2, 3]
+            >>> table.bond_type_name(0, 1)
+            'polar_covalent'
+        """
+        n = len(elements)
+        atomic_numbers = [e.atomic_number for e in elements]
+        electronegativity = [e.electronegativity for e in elements]
+        valence = [e.valence_electrons for e in elements]
+        noble = [_is_noble(z, v) for z, v in zip(atomic_numbers, valence)]
+
+        # Octet terms of satisfies_octet_with_order(), per element: whether
+        # it still needs electrons, and the highest order its shell allows
+        target = [2 if z <= 2 else 8 for z in atomic_numbers]
+        needs = [t > v for t, v in zip(target, valence)]
+        room = [t + 2 - v for t, v in zip(target, valence)]
+
+        bond_type = array('b', bytes(n * n))
+        max_order = array('b', bytes(n * n))
+        can_bond = array('b', bytes(3 * n * n))
+        stability = array('d', [math.nan]) * (3 * n * n)
+        confidence = BondingRules.batch_confidence(elements)
+
+        # Every quantity is symmetric in the pair, so only the upper
+        # triangle (j >= i) is computed; the lower one is mirrored below
+        for i in range(n):
+            # Row invariants; each row only writes its own slots
+            if noble[i]:
+                for k in range(i * n + i, i * n + n):
+                    bond_type[k] = BondType.NONE
+                    confidence[k] = 1.0
+                continue
+            z_i = atomic_numbers[i]
+            en_i = electronegativity[i]
+            valence_i = valence[i]
+            needs_i = needs[i]
+            room_i = room[i]
+
+            for j in range(i, n):
+                k = i * n + j
+
+                # Noble gases don't bond; missing EN makes the pair unknown
+                if noble[j]:
+                    bond_type[k] = BondType.NONE
+                    confidence[k] = 1.0
+                    continue
+                en_j = electronegativity[j]
+                if en_i is None or en_j is None:
+                    bond_type[k] = BondType.UNKNOWN
+                    confidence[k] = 0.0
+                    continue
+
+                code = _classify_bond_type_code(en_i, en_j)
+                bond_type[k] = code
+
+                # Same overrides as predict_all_bond_orders
+                z_j = atomic_numbers[j]
+                if z_i == 1 or z_j == 1:
+                    top = 1
+                else:
+                    top = min(valence_i, valence[j], 3)
+                    if z_i == 8 and z_j == 8:
+                        top = min(top, 2)
+                if top <= 0:
+                    continue
+                max_order[k] = top
+
+                # Stability row, as in compute_stability_score()
+                row = _stability_row_for(z_i, z_j, code)
+
+                both_need = needs_i and needs[j]
+                limit = room_i if room_i < room[j] else room[j]
+                for order in range(1, top + 1):
+                    slot = 3 * k + order - 1
+                    can_bond[slot] = both_need and order <= limit
+                    stability[slot] = row[order]
+
+        # Mirror: row i, columns j < i come from column i of rows j < i
+        for i in range(1, n):
+            row = i * n
+            bond_type[row:row + i] = bond_type[i:row:n]
+            max_order[row:row + i] = max_order[i:row:n]
+            confidence[row:row + i] = confidence[i:row:n]
+            for slot in range(3):
+                can_bond[3 * row + slot:3 * (row + i):3] = can_bond[3 * i + slot:3 * row:3 * n]
+                stability[3 * row + slot:3 * (row + i):3] = stability[3 * i + slot:3 * row:3 * n]
+
+        return BondOrderTable(
+            atomic_numbers=tuple(atomic_numbers),
+            bond_type=bond_type,
+            max_order=max_order,
+            can_bond=can_bond,
+            stability=stability,
+            confidence=confidence
+        )
+
+    @staticmethod
+    def can_bond_batch(
+        z_a: Sequence[int],
+        z_b: Sequence[int],
+        valence_a: Sequence[int],
+        valence_b: Sequence[int],
+        en_a: Sequence[Optional[float]],
+        en_b: Sequence[Optional[float]],
+        conf_a: Sequence[float],
+        conf_b: Sequence[float]
+    ) -> Tuple[array, array, array]:
+        """
+        can_bond() for many atom pairs given as parallel columns.
+
+        Pair k is (z_a[k], z_b[k]) with the matching valence, electronegativity
+        and confidence entries. Columns can come straight from an ElementTable,
+        so no Element objects or BondPrediction instances are involved; use
+        can_bond() when the reasoning string is needed.
+
+        Args:
+            z_a, z_b: Atomic numbers
+            valence_a, valence_b: Valence electron counts
+            en_a, en_b: Electronegativities (None or NaN where unknown)
+            conf_a, conf_b: Per-atom confidence floor, i.e. the minimum of the
+                atom's _BREAKDOWN_KEYS confidences
+
+        Returns:
+            (can_bond, bond_type, confidence): can_bond is array('b') with
+            1/0, or -1 where the answer is unknown (can_bond() gives None);
+            bond_type is array('b') of BondType codes; confidence is
+            array('d')
+
+        Raises:
+            ValueError: If the columns differ in length
+        """
+        n = len(z_a)
+        columns = (z_b, valence_a, valence_b, en_a, en_b, conf_a, conf_b)
+        if any(len(column) != n for column in columns):
+            raise ValueError("All columns must have the same length")
+
+        can_bond = array('b', bytes(n))
+        bond_type = array('b', bytes(n))
+        confidence = array('d', bytes(8 * n))
+
+        for k in range(n):
+            za, zb = z_a[k], z_b[k]
+            va, vb = valence_a[k], valence_b[k]
+
+            # Noble gases don't bond
+            if _is_noble(za, va) or _is_noble(zb, vb):
+                bond_type[k] = BondType.NONE
+                confidence[k] = 1.0
+                continue
+
+            ea, eb = en_a[k], en_b[k]
+            if ea is None or eb is None or ea != ea or eb != eb:
+                can_bond[k] = -1
+                bond_type[k] = BondType.UNKNOWN
+                continue
+
+            if za > zb:
+                za, zb, va, vb, ea, eb = zb, za, vb, va, eb, ea
+            result = _bond_core(za, zb, va, vb, ea, eb)
+            can_bond[k] = result[0]
+            bond_type[k] = result[1]
+            ca, cb = conf_a[k], conf_b[k]
+            confidence[k] = cb if cb < ca else ca
+
+        return can_bond, bond_type, confidence
+
+    @staticmethod
+    def can_bond_matrix(elements: Union[Sequence[Element], ElementTable]) -> BondPredictionBatch:
+        """
+        can_bond() for every ordered pair of elements, as one columnar batch.
+
+        Pair (i, j) lives at k = i * n + j; `batch[k]` gives the same
+        BondPrediction as can_bond(elements[i], elements[j],
+        build_reasoning=False). Per-element values are read once up front.
+
+        Args:
+            elements: Elements to pair up (both axes), as Element objects or
+                      an ElementTable (read column-wise, no Element objects
+                      needed)
+
+        Returns:
+            BondPredictionBatch of n * n pairs
+        """
+        n = len(elements)
+        width = len(_BREAKDOWN_KEYS)
+        atomic_numbers, valence, electronegativity, scores = _element_columns(elements)
+        noble = [_is_noble(z, v) for z, v in zip(atomic_numbers, valence)]
+
+        can_bond = array('b', bytes(n * n))
+        bond_type = array('b', bytes(n * n))
+        bond_order = array('b', bytes(n * n))
+        stability = array('d', bytes(8 * n * n))
+        confidence = array('d', bytes(8 * n * n))
+        breakdown = array('d', bytes(8 * n * n * width))
+
+        # Every field is symmetric in the pair, so only the upper triangle
+        # (j >= i) is computed; the lower one is mirrored below
+        for i in range(n):
+            z_i, valence_i, en_i, scores_i = (
+                atomic_numbers[i], valence[i], electronegativity[i], scores[i]
+            )
+            for j in range(i, n):
+                k = i * n + j
+
+                if noble[i] or noble[j]:
+                    bond_type[k] = BondType.NONE
+                    stability[k] = confidence[k] = 1.0
+                    continue
+                en_j = electronegativity[j]
+                if en_i is None or en_j is None:
+                    can_bond[k] = -1
+                    bond_type[k] = BondType.UNKNOWN
+                    continue
+
+                if z_i <= atomic_numbers[j]:
+                    result = _bond_core(z_i, atomic_numbers[j], valence_i, valence[j], en_i, en_j)
+                else:
+                    result = _bond_core(atomic_numbers[j], z_i, valence[j], valence_i, en_j, en_i)
+                can_bond[k], bond_type[k], bond_order[k], stability[k] = result[:4]
+
+                # Minimum rule, as in _pair_confidence()
+                overall = 1.0
+                for p, (a, b) in enumerate(zip(scores_i, scores[j])):
+                    low = b if b < a else a
+                    breakdown[k * width + p] = low
+                    if p == 0 or low < overall:
+                        overall = low
+                confidence[k] = overall
+
+        # Mirror: row i, columns j < i come from column i of rows j < i
+        for i in range(1, n):
+            row = i * n
+            can_bond[row:row + i] = can_bond[i:row:n]
+            bond_type[row:row + i] = bond_type[i:row:n]
+            bond_order[row:row + i] = bond_order[i:row:n]
+            stability[row:row + i] = stability[i:row:n]
+            confidence[row:row + i] = confidence[i:row:n]
+            for p in range(width):
+                breakdown[width * row + p:width * (row + i):width] = (
+                    breakdown[width * i + p:width * row:width * n]
+                )
+
+        return BondPredictionBatch(
+            can_bond=can_bond,
+            bond_type=bond_type,
+            bond_order=bond_order,
+            stability=stability,
+            confidence=confidence,
+            breakdown=breakdown
+        )
+
+    @staticmethod
+    def batch_confidence(elements: Sequence[Element]) -> array:
+        """
+        Bond confidence for every ordered pair of elements at once.
+
+        Same minimum rule as _compute_confidence(). Because a minimum over
+        properties and atoms can be taken in either order, each element is
+        first reduced to its own minimum over _BREAKDOWN_KEYS; a pair's
+        confidence is then the smaller of its two element minimums, so
+        the n² part is a single compare per pair.
+
+        Args:
+            elements: Elements to pair up (both axes of the matrix)
+
+        Returns:
+            Flat row-major (n, n) array('d'): pair (i, j) at i * n + j
+        """
+        floor = [
+            min(elem.confidence.get(prop, 0.0) for prop in _BREAKDOWN_KEYS)
+            for elem in elements
+        ]
+
+        confidence = array('d')
+        for c_i in floor:
+            confidence.extend([c_j if c_j < c_i else c_i for c_j in floor])
+        return confidence
+
+    @staticmethod
+    def batch_classify(
+        en_a: Sequence[Optional[float]],
+        en_b: Sequence[Optional[float]]
+    ) -> array:
+        """
+        Classify many bonds at once from parallel electronegativity columns.
+
+        Takes plain columns rather than Element objects, e.g. gathered from
+        ElementTable.electronegativity, so a scan over many atom pairs never
+        touches per-Element attributes.
+
+        Args:
+            en_a: Electronegativity of the first atom of each pair
+            en_b: Electronegativity of the second atom (same length)
+
+        Returns:
+            array('b') of BondType codes;
+            4 ("unknown") where either value is None or NaN
+
+        Examples:
+            >>> codes = BondingRules.batch_classify([2.55, 0.93], [3.44, 3.16])
+            >>> [_BOND_TYPE_NAMES[c] for c in codes]
+            ['polar_covalent', 'ionic']
+        """
+        if len(en_a) != len(en_b):
+            raise ValueError(
+                f"Column lengths differ: {len(en_a)} vs {len(en_b)}"
+            )
+
+        codes = array('b', bytes(len(en_a)))
+        for k, (x, y) in enumerate(zip(en_a, en_b)):
+            # x != x is the NaN test (ElementTable stores missing EN as NaN)
+            if x is None or y is None or x != x or y != y:
+                codes[k] = BondType.UNKNOWN
+            else:
+                delta_en = abs(x - y)
+                codes[k] = (delta_en >= 0.5) + (delta_en >= 1.7)
+        return codes
+
     @staticmethod
     def predict_bond_order(elem_a: Element, elem_b: Element) -> int:
         """
@@ -338,28 +956,26 @@ class BondingRules:
             >>> BondingRules.predict_bond_order(c, o)
             2  # C=O double bond (carbonyl) is most common
         """
-        # Default to single bond
-        default_order = 1
-
         # H can only form single bonds
         if elem_a.atomic_number == 1 or elem_b.atomic_number == 1:
             return 1
 
-        # Get all possible bond orders and return the most stable one
-        all_bonds = BondingRules.predict_all_bond_orders(elem_a, elem_b)
-        if not all_bonds:
-            return default_order
+        # Noble gases / missing EN: the single "no bond" prediction has order 0
+        if (_is_noble(elem_a.atomic_number, elem_a.valence_electrons)
+                or _is_noble(elem_b.atomic_number, elem_b.valence_electrons)
+                or elem_a.electronegativity is None or elem_b.electronegativity is None):
+            return 0
 
-        # Return bond order with highest stability score
-        most_stable = max(all_bonds, key=lambda b: b.stability_score)
-        return most_stable.bond_order
+        # Most stable valid order, straight from the stability table (no
+        # BondPrediction objects); defaults to a single bond
+        return _element_bond_core(elem_a, elem_b)[2]
 
     @staticmethod
     def compute_stability_score(
         elem_a: Element,
         elem_b: Element,
         bond_order: int,
-        bond_type: str
+        bond_type: Union[BondType, str]
     ) -> float:
         """
         Compute stability score for a specific bond configuration.
@@ -376,7 +992,8 @@ class BondingRules:
             elem_a: First element
             elem_b: Second element
             bond_order: Bond order (1, 2, or 3)
-            bond_type: Bond type ("nonpolar_covalent", "polar_covalent", "ionic")
+            bond_type: BondType code, or its name ("nonpolar_covalent",
+                "polar_covalent", "ionic")
 
         Returns:
             Stability score (0.0 to 1.0)
@@ -391,62 +1008,11 @@ class BondingRules:
             >>> score > 0.90
             True
         """
-        # Base stability by bond type
-        base_stability = {
-            "nonpolar_covalent": 0.85,
-            "polar_covalent": 0.85,
-            "ionic": 0.80,
-            "none": 0.0,
-            "unknown": 0.0
-        }.get(bond_type, 0.5)
-
-        # Ionic bonds strongly prefer single bonds
-        if bond_type == "ionic":
-            if bond_order == 1:
-                return 0.90
-            else:
-                return 0.20  # Double/triple ionic bonds are rare
-
-        # Element-specific bond order preferences
-        # These are empirical patterns from chemistry
-
-        # C-C bonds: all orders are stable, single slightly preferred
-        if elem_a.atomic_number == 6 and elem_b.atomic_number == 6:
-            return {1: 0.90, 2: 0.88, 3: 0.85}.get(bond_order, 0.5)
-
-        # C-H bonds: only single bonds
-        if {elem_a.atomic_number, elem_b.atomic_number} == {1, 6}:
-            return 0.92 if bond_order == 1 else 0.10
+        if isinstance(bond_type, str):
+            bond_type = _BOND_TYPE_CODES.get(bond_type, -1)
 
-        # C-O bonds: double bond preferred (carbonyl)
-        if {elem_a.atomic_number, elem_b.atomic_number} == {6, 8}:
-            return {1: 0.85, 2: 0.95, 3: 0.20}.get(bond_order, 0.5)
-
-        # C-N bonds: all orders reasonably stable
-        if {elem_a.atomic_number, elem_b.atomic_number} == {6, 7}:
-            return {1: 0.88, 2: 0.86, 3: 0.82}.get(bond_order, 0.5)
-
-        # N-N bonds: triple bond preferred (N₂)
-        if elem_a.atomic_number == 7 and elem_b.atomic_number == 7:
-            return {1: 0.70, 2: 0.80, 3: 0.95}.get(bond_order, 0.5)
-
-        # O-O bonds: double bond (O₂) very stable, single (peroxide) also stable
-        if elem_a.atomic_number == 8 and elem_b.atomic_number == 8:
-            return {1: 0.82, 2: 0.92, 3: 0.05}.get(bond_order, 0.5)
-
-        # N-O bonds: double bond common
-        if {elem_a.atomic_number, elem_b.atomic_number} == {7, 8}:
-            return {1: 0.82, 2: 0.88, 3: 0.60}.get(bond_order, 0.5)
-
-        # Default: single bonds slightly preferred, higher orders possible but less stable
-        if bond_order == 1:
-            return base_stability
-        elif bond_order == 2:
-            return base_stability * 0.90
-        elif bond_order == 3:
-            return base_stability * 0.75
-        else:
-            return 0.5
+        row = _stability_row_for(elem_a.atomic_number, elem_b.atomic_number, bond_type)
+        return row[bond_order] if 1 <= bond_order <= 3 else row[0]
 
     @staticmethod
     def satisfies_octet_with_order(
@@ -477,24 +1043,10 @@ class BondingRules:
             >>> BondingRules.satisfies_octet_with_order(H, H, 1)
             True
         """
-        # Determine target electrons (2 for H/He, 8 for others)
-        target_a = 2 if elem_a.atomic_number <= 2 else 8
-        target_b = 2 if elem_b.atomic_number <= 2 else 8
-
-        # Electrons needed before bonding
-        needs_a = target_a - elem_a.valence_electrons
-        needs_b = target_b - elem_b.valence_electrons
-
-        # After forming bond of given order:
-        # Each atom gains 'bond_order' electrons from sharing
-        after_bond_a = elem_a.valence_electrons + bond_order
-        after_bond_b = elem_b.valence_electrons + bond_order
-
-        # Check if both atoms reach their targets (or get closer)
-        # Allow some flexibility: atoms might not reach exact octet
-        return (needs_a > 0 and needs_b > 0 and
-                after_bond_a <= target_a + 2 and
-                after_bond_b <= target_b + 2)
+        return _octet_with_order(
+            elem_a.atomic_number, elem_b.atomic_number,
+            elem_a.valence_electrons, elem_b.valence_electrons, bond_order
+        )
 
     @staticmethod
     def is_noble_gas(elem: Element) -> bool:
@@ -522,9 +1074,7 @@ class BondingRules:
             >>> BondingRules.is_noble_gas(c)
             False
         """
-        # Noble gases: 2 valence (He) or 8 valence (others)
-        return (elem.valence_electrons == 2 and elem.atomic_number <= 2) or \
-               (elem.valence_electrons == 8)
+        return _is_noble(elem.atomic_number, elem.valence_electrons)
 
     @staticmethod
     def classify_bond_type(elem_a: Element, elem_b: Element) -> str:
@@ -542,6 +1092,7 @@ class BondingRules:
 
         Returns:
             Bond type: "nonpolar_covalent", "polar_covalent", or "ionic"
+            ("unknown" if either electronegativity is missing)
 
         Physical note:
             Thresholds are approximate. Real bonds exist on a continuum
@@ -567,14 +1118,9 @@ class BondingRules:
             >>> BondingRules.classify_bond_type(na, cl)
             'ionic'
         """
-        delta_en = abs(elem_a.electronegativity - elem_b.electronegativity)
-
-        if delta_en < 0.5:
-            return "nonpolar_covalent"
-        elif delta_en < 1.7:
-            return "polar_covalent"
-        else:
-            return "ionic"
+        return _BOND_TYPE_NAMES[
+            _classify_bond_type_code(elem_a.electronegativity, elem_b.electronegativity)
+        ]
 
     @staticmethod
     def satisfies_octet(elem_a: Element, elem_b: Element) -> bool:
@@ -612,20 +1158,14 @@ class BondingRules:
             >>> BondingRules.satisfies_octet(he, he)
             False
         """
-        # Determine target electrons (2 for H/He, 8 for others)
-        target_a = 2 if elem_a.atomic_number <= 2 else 8
-        target_b = 2 if elem_b.atomic_number <= 2 else 8
-
-        # How many electrons does each need?
-        needs_a = target_a - elem_a.valence_electrons
-        needs_b = target_b - elem_b.valence_electrons
-
-        # Both atoms should have room (positive need)
-        # If either is already satisfied (need ≤ 0), bonding unlikely
-        return needs_a > 0 and needs_b > 0
+        # Both atoms should have room below their target electron count
+        # (2 for H/He, 8 for others); if either is already satisfied,
+        # bonding is unlikely
+        return (elem_a.valence_electrons < (2 if elem_a.atomic_number <= 2 else 8) and
+                elem_b.valence_electrons < (2 if elem_b.atomic_number <= 2 else 8))
 
     @staticmethod
-    def _compute_confidence(elem_a: Element, elem_b: Element) -> tuple[float, Dict[str, float]]:
+    def _compute_confidence(elem_a: Element, elem_b: Element) -> Tuple[float, Tuple[float, ...]]:
         """
         Compute bond prediction confidence using minimum rule.
 
@@ -660,16 +1200,176 @@ class BondingRules:
             >>> conf
             0.85
         """
-        properties_used = ["electron_configuration", "electronegativity"]
+        return _pair_confidence(elem_a, elem_b)
+
+
+def _element_columns(elements: Union[Sequence[Element], ElementTable]) -> Tuple[list, list, list, list]:
+    """
+    Per-element inputs of the bond rules, as parallel lists.
+
+    Returns:
+        (atomic numbers, valence electrons, electronegativities with None
+        where unknown, per-element _BREAKDOWN_KEYS score tuples with 0.0
+        where missing)
+    """
+    if isinstance(elements, ElementTable):
+        missing = [math.nan] * len(elements)
+        score_columns = [
+            elements.confidence_column(prop) if prop in elements.property_names else missing
+            for prop in _BREAKDOWN_KEYS
+        ]
+        return (
+            list(elements.atomic_number),
+            list(elements.valence_electrons),
+            [None if math.isnan(en) else en for en in elements.electronegativity],
+            [tuple(0.0 if math.isnan(c) else c for c in row) for row in zip(*score_columns)]
+        )
+
+    return (
+        [e.atomic_number for e in elements],
+        [e.valence_electrons for e in elements],
+        [e.electronegativity for e in elements],
+        [tuple(e.confidence.get(prop, 0.0) for prop in _BREAKDOWN_KEYS) for e in elements]
+    )
+
+
+def _pair_confidence(elem_a: Element, elem_b: Element) -> Tuple[float, Tuple[float, ...]]:
+    """
+    Minimum-rule confidence of a pair (see BondingRules._compute_confidence).
+
+    Returns:
+        (overall_confidence, confidence_breakdown)
+    """
+    conf_a = elem_a.confidence
+    conf_b = elem_b.confidence
+
+    # For each property, take minimum of (A, B) - plain scalar compares,
+    # in _BREAKDOWN_KEYS order
+    cfg_a = conf_a.get("electron_configuration", 0.0)
+    cfg_b = conf_b.get("electron_configuration", 0.0)
+    en_a = conf_a.get("electronegativity", 0.0)
+    en_b = conf_b.get("electronegativity", 0.0)
+    cfg = cfg_b if cfg_b < cfg_a else cfg_a
+    en = en_b if en_b < en_a else en_a
+
+    # Overall confidence is minimum across all properties
+    overall = en if en < cfg else cfg
+
+    return overall, _ConfidenceBreakdown(_BREAKDOWN_KEYS, (cfg, en))
+
+
+def _stability_row_for(z_a: int, z_b: int, type_code: int) -> Tuple[float, float, float, float]:
+    """
+    Stability row (indexed by bond order, see _stability_row) for a pair.
+
+    Ionic bonds use _IONIC_STABILITY whatever the elements; otherwise an
+    element-specific row from _PAIR_STABILITY wins over the bond-type default.
+    """
+    if type_code == BondType.IONIC:
+        return _IONIC_STABILITY
+    return (_PAIR_STABILITY.get(_pair_key(z_a, z_b))
+            or (_STABILITY_BY_CODE[type_code] if 0 <= type_code < 5
+                else _UNLISTED_TYPE_STABILITY))
+
+
+def _octet_with_order(z_a: int, z_b: int, valence_a: int, valence_b: int, bond_order: int) -> bool:
+    """Scalar form of BondingRules.satisfies_octet_with_order()."""
+    # Determine target electrons (2 for H/He, 8 for others)
+    target_a = 2 if z_a <= 2 else 8
+    target_b = 2 if z_b <= 2 else 8
+
+    # Both atoms must need electrons before bonding, and after gaining
+    # 'bond_order' shared electrons may overshoot the target by at most 2
+    # (atoms might not reach the exact octet)
+    return (valence_a < target_a and valence_b < target_b and
+            valence_a + bond_order <= target_a + 2 and
+            valence_b + bond_order <= target_b + 2)
+
+
+def _is_noble(z: int, valence: int) -> bool:
+    """
+    Noble-gas test on plain scalars (see BondingRules.is_noble_gas).
+
+    Noble gases: 8 valence (Ne and below) or 2 valence (He).
+    """
+    return valence == 8 or (valence == 2 and z <= 2)
+
 
-        breakdown = {}
-        for prop in properties_used:
-            conf_a = elem_a.confidence.get(prop, 0.0)
-            conf_b = elem_b.confidence.get(prop, 0.0)
-            # For each property, take minimum of (A, B)
-            breakdown[prop] = min(conf_a, conf_b)
+def _classify_bond_type_code(en_a: Optional[float], en_b: Optional[float]) -> int:
+    """
+    Bond-type code for two electronegativities (a BondType value).
+
+    Buckets ΔEN at the Pauling thresholds: 0 (< 0.5), 1 (< 1.7), 2 (ionic);
+    BondType.UNKNOWN if either value is missing.
+    """
+    if en_a is None or en_b is None:
+        return BondType.UNKNOWN
+    delta_en = abs(en_a - en_b)
+    return (delta_en >= 0.5) + (delta_en >= 1.7)
+
+
+def _element_bond_core(elem_a: Element, elem_b: Element) -> Tuple[bool, int, int, float, float]:
+    """
+    _bond_core() for two Elements, with the pair put in canonical order.
 
-        # Overall confidence is minimum across all properties
-        overall = min(breakdown.values())
+    The core is symmetric in its two atoms, so ordering by atomic number lets
+    A-B and B-A share one cache entry.
+    """
+    if elem_a.atomic_number > elem_b.atomic_number:
+        elem_a, elem_b = elem_b, elem_a
+    return _bond_core(
+        elem_a.atomic_number, elem_b.atomic_number,
+        elem_a.valence_electrons, elem_b.valence_electrons,
+        elem_a.electronegativity, elem_b.electronegativity
+    )
+
+
+@lru_cache(maxsize=65536)
+def _bond_core(
+    z_a: int,
+    z_b: int,
+    valence_a: int,
+    valence_b: int,
+    en_a: float,
+    en_b: float
+) -> Tuple[bool, int, int, float, float]:
+    """
+    Numeric core of BondingRules.can_bond() for two bondable elements.
+
+    Takes only scalars and returns the bond type as a BondType code, so no
+    Element attribute access, string handling or throwaway BondPrediction
+    objects happen on this path. The caller handles
+    noble gases and missing electronegativity first.
 
-        return overall, breakdown
+    Equivalent to predict_bond_order (most stable valid order, first on
+    ties), classify_bond_type, satisfies_octet and compute_stability_score.
+
+    Memoized on its arguments: the result depends only on these scalars, so
+    repeated queries for the same element pair (structure enumeration, the
+    validation sweeps) are a dictionary hit.
+
+    Returns:
+        (can_bond, bond_type_code, bond_order, stability_score, delta_en)
+    """
+    delta_en = abs(en_a - en_b)
+    type_code = (delta_en >= 0.5) + (delta_en >= 1.7)
+
+    row = _stability_row_for(z_a, z_b, type_code)
+
+    # Most stable valence-valid order (H: single bonds only; no O≡O)
+    bond_order = 1
+    if z_a != 1 and z_b != 1:
+        top = min(valence_a, valence_b, 3)
+        if z_a == 8 and z_b == 8:
+            top = min(top, 2)
+        best = row[1]
+        for order in range(2, top + 1):
+            if row[order] > best:
+                best = row[order]
+                bond_order = order
+
+    # Octet rule: both atoms need electrons (target 2 for H/He, else 8)
+    can_bond = ((2 if z_a <= 2 else 8) > valence_a and
+                (2 if z_b <= 2 else 8) > valence_b)
+
+    return can_bond, type_code, bond_order, row[bond_order], delta_en
@@ -0,0 +1,37 @@
+"""
+Pauling electronegativities of the observed elements (Z=1-118).
+
+Static copy of the tabulated Pauling-scale values (the en_pauling data the
+mendeleev package serves), so electronegativity lookup needs no database.
+None where no Pauling value is established (most noble gases, several
+lanthanides, and the transactinides).
+
+References:
+    - Pauling, L. (1960). The Nature of the Chemical Bond, 3rd ed.
+    - Haynes, W.M. (ed.) CRC Handbook of Chemistry and Physics
+"""
+
+from typing import Optional, Tuple
+
+
+# Indexed by Z; entry 0 is unused
+PAULING_EN: Tuple[Optional[float], ...] = (
+    None,
+    2.20, None,                                                  # H  He
+    0.98, 1.57, 2.04, 2.55, 3.04, 3.44, 3.98, None,              # Li-Ne
+    0.93, 1.31, 1.61, 1.90, 2.19, 2.58, 3.16, None,              # Na-Ar
+    0.82, 1.00, 1.36, 1.54, 1.63, 1.66, 1.55, 1.83, 1.88,        # K-Co
+    1.91, 1.90, 1.65, 1.81, 2.01, 2.18, 2.55, 2.96, 3.00,        # Ni-Kr
+    0.82, 0.95, 1.22, 1.33, 1.60, 2.16, 1.90, 2.20, 2.28,        # Rb-Rh
+    2.20, 1.93, 1.69, 1.78, 1.96, 2.05, 2.10, 2.66, 2.60,        # Pd-Xe
+    0.79, 0.89,                                                  # Cs Ba
+    1.10, 1.12, 1.13, 1.14, None, 1.17, None, 1.20,              # La-Gd
+    None, 1.22, 1.23, 1.24, 1.25, None, 1.27,                    # Tb-Lu
+    1.30, 1.50, 2.36, 1.90, 2.20, 2.20, 2.28, 2.54, 2.00,        # Hf-Hg
+    1.62, 2.33, 2.02, 2.00, 2.20, 2.20,                          # Tl-Rn
+    0.70, 0.90,                                                  # Fr Ra
+    1.10, 1.30, 1.50, 1.38, 1.36, 1.28, 1.30, 1.28,              # Ac-Cm
+    1.30, 1.30, 1.30, 1.30, 1.30, 1.30, None,                    # Bk-Lr
+    None, None, None, None, None, None, None,                    # Rf-Ds
+    None, None, None, None, None, None, None, None,              # Rg-Og
+)
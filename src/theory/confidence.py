@@ -8,9 +8,64 @@ Confidence is NOT part of the physics computation - it's a meta-level
 assessment of "how much do we trust this computed value?"
 """
 
+import copy
 import json
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Optional faster JSON parser for the config file
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Properties scored by ConfidenceScorer, in get_all_confidences() order
+PROPERTY_NAMES = (
+    "electron_configuration",
+    "atomic_radius",
+    "electronegativity",
+    "ionization_energy",
+    "oxidation_states",
+    "half_life",
+)
+
+# Parsed config files, keyed by (resolved path, mtime) so an edited file is
+# re-read. Never handed out directly: each caller gets its own deep copy.
+_CONFIG_CACHE: Dict[Tuple[Path, int], Dict[str, Any]] = {}
+
+
+def _config_key(config_path: Path) -> Tuple[Path, int]:
+    """
+    Identify the current version of a config file: (resolved path, mtime).
+
+    Raises:
+        FileNotFoundError: If config file not found
+    """
+    config_path = Path(config_path).resolve()
+    return config_path, config_path.stat().st_mtime_ns
+
+
+def _load_config(key: Tuple[Path, int]) -> Dict[str, Any]:
+    """
+    Parse a confidence profile file, once per file version.
+
+    Args:
+        key: File version from _config_key()
+
+    Returns:
+        A private deep copy of the parsed config, so a scorer that edits its
+        profile cannot affect other scorers or the cache
+    """
+    config = _CONFIG_CACHE.get(key)
+    if config is None:
+        with open(key[0], 'rb') as f:
+            data = f.read()
+        config = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+        _CONFIG_CACHE[key] = config
+
+    return copy.deepcopy(config)
 
 
 class ConfidenceScorer:
@@ -57,8 +112,10 @@ class ConfidenceScorer:
             project_root = Path(__file__).parent.parent.parent
             config_path = project_root / "config" / "confidence_profiles.json"
 
-        with open(config_path, 'r') as f:
-            config = json.load(f)
+        # Version of the file this scorer was built from; callers that cache
+        # results derived from the scorer key them on this
+        self.config_key = _config_key(config_path)
+        config = _load_config(self.config_key)
 
         if profile not in config["profiles"]:
             available = list(config["profiles"].keys())
@@ -69,6 +126,34 @@ class ConfidenceScorer:
         self.profile = config["profiles"][profile]
         self.z_ranges = self.profile["z_ranges"]
         self.version = config.get("version", "unknown")
+        self._z_to_range = self._build_z_lookup(self.z_ranges)
+
+        # Base (unmodified) confidences per Z, one row in PROPERTY_NAMES order
+        rows = {
+            id(range_config): tuple(range_config["confidence"][prop] for prop in PROPERTY_NAMES)
+            for range_config in self.z_ranges.values()
+        }
+        self._conf_table: List[Optional[Tuple[float, ...]]] = [
+            None if range_config is None else rows[id(range_config)]
+            for range_config in self._z_to_range
+        ]
+
+    @staticmethod
+    def _build_z_lookup(z_ranges: Dict[str, Dict]) -> List[Optional[Dict]]:
+        """
+        Dense Z -> range configuration table, so _find_z_range() is one index.
+
+        Ranges are written last-to-first, so where ranges overlap the first
+        one listed wins, as with a linear scan over z_ranges.
+        """
+        z_top = max((config["range"][1] for config in z_ranges.values()), default=-1)
+        table: List[Optional[Dict]] = [None] * (z_top + 1)
+        for range_config in reversed(list(z_ranges.values())):
+            z_min, z_max = range_config["range"]
+            z_min = max(z_min, 0)
+            if z_min <= z_max:
+                table[z_min:z_max + 1] = [range_config] * (z_max + 1 - z_min)
+        return table
 
     def _find_z_range(self, Z: int) -> Optional[Dict]:
         """
@@ -80,13 +165,20 @@ class ConfidenceScorer:
         Returns:
             Range configuration dict, or None if Z is out of range
         """
-        for range_name, range_config in self.z_ranges.items():
-            z_min, z_max = range_config["range"]
-            if z_min <= Z <= z_max:
-                return range_config
-
+        if 0 <= Z < len(self._z_to_range):
+            return self._z_to_range[Z]
         return None
 
+    def _base_confidence(self, Z: int, index: int) -> float:
+        """
+        Unmodified confidence of property PROPERTY_NAMES[index] at Z.
+
+        Returns:
+            Confidence score, or 0.0 if Z is outside the defined ranges
+        """
+        row = self._conf_table[Z] if 0 <= Z < len(self._conf_table) else None
+        return 0.0 if row is None else row[index]
+
     def electron_config_confidence(
         self,
         Z: int,
@@ -118,13 +210,11 @@ class ConfidenceScorer:
             >>> scorer.electron_config_confidence(120, models_agree=False)
             0.75
         """
-        range_config = self._find_z_range(Z)
-
-        if range_config is None:
+        if self._find_z_range(Z) is None:
             # Z is outside defined ranges (very high Z)
             return 0.0
 
-        base_confidence = range_config["confidence"]["electron_configuration"]
+        base_confidence = self._conf_table[Z][0]
 
         # Apply model agreement modifiers if known
         if models_agree is not None and "property_modifiers" in self.profile:
@@ -159,12 +249,7 @@ class ConfidenceScorer:
             - d/f orbital expansion (screening effects)
             This makes simple trend extrapolation unreliable for Z > 100.
         """
-        range_config = self._find_z_range(Z)
-
-        if range_config is None:
-            return 0.0
-
-        return range_config["confidence"]["atomic_radius"]
+        return self._base_confidence(Z, 1)
 
     def electronegativity_confidence(self, Z: int) -> float:
         """
@@ -182,12 +267,7 @@ class ConfidenceScorer:
         Returns:
             Confidence score (0.0 to 1.0)
         """
-        range_config = self._find_z_range(Z)
-
-        if range_config is None:
-            return 0.0
-
-        return range_config["confidence"]["electronegativity"]
+        return self._base_confidence(Z, 2)
 
     def ionization_energy_confidence(self, Z: int) -> float:
         """
@@ -205,12 +285,7 @@ class ConfidenceScorer:
         Returns:
             Confidence score (0.0 to 1.0)
         """
-        range_config = self._find_z_range(Z)
-
-        if range_config is None:
-            return 0.0
-
-        return range_config["confidence"]["ionization_energy"]
+        return self._base_confidence(Z, 3)
 
     def oxidation_states_confidence(self, Z: int) -> float:
         """
@@ -226,12 +301,7 @@ class ConfidenceScorer:
         Returns:
             Confidence score (0.0 to 1.0)
         """
-        range_config = self._find_z_range(Z)
-
-        if range_config is None:
-            return 0.0
-
-        return range_config["confidence"]["oxidation_states"]
+        return self._base_confidence(Z, 4)
 
     def half_life_confidence(self, Z: int, N: Optional[int] = None) -> float:
         """
@@ -258,12 +328,10 @@ class ConfidenceScorer:
             If N is close to 184 (magic number), confidence may be higher
             due to shell stabilization effects.
         """
-        range_config = self._find_z_range(Z)
-
-        if range_config is None:
+        if self._find_z_range(Z) is None:
             return 0.0
 
-        base_confidence = range_config["confidence"]["half_life"]
+        base_confidence = self._conf_table[Z][5]
 
         # Apply island of stability bonus if near magic neutron number
         if N is not None and "property_modifiers" in self.profile:
@@ -303,14 +371,45 @@ class ConfidenceScorer:
                 'half_life': 0.60  # Bonus for N=184 magic number
             }
         """
-        return {
-            "electron_configuration": self.electron_config_confidence(Z),
-            "atomic_radius": self.atomic_radius_confidence(Z),
-            "electronegativity": self.electronegativity_confidence(Z),
-            "ionization_energy": self.ionization_energy_confidence(Z),
-            "oxidation_states": self.oxidation_states_confidence(Z),
-            "half_life": self.half_life_confidence(Z, N),
-        }
+        row = self._conf_table[Z] if 0 <= Z < len(self._conf_table) else None
+        if row is None:
+            # Z is outside defined ranges
+            return dict.fromkeys(PROPERTY_NAMES, 0.0)
+
+        scores = dict(zip(PROPERTY_NAMES, row))
+
+        # Only half-life depends on N (island of stability modifiers)
+        if N is not None:
+            scores["half_life"] = self.half_life_confidence(Z, N)
+
+        return scores
+
+    def get_all_confidences_batch(self, Zs: Iterable[int]) -> Dict[str, List[float]]:
+        """
+        Confidence scores for all properties across several elements.
+
+        Column-wise counterpart of get_all_confidences() (without N): one
+        list per property, each in the order of Zs.
+
+        Args:
+            Zs: Atomic numbers
+
+        Returns:
+            Dictionary mapping property names to per-Z confidence scores
+
+        Example:
+            >>> scorer = ConfidenceScorer()
+            >>> scorer.get_all_confidences_batch([6, 173])["half_life"]
+            [0.9, 0.0]
+        """
+        table = self._conf_table
+        size = len(table)
+        missing = (0.0,) * len(PROPERTY_NAMES)
+        rows = [(table[Z] if 0 <= Z < size else None) or missing for Z in Zs]
+
+        if not rows:
+            return {prop: [] for prop in PROPERTY_NAMES}
+        return {prop: list(column) for prop, column in zip(PROPERTY_NAMES, zip(*rows))}
 
     def __repr__(self) -> str:
         return f"ConfidenceScorer(profile='{self.profile_name}', version='{self.version}')"
@@ -10,20 +10,18 @@ The generator is the bridge between physics (theory functions) and
 data structures (Element objects).
 """
 
-from typing import Optional, Dict
+from array import array
+from functools import lru_cache
+from typing import Optional, Dict, Iterable, Tuple
 from pathlib import Path
 import json
+import math
 
-from src.theory.quantum import madelung_rule, count_valence, orbital_type
-from src.theory.confidence import ConfidenceScorer
-from src.core.element import Element, ElementStatus
-
-# Import mendeleev for electronegativity data
-try:
-    from mendeleev import element as mendeleev_element
-    MENDELEEV_AVAILABLE = True
-except ImportError:
-    MENDELEEV_AVAILABLE = False
+from src.theory.quantum import madelung_rule, count_valence, valence_and_block
+from src.theory.confidence import ConfidenceScorer, PROPERTY_NAMES
+from src.theory._pauling_en import PAULING_EN
+from src.core.element import Element, ElementStatus, ElementView
+from src.core.element_table import ElementTable
 
 
 # IUPAC systematic naming for Z>118
@@ -33,6 +31,42 @@ IUPAC_DIGIT_NAMES = {
     '5': 'pent', '6': 'hex', '7': 'sept', '8': 'oct', '9': 'enn'
 }
 
+# The same roots indexed by digit value
+_IUPAC_DIGIT_ROOTS = ('nil', 'un', 'bi', 'tri', 'quad', 'pent', 'hex', 'sept', 'oct', 'enn')
+
+
+def _build_iupac_systematic_name(Z: int) -> tuple[str, str]:
+    """
+    Build the IUPAC systematic (symbol, name) for Z from its digits.
+
+    See _iupac_systematic_name(), which serves precomputed results.
+    """
+    if Z < 0:
+        raise ValueError(f"Atomic number must be non-negative, got {Z}")
+
+    # Walk the digits from least to most significant, prepending each root
+    # to the name and its first letter to the symbol
+    name = ''
+    symbol = ''
+    while True:
+        Z, digit = divmod(Z, 10)
+        root = _IUPAC_DIGIT_ROOTS[digit]
+        name = root + name
+        symbol = root[0] + symbol
+        if Z == 0:
+            break
+
+    # Capitalize the first letter of both
+    return (symbol[0].upper() + symbol[1:], name[0].upper() + name[1:] + 'ium')
+
+
+# Systematic names for every Z the generator accepts (1-200), indexed by Z;
+# the names are static, so they are built once at import
+IUPAC_MAX_Z = 200
+_IUPAC_NAMES = (None,) + tuple(
+    _build_iupac_systematic_name(Z) for Z in range(1, IUPAC_MAX_Z + 1)
+)
+
 
 def _iupac_systematic_name(Z: int) -> tuple[str, str]:
     """
@@ -57,20 +91,84 @@ def _iupac_systematic_name(Z: int) -> tuple[str, str]:
         >>> _iupac_systematic_name(120)
         ('Ubn', 'Unbinilium')
     """
-    digits = str(Z)
+    if 1 <= Z <= IUPAC_MAX_Z:
+        return _IUPAC_NAMES[Z]
+    return _build_iupac_systematic_name(Z)
 
-    # Build name from digits
-    parts = [IUPAC_DIGIT_NAMES[d] for d in digits]
-    name = ''.join(parts) + 'ium'
 
-    # Build symbol: first letter of each digit name, capitalized first
-    symbol_parts = [IUPAC_DIGIT_NAMES[d][0] for d in digits]
-    symbol = symbol_parts[0].upper() + ''.join(symbol_parts[1:])
+# Extrapolated electronegativity indexed by valence electron count (0-8):
+# group 1-like 0.8, group 2-like 1.2, 1.5-2.25 across the middle groups,
+# halogen-like 3.0, None for noble gases; 2.0 where the group is unclear
+_EN_BY_VALENCE = (2.0, 0.8, 1.2, 1.5, 1.75, 2.0, 2.25, 3.0, None)
 
-    # Capitalize first letter of name
-    name = name.capitalize()
 
-    return (symbol, name)
+def _element_status(Z: int) -> ElementStatus:
+    """
+    Experimental status of element Z; see ElementGenerator._classify_element().
+    """
+    if Z <= 118:
+        return ElementStatus.OBSERVED
+    elif Z <= 120:
+        return ElementStatus.SYNTHESIS_PLANNED
+    elif Z <= 137:
+        return ElementStatus.PREDICTED
+    elif Z <= 172:
+        return ElementStatus.SUPERCRITICAL
+    else:
+        return ElementStatus.IMPOSSIBLE
+
+
+# Status for every Z the generator accepts, indexed by Z
+_STATUS_BY_Z = (None,) + tuple(_element_status(Z) for Z in range(1, IUPAC_MAX_Z + 1))
+
+
+@lru_cache(maxsize=1)
+def _load_element_names() -> Dict[int, Tuple[str, str]]:
+    """
+    Load the standard element names database, once per process.
+
+    Every ElementGenerator shares the returned dict, so it must not be
+    modified.
+
+    Returns:
+        Dict mapping Z to (symbol, name); empty if the file is missing
+    """
+    project_root = Path(__file__).parent.parent.parent
+    names_path = project_root / "data" / "experimental" / "element_names.json"
+
+    if not names_path.exists():
+        return {}
+
+    with open(names_path, 'r') as f:
+        names_data = json.load(f)
+
+    # Convert string keys to integers and entries to the (symbol, name)
+    # tuples stored in the name table (see _load_name_table)
+    return {
+        int(z): (data["symbol"], data["name"])
+        for z, data in names_data["elements"].items()
+    }
+
+
+@lru_cache(maxsize=1)
+def _load_name_table() -> Tuple[Optional[Tuple[str, str]], ...]:
+    """
+    (symbol, name) for every Z the generator accepts, indexed by Z.
+
+    Standard names from the names database for Z≤118 (IUPAC systematic
+    names where the database has no entry), systematic names above.
+    """
+    names = _load_element_names()
+    return (None,) + tuple(
+        names[Z] if Z <= 118 and Z in names else _iupac_systematic_name(Z)
+        for Z in range(1, IUPAC_MAX_Z + 1)
+    )
+
+
+# Computed element properties per (generator class, model, confidence
+# profile, config file version), shared by every generator with those
+# settings; see ElementGenerator.__init__
+_PROPERTY_CACHES: Dict[tuple, Dict[int, tuple]] = {}
 
 
 class ElementGenerator:
@@ -117,28 +215,29 @@ class ElementGenerator:
         self.model = model
         self.confidence_scorer = ConfidenceScorer(profile=confidence_profile)
 
-        # Load element names database
-        project_root = Path(__file__).parent.parent.parent
-        names_path = project_root / "data" / "experimental" / "element_names.json"
-        self._element_names: Dict[int, Dict[str, str]] = {}
+        # (symbol, name) per Z, from the names database (shared, read-only)
+        self._names = _load_name_table()
 
-        if names_path.exists():
-            with open(names_path, 'r') as f:
-                names_data = json.load(f)
-                # Convert string keys to integers
-                self._element_names = {
-                    int(z): data for z, data in names_data["elements"].items()
-                }
+        # Computed properties per Z; generate() is deterministic for a given
+        # class, model and profile file, so each Z is computed once per
+        # process and later calls (from any generator with the same
+        # settings) only build a fresh Element from the cached values.
+        # Subclasses may override the theory methods, and an edited profile
+        # file changes the confidences, so both are part of the key
+        cache_key = (type(self), model, confidence_profile, self.confidence_scorer.config_key)
+        self._properties = _PROPERTY_CACHES.setdefault(cache_key, {})
 
-    def _compute_electronegativity(self, Z: int) -> Optional[float]:
+    def _compute_electronegativity(self, Z: int, valence: Optional[int] = None) -> Optional[float]:
         """
         Compute Pauling electronegativity for element Z.
 
-        For Z≤118: Use mendeleev package (experimental/validated values)
+        For Z≤118: Tabulated Pauling values (experimental/validated)
         For Z>118: Extrapolate from periodic table trends
 
         Args:
             Z: Atomic number
+            valence: Valence electron count of Z, if already known (saves
+                     recomputing the configuration when extrapolating)
 
         Returns:
             Pauling electronegativity (dimensionless), or None if unavailable
@@ -148,23 +247,17 @@ class ElementGenerator:
             Noble gases (full valence shells) typically have undefined electronegativity.
 
         Data sources:
-            - Z≤118: mendeleev package (Pauling scale from experimental data)
+            - Z≤118: Pauling scale from experimental data (src/theory/_pauling_en.py)
             - Z>118: Group-based trend extrapolation
         """
-        # For observed elements, use mendeleev database
-        if Z <= 118 and MENDELEEV_AVAILABLE:
-            try:
-                elem = mendeleev_element(Z)
-                en = elem.en_pauling  # Pauling electronegativity
-                return en if en is not None else None
-            except Exception:
-                # Fallback to extrapolation if mendeleev fails
-                pass
-
-        # For superheavy elements or if mendeleev unavailable, extrapolate
-        return self._extrapolate_electronegativity(Z)
-
-    def _extrapolate_electronegativity(self, Z: int) -> Optional[float]:
+        # For observed elements, use the tabulated values
+        if 1 <= Z <= 118:
+            return PAULING_EN[Z]
+
+        # For superheavy elements, extrapolate
+        return self._extrapolate_electronegativity(Z, valence)
+
+    def _extrapolate_electronegativity(self, Z: int, valence: Optional[int] = None) -> Optional[float]:
         """
         Extrapolate electronegativity for superheavy elements (Z>118).
 
@@ -177,31 +270,25 @@ class ElementGenerator:
 
         Args:
             Z: Atomic number
+            valence: Valence electron count of Z (computed from the
+                     configuration if not given)
 
         Returns:
             Estimated electronegativity or None
         """
         # Determine group from electron configuration
-        config = madelung_rule(Z)
-        valence = count_valence(config)
+        if valence is None:
+            valence = count_valence(madelung_rule(Z))
 
         # Noble gases (valence = 8 or 2 for He) - undefined EN
-        if valence == 8 or (Z == 2 and valence == 2):
+        if Z == 2 and valence == 2:
             return None
 
         # Rough group-based estimates (very uncertain!)
-        if valence == 1:  # Group 1-like (alkali)
-            return 0.8
-        elif valence == 2:  # Group 2-like (alkaline earth)
-            return 1.2
-        elif valence == 7:  # Group 17-like (halogen)
-            return 3.0
-        elif 3 <= valence <= 6:  # Middle groups
-            # Linear interpolation between 1.5 and 2.5
-            return 1.5 + (valence - 3) * 0.25
-        else:
-            # Unknown/uncertain
-            return 2.0  # Default middle value
+        if 0 <= valence <= 8:
+            return _EN_BY_VALENCE[valence]
+        # Unknown/uncertain
+        return 2.0  # Default middle value
 
     def _classify_element(self, Z: int) -> ElementStatus:
         """
@@ -220,16 +307,9 @@ class ElementGenerator:
             - Z = 138-172: Supercritical (1s electron velocity → c)
             - Z ≥ 173: Spontaneous pair creation, not viable
         """
-        if Z <= 118:
-            return ElementStatus.OBSERVED
-        elif Z <= 120:
-            return ElementStatus.SYNTHESIS_PLANNED
-        elif Z <= 137:
-            return ElementStatus.PREDICTED
-        elif Z <= 172:
-            return ElementStatus.SUPERCRITICAL
-        else:
-            return ElementStatus.IMPOSSIBLE
+        if 1 <= Z <= IUPAC_MAX_Z:
+            return _STATUS_BY_Z[Z]
+        return _element_status(Z)
 
     def generate(self, Z: int) -> Element:
         """
@@ -244,6 +324,10 @@ class ElementGenerator:
         6. Computes confidence scores
         7. Returns Element object
 
+        Steps 1-6 run once per Z per (model, confidence profile); repeated
+        calls reuse the computed values but still return a new Element each
+        time.
+
         Args:
             Z: Atomic number (1-200)
 
@@ -269,36 +353,17 @@ class ElementGenerator:
             >>> ubn.name
             'Unbinilium'
             >>> ubn.status
-            <ElementStatus.SYNTHESIS_PLANNED: 'synthesis_planned'>
+            <ElementStatus.SYNTHESIS_PLANNED: 1>
         """
-        if Z < 1 or Z > 200:
-            raise ValueError(f"Atomic number must be between 1 and 200, got {Z}")
-
-        # Compute electron configuration (Layer 0: Theory)
-        config = madelung_rule(Z, use_noble_gas_core=True)
-        valence = count_valence(config)
-        block = orbital_type(config)
-
-        # Compute electronegativity (Phase 2.5)
-        electronegativity = self._compute_electronegativity(Z)
-
-        # Determine symbol and name
-        if Z <= 118:
-            # Use standard names (would load from database in production)
-            # For now, use IUPAC systematic naming as placeholder
-            symbol, name = self._get_standard_name(Z)
-        else:
-            # Z > 118: Use IUPAC systematic naming
-            symbol, name = _iupac_systematic_name(Z)
-
-        # Classify element status
-        status = self._classify_element(Z)
+        properties = self._properties.get(Z)
+        if properties is None:
+            properties = self._properties[Z] = self._compute_properties(Z)
 
-        # Compute confidence scores
-        confidence = self.confidence_scorer.get_all_confidences(Z)
+        symbol, name, config, valence, block, electronegativity, status, confidence = properties
 
-        # Create Element object
-        element = Element(
+        # Each Element gets its own confidence dict, so callers can't
+        # modify the cached one
+        return Element(
             atomic_number=Z,
             symbol=symbol,
             name=name,
@@ -307,30 +372,129 @@ class ElementGenerator:
             block=block,
             electronegativity=electronegativity,
             status=status,
-            confidence=confidence
+            confidence=dict(confidence)
         )
 
-        return element
+    def generate_view(self, Z: int) -> ElementView:
+        """
+        Generate element Z as an immutable ElementView.
+
+        Same values as generate(), for read-only callers: no Element or
+        confidence dict is built, and confidence scores come as a tuple in
+        PROPERTY_NAMES order.
+
+        Args:
+            Z: Atomic number (1-200)
+
+        Returns:
+            ElementView with properties and confidence scores
+
+        Raises:
+            ValueError: If Z is out of range
+        """
+        properties = self._properties.get(Z)
+        if properties is None:
+            properties = self._properties[Z] = self._compute_properties(Z)
+
+        symbol, name, config, valence, block, electronegativity, status, confidence = properties
+        return ElementView(
+            Z, symbol, name, config, valence, block, status,
+            tuple([confidence[key] for key in PROPERTY_NAMES]),
+            electronegativity
+        )
 
-    def _get_standard_name(self, Z: int) -> tuple[str, str]:
+    def generate_many(self, Zs: Iterable[int]) -> ElementTable:
         """
-        Get standard symbol and name for observed elements (Z≤118).
+        Generate several elements at once as a column-oriented ElementTable.
 
-        Loads from element_names.json if available, otherwise falls back
-        to IUPAC systematic naming.
+        Uses the same per-Z computation and cache as generate(), but fills
+        the table columns directly instead of building an Element per Z, so
+        table-wide analysis (EN vs Z, trend fits) skips object construction.
+        Call `to_elements()` on the result to get Element objects.
 
         Args:
-            Z: Atomic number (1-118)
+            Zs: Atomic numbers (1-200), one table row per entry, in order
 
         Returns:
-            Tuple of (symbol, name)
+            ElementTable with the generated elements
+
+        Raises:
+            ValueError: If any Z is out of range
+
+        Examples:
+            >>> table = ElementGenerator().generate_many(range(1, 174))
+            >>> table.to_elements(table.filter(block='g'))
         """
-        if Z in self._element_names:
-            data = self._element_names[Z]
-            return (data["symbol"], data["name"])
-        else:
-            # Fallback to systematic naming if name not in database
-            return _iupac_systematic_name(Z)
+        rows = []
+        for Z in Zs:
+            properties = self._properties.get(Z)
+            if properties is None:
+                properties = self._properties[Z] = self._compute_properties(Z)
+            rows.append((Z,) + properties)
+
+        # Confidence index: union of keys in first-seen order, as in
+        # ElementTable.from_elements()
+        property_names: Dict[str, int] = {}
+        for row in rows:
+            for key in row[8]:
+                if key not in property_names:
+                    property_names[key] = len(property_names)
+        num_props = len(property_names)
+
+        confidence = array('d', [math.nan]) * (len(rows) * num_props)
+        for i, row in enumerate(rows):
+            base = i * num_props
+            for key, score in row[8].items():
+                confidence[base + property_names[key]] = score
+
+        return ElementTable(
+            atomic_number=array('h', [row[0] for row in rows]),
+            symbol=tuple(row[1] for row in rows),
+            name=tuple(row[2] for row in rows),
+            electron_configuration=tuple(row[3] for row in rows),
+            valence_electrons=array('h', [row[4] for row in rows]),
+            block=array('B', [ord(row[5]) for row in rows]),
+            status=array('b', [row[7] for row in rows]),
+            electronegativity=array('d', [
+                math.nan if row[6] is None else row[6] for row in rows
+            ]),
+            confidence=confidence,
+            property_names=tuple(property_names)
+        )
+
+    def _compute_properties(self, Z: int) -> tuple:
+        """
+        Compute the Element fields for Z (see generate()).
+
+        Returns:
+            (symbol, name, config, valence, block, electronegativity,
+            status, confidence)
+
+        Raises:
+            ValueError: If Z is out of range
+        """
+        # Only reached on a cache miss; cached Z are known to be valid
+        if not 1 <= Z <= IUPAC_MAX_Z:
+            raise ValueError(f"Atomic number must be between 1 and 200, got {Z}")
+
+        # Compute electron configuration (Layer 0: Theory)
+        config = madelung_rule(Z, use_noble_gas_core=True)
+        valence, block = valence_and_block(config)
+
+        # Compute electronegativity (Phase 2.5)
+        electronegativity = self._compute_electronegativity(Z, valence)
+
+        # Determine symbol and name: standard names for Z≤118, IUPAC
+        # systematic naming above (see _load_name_table())
+        symbol, name = self._names[Z]
+
+        # Classify element status
+        status = self._classify_element(Z)
+
+        # Compute confidence scores
+        confidence = self.confidence_scorer.get_all_confidences(Z)
+
+        return (symbol, name, config, valence, block, electronegativity, status, confidence)
 
     def __repr__(self) -> str:
         return f"ElementGenerator(model='{self.model}', scorer={self.confidence_scorer})"
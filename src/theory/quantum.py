@@ -5,7 +5,12 @@ This module implements electron configuration generation, valence electron
 counting, and orbital properties based on quantum mechanics.
 """
 
-from typing import List, Tuple
+from bisect import bisect_left
+from functools import lru_cache
+from itertools import accumulate
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+import re
+import sys
 
 
 # Orbital capacity: s=2, p=6, d=10, f=14, g=18
@@ -17,6 +22,20 @@ ORBITAL_CAPACITY = {
     'g': 18
 }
 
+
+class Orbital(NamedTuple):
+    """One occupied orbital of a configuration, e.g. Orbital(4, 'f', 14)."""
+    n: int
+    orbital: str
+    count: int
+
+
+# Angular momentum quantum number l of each orbital letter
+_L_VALUE = {'s': 0, 'p': 1, 'd': 2, 'f': 3, 'g': 4}
+
+# One orbital occupation in a configuration string, e.g. "4f14" -> ('4', 'f', '14')
+_ORBITAL_PATTERN = re.compile(r'(\d+)([spdfg])(\d+)')
+
 # Noble gas cores for compact notation
 NOBLE_GASES = {
     2: 'He',
@@ -28,6 +47,9 @@ NOBLE_GASES = {
     118: 'Og'
 }
 
+# Noble gas Z values in ascending order, for bisecting
+_NOBLE_GAS_Z = tuple(sorted(NOBLE_GASES))
+
 # Known exceptions to Madelung rule (half-filled and filled d-orbitals are stabilized)
 # Also includes lanthanide/actinide exceptions where d fills before f
 # Format: Z → (expected_config_suffix, actual_config_suffix)
@@ -54,6 +76,36 @@ MADELUNG_EXCEPTIONS = {
     103: ('5f15 7s2', '5f14 6d1 7s2'),  # Lr: 6d before end of 5f
 }
 
+# Actual ground-state configurations of the MADELUNG_EXCEPTIONS elements,
+# as full (n, orbital, count) lists in filling order
+_EXCEPTION_TABLE = {
+    24: [(1, 's', 2), (2, 's', 2), (2, 'p', 6), (3, 's', 2), (3, 'p', 6), (3, 'd', 5), (4, 's', 1)],  # Cr
+    29: [(1, 's', 2), (2, 's', 2), (2, 'p', 6), (3, 's', 2), (3, 'p', 6), (3, 'd', 10), (4, 's', 1)],  # Cu
+    41: [(1, 's', 2), (2, 's', 2), (2, 'p', 6), (3, 's', 2), (3, 'p', 6), (3, 'd', 10), (4, 's', 2), (4, 'p', 6), (4, 'd', 4), (5, 's', 1)],  # Nb
+    42: [(1, 's', 2), (2, 's', 2), (2, 'p', 6), (3, 's', 2), (3, 'p', 6), (3, 'd', 10), (4, 's', 2), (4, 'p', 6), (4, 'd', 5), (5, 's', 1)],  # Mo
+    44: [(1, 's', 2), (2, 's', 2), (2, 'p', 6), (3, 's', 2), (3, 'p', 6), (3, 'd', 10), (4, 's', 2), (4, 'p', 6), (4, 'd', 7), (5, 's', 1)],  # Ru
+    45: [(1, 's', 2), (2, 's', 2), (2, 'p', 6), (3, 's', 2), (3, 'p', 6), (3, 'd', 10), (4, 's', 2), (4, 'p', 6), (4, 'd', 8), (5, 's', 1)],  # Rh
+    46: [(1, 's', 2), (2, 's', 2), (2, 'p', 6), (3, 's', 2), (3, 'p', 6), (3, 'd', 10), (4, 's', 2), (4, 'p', 6), (4, 'd', 10)],  # Pd
+    47: [(1, 's', 2), (2, 's', 2), (2, 'p', 6), (3, 's', 2), (3, 'p', 6), (3, 'd', 10), (4, 's', 2), (4, 'p', 6), (4, 'd', 10), (5, 's', 1)],  # Ag
+    57: [(1, 's', 2), (2, 's', 2), (2, 'p', 6), (3, 's', 2), (3, 'p', 6), (3, 'd', 10), (4, 's', 2), (4, 'p', 6), (4, 'd', 10), (5, 's', 2), (5, 'p', 6), (5, 'd', 1), (6, 's', 2)],  # La
+    58: [(1, 's', 2), (2, 's', 2), (2, 'p', 6), (3, 's', 2), (3, 'p', 6), (3, 'd', 10), (4, 's', 2), (4, 'p', 6), (4, 'd', 10), (5, 's', 2), (5, 'p', 6), (4, 'f', 1), (5, 'd', 1), (6, 's', 2)],  # Ce
+    64: [(1, 's', 2), (2, 's', 2), (2, 'p', 6), (3, 's', 2), (3, 'p', 6), (3, 'd', 10), (4, 's', 2), (4, 'p', 6), (4, 'd', 10), (5, 's', 2), (5, 'p', 6), (4, 'f', 7), (5, 'd', 1), (6, 's', 2)],  # Gd
+    78: [(1, 's', 2), (2, 's', 2), (2, 'p', 6), (3, 's', 2), (3, 'p', 6), (3, 'd', 10), (4, 's', 2), (4, 'p', 6), (4, 'd', 10), (5, 's', 2), (5, 'p', 6), (4, 'f', 14), (5, 'd', 9), (6, 's', 1)],  # Pt
+    79: [(1, 's', 2), (2, 's', 2), (2, 'p', 6), (3, 's', 2), (3, 'p', 6), (3, 'd', 10), (4, 's', 2), (4, 'p', 6), (4, 'd', 10), (5, 's', 2), (5, 'p', 6), (4, 'f', 14), (5, 'd', 10), (6, 's', 1)],  # Au
+    89: [(1, 's', 2), (2, 's', 2), (2, 'p', 6), (3, 's', 2), (3, 'p', 6), (3, 'd', 10), (4, 's', 2), (4, 'p', 6), (4, 'd', 10), (5, 's', 2), (5, 'p', 6), (4, 'f', 14), (5, 'd', 10), (6, 's', 2), (6, 'p', 6), (6, 'd', 1), (7, 's', 2)],  # Ac
+    90: [(1, 's', 2), (2, 's', 2), (2, 'p', 6), (3, 's', 2), (3, 'p', 6), (3, 'd', 10), (4, 's', 2), (4, 'p', 6), (4, 'd', 10), (5, 's', 2), (5, 'p', 6), (4, 'f', 14), (5, 'd', 10), (6, 's', 2), (6, 'p', 6), (6, 'd', 2), (7, 's', 2)],  # Th
+    91: [(1, 's', 2), (2, 's', 2), (2, 'p', 6), (3, 's', 2), (3, 'p', 6), (3, 'd', 10), (4, 's', 2), (4, 'p', 6), (4, 'd', 10), (5, 's', 2), (5, 'p', 6), (4, 'f', 14), (5, 'd', 10), (6, 's', 2), (6, 'p', 6), (5, 'f', 2), (6, 'd', 1), (7, 's', 2)],  # Pa
+    92: [(1, 's', 2), (2, 's', 2), (2, 'p', 6), (3, 's', 2), (3, 'p', 6), (3, 'd', 10), (4, 's', 2), (4, 'p', 6), (4, 'd', 10), (5, 's', 2), (5, 'p', 6), (4, 'f', 14), (5, 'd', 10), (6, 's', 2), (6, 'p', 6), (5, 'f', 3), (6, 'd', 1), (7, 's', 2)],  # U
+    93: [(1, 's', 2), (2, 's', 2), (2, 'p', 6), (3, 's', 2), (3, 'p', 6), (3, 'd', 10), (4, 's', 2), (4, 'p', 6), (4, 'd', 10), (5, 's', 2), (5, 'p', 6), (4, 'f', 14), (5, 'd', 10), (6, 's', 2), (6, 'p', 6), (5, 'f', 4), (6, 'd', 1), (7, 's', 2)],  # Np
+    96: [(1, 's', 2), (2, 's', 2), (2, 'p', 6), (3, 's', 2), (3, 'p', 6), (3, 'd', 10), (4, 's', 2), (4, 'p', 6), (4, 'd', 10), (5, 's', 2), (5, 'p', 6), (4, 'f', 14), (5, 'd', 10), (6, 's', 2), (6, 'p', 6), (5, 'f', 7), (6, 'd', 1), (7, 's', 2)],  # Cm
+    103: [(1, 's', 2), (2, 's', 2), (2, 'p', 6), (3, 's', 2), (3, 'p', 6), (3, 'd', 10), (4, 's', 2), (4, 'p', 6), (4, 'd', 10), (5, 's', 2), (5, 'p', 6), (4, 'f', 14), (5, 'd', 10), (6, 's', 2), (6, 'p', 6), (5, 'f', 14), (6, 'd', 1), (7, 's', 2)],  # Lr
+}
+
+# _EXCEPTION_TABLE as Orbital lists, as used by _apply_exception()
+_EXCEPTION_CONFIGS = {
+    Z: [Orbital(*entry) for entry in config] for Z, config in _EXCEPTION_TABLE.items()
+}
+
 
 def _aufbau_order() -> List[Tuple[int, str]]:
     """
@@ -77,17 +129,37 @@ def _aufbau_order() -> List[Tuple[int, str]]:
 
     # Generate up to n=10, l=4 (g orbitals) for superheavy elements
     for n in range(1, 11):
-        for l_symbol in ['s', 'p', 'd', 'f', 'g']:
-            l = {'s': 0, 'p': 1, 'd': 2, 'f': 3, 'g': 4}[l_symbol]
+        for l_symbol, l in _L_VALUE.items():
             if l < n:  # Only include valid quantum numbers (l < n)
                 orbitals.append((n, l_symbol))
 
     # Sort by n+l, then by n
-    orbitals.sort(key=lambda x: (x[0] + {'s': 0, 'p': 1, 'd': 2, 'f': 3, 'g': 4}[x[1]], x[0]))
+    orbitals.sort(key=lambda x: (x[0] + _L_VALUE[x[1]], x[0]))
 
     return orbitals
 
 
+# Filling order is constant, so it is computed once for madelung_rule()
+_AUFBAU_ORDER: Tuple[Tuple[int, str], ...] = tuple(_aufbau_order())
+
+# Fully occupied orbitals in filling order, and the electron count once each
+# is filled, so a configuration is a prefix of full orbitals plus one more
+_AUFBAU_FULL = tuple(Orbital(n, orb, ORBITAL_CAPACITY[orb]) for n, orb in _AUFBAU_ORDER)
+_AUFBAU_CUMULATIVE = tuple(accumulate(count for _, _, count in _AUFBAU_FULL))
+
+# The same orbitals in notation order (by n, then l), for _format_config()
+_NOTATION_ORDER: Tuple[Tuple[int, str], ...] = tuple(
+    sorted(_AUFBAU_ORDER, key=lambda x: (x[0], _L_VALUE[x[1]]))
+)
+
+# Notation token for every possible (n, orbital, count), e.g. (4, 'f', 14) -> '4f14'
+_ORBITAL_TOKENS = {
+    (n, orb, count): sys.intern(f"{n}{orb}{count}")
+    for n, orb in _AUFBAU_ORDER
+    for count in range(1, ORBITAL_CAPACITY[orb] + 1)
+}
+
+
 def madelung_rule(Z: int, use_noble_gas_core: bool = True) -> str:
     """
     Generate electron configuration using Madelung (n+l) rule with known exceptions.
@@ -126,37 +198,63 @@ def madelung_rule(Z: int, use_noble_gas_core: bool = True) -> str:
     if Z < 1 or Z > 173:
         raise ValueError(f"Atomic number must be between 1 and 173, got {Z}")
 
-    # Generate filling order
-    aufbau = _aufbau_order()
+    # Configurations are precomputed for every valid Z (see _build_config)
+    if use_noble_gas_core:
+        return _NOBLE_CORE_CONFIGS[Z]
+    else:
+        return _FULL_CONFIGS[Z]
+
 
-    # Fill orbitals
-    config = []
-    electrons_remaining = Z
+def madelung_rule_batch(Zs: Iterable[int], use_noble_gas_core: bool = True) -> List[str]:
+    """
+    Electron configurations for several elements at once.
 
-    for n, orbital in aufbau:
-        if electrons_remaining <= 0:
-            break
+    Equivalent to [madelung_rule(Z, use_noble_gas_core) for Z in Zs], with
+    all Z validated up front.
 
-        capacity = ORBITAL_CAPACITY[orbital]
-        electrons_in_orbital = min(electrons_remaining, capacity)
+    Args:
+        Zs: Atomic numbers (1-173)
+        use_noble_gas_core: If True, use [He], [Ne], etc. notation
+
+    Returns:
+        Configuration strings, in the order of Zs
+
+    Raises:
+        ValueError: If any Z is out of range
+    """
+    Zs = list(Zs)
+    for Z in Zs:
+        if Z < 1 or Z > 173:
+            raise ValueError(f"Atomic number must be between 1 and 173, got {Z}")
 
-        if electrons_in_orbital > 0:
-            config.append((n, orbital, electrons_in_orbital))
+    configs = _NOBLE_CORE_CONFIGS if use_noble_gas_core else _FULL_CONFIGS
+    return [configs[Z] for Z in Zs]
 
-        electrons_remaining -= electrons_in_orbital
+
+def _build_config(Z: int) -> List[Orbital]:
+    """
+    Fill orbitals for Z in aufbau order and apply the known exceptions.
+
+    Returns:
+        List of Orbital (n, orbital, count) entries
+    """
+    # Fill orbitals: the first `stop` orbitals are full, and orbital `stop`
+    # holds the remaining electrons
+    stop = bisect_left(_AUFBAU_CUMULATIVE, Z)
+    config = list(_AUFBAU_FULL[:stop])
+    electrons_remaining = Z - (_AUFBAU_CUMULATIVE[stop - 1] if stop else 0)
+    if electrons_remaining > 0:
+        n, orbital = _AUFBAU_ORDER[stop]
+        config.append(Orbital(n, orbital, electrons_remaining))
 
     # Apply known exceptions for Z <= 118
     if Z in MADELUNG_EXCEPTIONS:
         config = _apply_exception(Z, config)
 
-    # Format as string
-    if use_noble_gas_core:
-        return _format_with_noble_gas_core(Z, config)
-    else:
-        return _format_config(config)
+    return config
 
 
-def _apply_exception(Z: int, config: List[Tuple[int, str, int]]) -> List[Tuple[int, str, int]]:
+def _apply_exception(Z: int, config: List[Orbital]) -> List[Orbital]:
     """
     Apply known exceptions to Madelung rule.
 
@@ -170,50 +268,23 @@ def _apply_exception(Z: int, config: List[Tuple[int, str, int]]) -> List[Tuple[i
     Returns:
         Modified configuration with exception applied
     """
-    # Hardcoded configurations for exception elements
-    # Format: full electron configuration as tuples
-
-    EXCEPTION_CONFIGS = {
-        24: [(1, 's', 2), (2, 's', 2), (2, 'p', 6), (3, 's', 2), (3, 'p', 6), (3, 'd', 5), (4, 's', 1)],  # Cr
-        29: [(1, 's', 2), (2, 's', 2), (2, 'p', 6), (3, 's', 2), (3, 'p', 6), (3, 'd', 10), (4, 's', 1)],  # Cu
-        41: [(1, 's', 2), (2, 's', 2), (2, 'p', 6), (3, 's', 2), (3, 'p', 6), (3, 'd', 10), (4, 's', 2), (4, 'p', 6), (4, 'd', 4), (5, 's', 1)],  # Nb
-        42: [(1, 's', 2), (2, 's', 2), (2, 'p', 6), (3, 's', 2), (3, 'p', 6), (3, 'd', 10), (4, 's', 2), (4, 'p', 6), (4, 'd', 5), (5, 's', 1)],  # Mo
-        44: [(1, 's', 2), (2, 's', 2), (2, 'p', 6), (3, 's', 2), (3, 'p', 6), (3, 'd', 10), (4, 's', 2), (4, 'p', 6), (4, 'd', 7), (5, 's', 1)],  # Ru
-        45: [(1, 's', 2), (2, 's', 2), (2, 'p', 6), (3, 's', 2), (3, 'p', 6), (3, 'd', 10), (4, 's', 2), (4, 'p', 6), (4, 'd', 8), (5, 's', 1)],  # Rh
-        46: [(1, 's', 2), (2, 's', 2), (2, 'p', 6), (3, 's', 2), (3, 'p', 6), (3, 'd', 10), (4, 's', 2), (4, 'p', 6), (4, 'd', 10)],  # Pd
-        47: [(1, 's', 2), (2, 's', 2), (2, 'p', 6), (3, 's', 2), (3, 'p', 6), (3, 'd', 10), (4, 's', 2), (4, 'p', 6), (4, 'd', 10), (5, 's', 1)],  # Ag
-        57: [(1, 's', 2), (2, 's', 2), (2, 'p', 6), (3, 's', 2), (3, 'p', 6), (3, 'd', 10), (4, 's', 2), (4, 'p', 6), (4, 'd', 10), (5, 's', 2), (5, 'p', 6), (5, 'd', 1), (6, 's', 2)],  # La
-        58: [(1, 's', 2), (2, 's', 2), (2, 'p', 6), (3, 's', 2), (3, 'p', 6), (3, 'd', 10), (4, 's', 2), (4, 'p', 6), (4, 'd', 10), (5, 's', 2), (5, 'p', 6), (4, 'f', 1), (5, 'd', 1), (6, 's', 2)],  # Ce
-        64: [(1, 's', 2), (2, 's', 2), (2, 'p', 6), (3, 's', 2), (3, 'p', 6), (3, 'd', 10), (4, 's', 2), (4, 'p', 6), (4, 'd', 10), (5, 's', 2), (5, 'p', 6), (4, 'f', 7), (5, 'd', 1), (6, 's', 2)],  # Gd
-        78: [(1, 's', 2), (2, 's', 2), (2, 'p', 6), (3, 's', 2), (3, 'p', 6), (3, 'd', 10), (4, 's', 2), (4, 'p', 6), (4, 'd', 10), (5, 's', 2), (5, 'p', 6), (4, 'f', 14), (5, 'd', 9), (6, 's', 1)],  # Pt
-        79: [(1, 's', 2), (2, 's', 2), (2, 'p', 6), (3, 's', 2), (3, 'p', 6), (3, 'd', 10), (4, 's', 2), (4, 'p', 6), (4, 'd', 10), (5, 's', 2), (5, 'p', 6), (4, 'f', 14), (5, 'd', 10), (6, 's', 1)],  # Au
-        89: [(1, 's', 2), (2, 's', 2), (2, 'p', 6), (3, 's', 2), (3, 'p', 6), (3, 'd', 10), (4, 's', 2), (4, 'p', 6), (4, 'd', 10), (5, 's', 2), (5, 'p', 6), (4, 'f', 14), (5, 'd', 10), (6, 's', 2), (6, 'p', 6), (6, 'd', 1), (7, 's', 2)],  # Ac
-        90: [(1, 's', 2), (2, 's', 2), (2, 'p', 6), (3, 's', 2), (3, 'p', 6), (3, 'd', 10), (4, 's', 2), (4, 'p', 6), (4, 'd', 10), (5, 's', 2), (5, 'p', 6), (4, 'f', 14), (5, 'd', 10), (6, 's', 2), (6, 'p', 6), (6, 'd', 2), (7, 's', 2)],  # Th
-        91: [(1, 's', 2), (2, 's', 2), (2, 'p', 6), (3, 's', 2), (3, 'p', 6), (3, 'd', 10), (4, 's', 2), (4, 'p', 6), (4, 'd', 10), (5, 's', 2), (5, 'p', 6), (4, 'f', 14), (5, 'd', 10), (6, 's', 2), (6, 'p', 6), (5, 'f', 2), (6, 'd', 1), (7, 's', 2)],  # Pa
-        92: [(1, 's', 2), (2, 's', 2), (2, 'p', 6), (3, 's', 2), (3, 'p', 6), (3, 'd', 10), (4, 's', 2), (4, 'p', 6), (4, 'd', 10), (5, 's', 2), (5, 'p', 6), (4, 'f', 14), (5, 'd', 10), (6, 's', 2), (6, 'p', 6), (5, 'f', 3), (6, 'd', 1), (7, 's', 2)],  # U
-        93: [(1, 's', 2), (2, 's', 2), (2, 'p', 6), (3, 's', 2), (3, 'p', 6), (3, 'd', 10), (4, 's', 2), (4, 'p', 6), (4, 'd', 10), (5, 's', 2), (5, 'p', 6), (4, 'f', 14), (5, 'd', 10), (6, 's', 2), (6, 'p', 6), (5, 'f', 4), (6, 'd', 1), (7, 's', 2)],  # Np
-        96: [(1, 's', 2), (2, 's', 2), (2, 'p', 6), (3, 's', 2), (3, 'p', 6), (3, 'd', 10), (4, 's', 2), (4, 'p', 6), (4, 'd', 10), (5, 's', 2), (5, 'p', 6), (4, 'f', 14), (5, 'd', 10), (6, 's', 2), (6, 'p', 6), (5, 'f', 7), (6, 'd', 1), (7, 's', 2)],  # Cm
-        103: [(1, 's', 2), (2, 's', 2), (2, 'p', 6), (3, 's', 2), (3, 'p', 6), (3, 'd', 10), (4, 's', 2), (4, 'p', 6), (4, 'd', 10), (5, 's', 2), (5, 'p', 6), (4, 'f', 14), (5, 'd', 10), (6, 's', 2), (6, 'p', 6), (5, 'f', 14), (6, 'd', 1), (7, 's', 2)],  # Lr
-    }
-
-    return EXCEPTION_CONFIGS.get(Z, config)
-
-
-def _format_config(config: List[Tuple[int, str, int]]) -> str:
+    return _EXCEPTION_CONFIGS.get(Z, config)
+
+
+def _format_config(config: List[Orbital]) -> str:
     """
     Format configuration as string: '1s2 2s2 2p6'.
 
     Orbitals are sorted by n first, then by l within the same n.
     This follows standard notation convention (not filling order).
     """
-    # Sort by (n, l_value) where l_value = {s:0, p:1, d:2, f:3, g:4}
-    l_order = {'s': 0, 'p': 1, 'd': 2, 'f': 3, 'g': 4}
-    sorted_config = sorted(config, key=lambda x: (x[0], l_order.get(x[1], 5)))
-
-    return ' '.join(f"{n}{orb}{count}" for n, orb, count in sorted_config)
+    # Emit occupied orbitals by walking the precomputed notation order,
+    # rather than sorting the config
+    tokens = {(n, orb): _ORBITAL_TOKENS[n, orb, count] for n, orb, count in config}
+    return ' '.join(tokens[key] for key in _NOTATION_ORDER if key in tokens)
 
 
-def _format_with_noble_gas_core(Z: int, config: List[Tuple[int, str, int]]) -> str:
+def _format_with_noble_gas_core(Z: int, config: List[Orbital]) -> str:
     """
     Format configuration using noble gas core notation.
 
@@ -221,30 +292,20 @@ def _format_with_noble_gas_core(Z: int, config: List[Tuple[int, str, int]]) -> s
         Carbon (Z=6): [He] 2s2 2p2
         Gold (Z=79): [Xe] 4f14 5d10 6s1
     """
-    # Find the largest noble gas core less than Z
-    core_Z = max([ng_Z for ng_Z in NOBLE_GASES.keys() if ng_Z < Z], default=0)
-
-    if core_Z == 0:
+    if Z <= _NOBLE_GAS_Z[0]:
         # No noble gas core (H, He)
         return _format_config(config)
 
-    # Count electrons in core
-    core_electrons = core_Z
-
-    # Filter out core orbitals
-    valence_config = []
-    electron_count = 0
+    # Find the largest noble gas core less than Z; every superheavy element
+    # has the Og core, so those skip the search
+    if Z > _NOBLE_GAS_Z[-1]:
+        core_Z = _NOBLE_GAS_Z[-1]
+    else:
+        core_Z = _NOBLE_GAS_Z[bisect_left(_NOBLE_GAS_Z, Z) - 1]
 
-    for n, orb, count in config:
-        electron_count += count
-        if electron_count > core_electrons:
-            # This orbital is partially or fully in valence
-            if electron_count - count < core_electrons:
-                # Orbital straddles core/valence boundary (shouldn't happen with proper noble gas cores)
-                valence_config.append((n, orb, count))
-            else:
-                # Orbital is fully in valence
-                valence_config.append((n, orb, count))
+    # The core fills the first orbitals of every heavier configuration
+    # (noble gases close a period), so the valence part is what follows
+    valence_config = config[_CORE_ORBITAL_COUNT[core_Z]:]
 
     core_symbol = NOBLE_GASES[core_Z]
     valence_str = _format_config(valence_config)
@@ -255,6 +316,38 @@ def _format_with_noble_gas_core(Z: int, config: List[Tuple[int, str, int]]) -> s
         return f"[{core_symbol}]"
 
 
+# Number of orbitals in each noble gas core configuration
+_CORE_ORBITAL_COUNT = {core_Z: len(_build_config(core_Z)) for core_Z in _NOBLE_GAS_Z}
+
+
+def _build_config_strings() -> Tuple[Tuple[Optional[str], ...], Tuple[Optional[str], ...]]:
+    """
+    Format the configuration of every Z accepted by madelung_rule().
+
+    Returns:
+        (noble-gas-core strings, full strings), each indexed by Z
+    """
+    noble_core = [None]
+    full = [None]
+    for Z in range(1, 174):
+        config = _build_config(Z)
+        # Interned: these strings are compared and hashed downstream (e.g.
+        # as keys), and interning makes equal configurations one object
+        noble_core.append(sys.intern(_format_with_noble_gas_core(Z, config)))
+        full.append(sys.intern(_format_config(config)))
+    return tuple(noble_core), tuple(full)
+
+
+# madelung_rule() results for Z=1-173, indexed by Z
+_NOBLE_CORE_CONFIGS, _FULL_CONFIGS = _build_config_strings()
+
+
+# Bound for the per-string caches below: both notations of every Z with room
+# to spare, while arbitrary caller strings can't grow them without limit
+_PARSE_CACHE_SIZE = 512
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
 def count_valence(config: str) -> int:
     """
     Count valence electrons from electron configuration string.
@@ -293,9 +386,7 @@ def count_valence(config: str) -> int:
         config = config.split(']')[1].strip()
 
     # Parse orbital occupations
-    import re
-    pattern = r'(\d+)([spdfg])(\d+)'
-    matches = re.findall(pattern, config)
+    matches = _ORBITAL_PATTERN.findall(config)
 
     if not matches:
         return 0
@@ -306,33 +397,24 @@ def count_valence(config: str) -> int:
     # Count electrons in highest n shell only (ns + np)
     # This follows the standard definition used for group classification
     valence = 0
-    has_s_electrons = False
+    has_sp_electrons = False
 
     for n_str, orbital, count_str in matches:
-        n = int(n_str)
-        count = int(count_str)
-        orbital_type = orbital
-
-        if n == max_n:
-            valence += count
-            if orbital_type == 's':
-                has_s_electrons = True
+        if int(n_str) == max_n:
+            valence += int(count_str)
+            if orbital == 's' or orbital == 'p':
+                has_sp_electrons = True
 
-    # Special case: If highest n has only d/f electrons (no s), valence = 0
+    # Special case: If highest n has no s or p electrons, valence = 0
     # This handles elements like Pd ([Kr] 4d10) where d is the highest orbital
     # but chemically it behaves as having 0 valence electrons for group purposes
-    if not has_s_electrons and max_n > 0:
-        # Check if there are s or p electrons at all in highest shell
-        has_sp_in_max_n = any(
-            int(n_str) == max_n and orbital in ['s', 'p']
-            for n_str, orbital, _ in matches
-        )
-        if not has_sp_in_max_n:
-            return 0
+    if not has_sp_electrons and max_n > 0:
+        return 0
 
     return valence
 
 
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
 def orbital_type(config: str) -> str:
     """
     Determine the highest occupied orbital type (s, p, d, f, g).
@@ -358,17 +440,44 @@ def orbital_type(config: str) -> str:
         >>> orbital_type("[Ar] 3d5 4s2")  # Manganese
         'd'
     """
+    # The last occupied orbital is normally the final token ('6s1' in
+    # '[Xe] 4f14 5d10 6s1'), so check that before scanning the whole string
+    match = _ORBITAL_PATTERN.fullmatch(config.rpartition(' ')[2])
+    if match is not None:
+        return match[2]
+
     # Remove noble gas core
     if '[' in config:
         config = config.split(']')[1].strip()
 
     # Find last occupied orbital
-    import re
-    pattern = r'(\d+)([spdfg])(\d+)'
-    matches = re.findall(pattern, config)
+    matches = _ORBITAL_PATTERN.findall(config)
 
     if not matches:
         return 's'  # Default for noble gases
 
     # Return the orbital type of the last occupied orbital
     return matches[-1][1]
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def valence_and_block(config: str) -> Tuple[int, str]:
+    """
+    Valence electron count and block of a configuration, in one lookup.
+
+    Same as (count_valence(config), orbital_type(config)), cached as a pair
+    for callers that need both, such as ElementGenerator.
+
+    Args:
+        config: Electron configuration string
+
+    Returns:
+        Tuple of (valence electrons, orbital type)
+
+    Examples:
+        >>> valence_and_block("[He] 2s2 2p2")  # Carbon
+        (4, 'p')
+        >>> valence_and_block("[Kr] 4d10")  # Palladium
+        (0, 'd')
+    """
+    return count_valence(config), orbital_type(config)
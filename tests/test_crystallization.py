@@ -5,16 +5,24 @@ This tests the fundamental question: Can we detect when a system should be
 cached as a unit rather than decomposed?
 """
 
-import sys
-sys.path.insert(0, '/run/media/Barzin/SyncSpace-ext4/Codebases/Deus Ex Machina')
-
+import io
 import json
+import os
+import sys
+from contextlib import redirect_stdout
 from dataclasses import dataclass
 from typing import List, Tuple
-from src.crystallization.detector import CrystallizationDetector
+from src.crystallization.detector import CrystallizationDetector, RING_SIZE_BEYOND_SEARCH
+
+# Optional faster JSON parser for the molecule files
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 
-@dataclass
+@dataclass(slots=True)
 class MolecularStructure:
     """Simple molecular structure representation."""
     name: str
@@ -26,8 +34,9 @@ class MolecularStructure:
 
 def load_molecule(filepath: str) -> MolecularStructure:
     """Load molecule from JSON file."""
-    with open(filepath, 'r') as f:
-        data = json.load(f)
+    with open(filepath, 'rb') as f:
+        raw = f.read()
+    data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
 
     return MolecularStructure(
         name=data['name'],
@@ -38,6 +47,21 @@ def load_molecule(filepath: str) -> MolecularStructure:
     )
 
 
+# Reference-energy key per (element, element, bond order); bonds not listed
+# contribute nothing
+_BOND_ENERGY_KEYS = {
+    ('C', 'C', 1): 'C-C_single',
+    ('C', 'H', 1): 'C-H',
+    ('H', 'C', 1): 'C-H',
+    ('C', 'C', 2): 'C=C_double',
+}
+
+# For benzene, treat aromatic bonds as LOCALIZED (alternating single/double).
+# This gives the "cyclohexatriene" reference for measuring resonance energy.
+# Bond 0 is double, 1 is single, 2 is double, etc. (atom index as proxy)
+_AROMATIC_KEYS = ('C=C_double', 'C-C_single')
+
+
 def naive_bond_energy(structure: MolecularStructure) -> float:
     """
     Compute naive additive energy by summing individual bond energies.
@@ -45,47 +69,24 @@ def naive_bond_energy(structure: MolecularStructure) -> float:
     This treats the molecule as a simple sum of isolated bonds,
     ignoring resonance, strain, and other collective effects.
     """
+    atoms = structure.atoms
+    reference = structure.reference_energies
     total_energy = 0.0
 
     for atom_i, atom_j, bond_order in structure.bonds:
-        # Get atoms
-        elem_i = structure.atoms[atom_i]['element']
-        elem_j = structure.atoms[atom_j]['element']
+        elem_i = atoms[atom_i]['element']
+        elem_j = atoms[atom_j]['element']
 
-        # Look up bond energy based on elements and order
-        bond_key = f"{elem_i}-{elem_j}"
-        if bond_key not in structure.reference_energies:
-            bond_key = f"{elem_j}-{elem_i}"  # Try reverse
-
-        # For benzene, treat aromatic bonds as LOCALIZED (alternating single/double)
-        # This gives the "cyclohexatriene" reference for measuring resonance energy
         if abs(bond_order - 1.5) < 0.01:  # Aromatic bond
-            if elem_i == 'C' and elem_j == 'C':
-                # Cyclohexatriene has 3 single + 3 double bonds
-                # Alternate: bond 0 is double, 1 is single, 2 is double, etc.
-                bond_index = atom_i  # Use atom index as proxy for bond index
-                if bond_index % 2 == 0:
-                    energy = structure.reference_energies['C=C_double']
-                else:
-                    energy = structure.reference_energies['C-C_single']
-            else:
-                energy = 0.0
-        elif bond_order == 1:  # Single bond
-            if elem_i == 'C' and elem_j == 'C':
-                energy = structure.reference_energies['C-C_single']
-            elif (elem_i == 'C' and elem_j == 'H') or (elem_i == 'H' and elem_j == 'C'):
-                energy = structure.reference_energies['C-H']
-            else:
-                energy = 0.0
-        elif bond_order == 2:  # Double bond
-            if elem_i == 'C' and elem_j == 'C':
-                energy = structure.reference_energies['C=C_double']
-            else:
-                energy = 0.0
+            if elem_i != 'C' or elem_j != 'C':
+                continue
+            key = _AROMATIC_KEYS[atom_i % 2]
         else:
-            energy = 0.0
+            key = _BOND_ENERGY_KEYS.get((elem_i, elem_j, bond_order))
+            if key is None:
+                continue
 
-        total_energy += energy
+        total_energy += reference[key]
 
     return total_energy
 
@@ -164,7 +165,7 @@ def test_hypothetical_ethane():
 
     # Create simple ethane structure
     # C-C single bond + 6 C-H bonds
-    @dataclass
+    @dataclass(slots=True)
     class SimpleStructure:
         name: str
         atoms: List[dict]
@@ -234,6 +235,235 @@ def test_hypothetical_ethane():
     return violation
 
 
+def test_feature_cache():
+    """Test that identical graphs reuse memoized structural features."""
+    print("\n" + "="*60)
+    print("TEST: Structural Feature Cache")
+    print("="*60)
+
+    benzene = load_molecule('data/molecules/benzene.json')
+    detector = CrystallizationDetector()
+
+    first = detector.extract_structural_features(benzene)
+
+    # Same graph, bonds listed in reverse order and direction
+    benzene.bonds = [(j, i, order) for i, j, order in reversed(benzene.bonds)]
+    second = detector.extract_structural_features(benzene)
+
+    print(f"\nCached graphs: {len(detector._feature_cache)}")
+    print(f"First:  {first}")
+    print(f"Second: {second}")
+
+    assert len(detector._feature_cache) == 1
+    assert first == second
+    assert first is not second  # Callers get their own copy
+
+    detector.clear_feature_cache()
+    assert len(detector._feature_cache) == 0
+
+    print("\n✓ Feature cache test complete")
+
+
+def test_in_place_bond_edit():
+    """Test that editing bonds in place is seen by a reused detector."""
+    print("\n" + "="*60)
+    print("TEST: In-Place Bond Edit")
+    print("="*60)
+
+    chain = MolecularStructure(
+        name="Butane skeleton",
+        atoms=[{"index": i, "element": "C"} for i in range(4)],
+        bonds=[(0, 1, 1.0), (1, 2, 1.0), (2, 3, 1.0)],
+        actual_energy=0.0,
+        reference_energies={}
+    )
+    detector = CrystallizationDetector()
+
+    before = detector.extract_structural_features(chain)
+    chain.bonds[2] = (2, 0, 1.0)  # Same length, now a 3-ring
+    after = detector.extract_structural_features(chain)
+
+    print(f"\nCycles before: {before.num_cycles}, after: {after.num_cycles}")
+    assert before.num_cycles == 0
+    assert after == CrystallizationDetector().extract_structural_features(chain)
+    assert after.num_cycles == 1
+
+    print("\n✓ Edited graph re-analyzed")
+
+
+def test_duplicate_bonds():
+    """Test that repeated bonds and self-loops add no edges or cycles."""
+    print("\n" + "="*60)
+    print("TEST: Duplicate Bonds")
+    print("="*60)
+
+    chain = MolecularStructure(
+        name="Propane skeleton, C1-C2 listed twice",
+        atoms=[{"index": i, "element": "C"} for i in range(3)],
+        bonds=[(0, 1, 1.0), (1, 0, 1.0), (1, 2, 1.0), (2, 2, 1.0)],
+        actual_energy=0.0,
+        reference_energies={}
+    )
+    features = CrystallizationDetector().extract_structural_features(chain)
+
+    print(f"\n{features}")
+    assert features.num_edges == 2
+    assert features.num_cycles == 0
+
+    print("\n✓ Multigraph input reduced to its simple graph")
+
+
+def _carbon_rings(*sizes: int) -> MolecularStructure:
+    """Disjoint single-bonded carbon rings of the given sizes."""
+    bonds = []
+    start = 0
+    for size in sizes:
+        bonds += [(start + i, start + (i + 1) % size, 1.0) for i in range(size)]
+        start += size
+    return MolecularStructure(
+        name=f"Carbon rings {sizes}",
+        atoms=[{"index": i, "element": "C"} for i in range(start)],
+        bonds=bonds,
+        actual_energy=0.0,
+        reference_energies={}
+    )
+
+
+def test_ring_sizes():
+    """Test ring sizes up to the search horizon, and the bound beyond it."""
+    print("\n" + "="*60)
+    print("TEST: Ring Sizes")
+    print("="*60)
+
+    detector = CrystallizationDetector()
+    print()
+    for size, expected in ((3, 3), (16, 16), (17, RING_SIZE_BEYOND_SEARCH), (20, RING_SIZE_BEYOND_SEARCH)):
+        features = detector.extract_structural_features(_carbon_rings(size))
+        print(f"{size}-ring: cycles={features.num_cycles}, max_cycle_size={features.max_cycle_size}")
+        assert features.num_cycles == 1
+        assert features.max_cycle_size == expected
+
+    # One independent cycle per ring, whether or not they are connected;
+    # rings beyond the horizon do not count towards max_cycle_size
+    features = detector.extract_structural_features(_carbon_rings(3, 6, 20))
+    print(f"3+6+20 rings: cycles={features.num_cycles}, max_cycle_size={features.max_cycle_size}")
+    assert features.num_cycles == 3
+    assert features.max_cycle_size == 6
+
+    print("\n✓ Ring sizes resolved up to the horizon")
+
+
+def test_feature_flags():
+    """Test that derived flags follow the current feature values."""
+    print("\n" + "="*60)
+    print("TEST: Resonance and Symmetry Flags")
+    print("="*60)
+
+    detector = CrystallizationDetector()
+    features = detector._default_features()
+    assert not features.has_resonance()
+
+    # Flags are derived on each call, so edits are reflected
+    features.conjugation = 0.9
+    features.symmetry_order = 6
+    print(f"\n{features}: resonance={features.has_resonance()}, "
+          f"symmetric={features.is_symmetric()}")
+    assert features.has_resonance() and features.is_symmetric()
+
+    # classify_violation goes through the public methods
+    class AlwaysResonant(type(features)):
+        __slots__ = ()
+
+        def has_resonance(self):
+            return True
+
+    plain = detector._default_features()
+    resonant = AlwaysResonant(**plain.as_dict())
+    assert detector.classify_violation(0.0, 0.0, plain) == "decomposes_cleanly"
+    assert detector.classify_violation(0.0, 0.0, resonant) == "uncertain"
+
+    print("\n✓ Flags computed from current values")
+
+
+def test_batch_measurement():
+    """Test that the batch API matches per-structure measurements."""
+    print("\n" + "="*60)
+    print("TEST: Batch Additivity Measurement")
+    print("="*60)
+
+    paths = sorted(entry.path for entry in os.scandir('data/molecules')
+                   if entry.name.endswith('.json'))
+    molecules = [load_molecule(path) for path in paths]
+    detector = CrystallizationDetector(violation_threshold=0.05)
+
+    batch = detector.measure_additivity_violations(
+        structures=molecules,
+        naive_fns=naive_bond_energy,
+        actual_values=[m.actual_energy for m in molecules],
+        confidences=[0.90] * len(molecules)
+    )
+
+    print()
+    for molecule, violation in zip(molecules, batch):
+        single = detector.measure_additivity_violation(
+            structure=molecule,
+            naive_fn=naive_bond_energy,
+            actual_value=molecule.actual_energy,
+            confidence=0.90
+        )
+        print(f"  {molecule.name:<28} {violation.classification:<18} "
+              f"(single: {single.classification})")
+        assert violation == single
+
+    print(f"\n✓ Batch of {len(batch)} matches per-structure measurements")
+
+
+def test_negligible_violation():
+    """Test that exact additivity skips classification but keeps real features."""
+    print("\n" + "="*60)
+    print("TEST: Negligible Violation Fast Path")
+    print("="*60)
+
+    benzene = load_molecule('data/molecules/benzene.json')
+    detector = CrystallizationDetector(violation_threshold=0.05)
+
+    naive = naive_bond_energy(benzene)
+    violation = detector.measure_additivity_violation(
+        structure=benzene,
+        naive_fn=naive_bond_energy,
+        actual_value=naive
+    )
+
+    print(f"\nClassification: {violation.classification}")
+    print(f"Reasoning: {violation.reasoning}")
+    assert violation.classification == "decomposes_cleanly"
+    assert violation.reasoning == "negligible violation"
+    assert violation.structural_features == detector.extract_structural_features(benzene)
+    assert violation.structural_features.num_cycles == 1
+
+    print("\n✓ Classification skipped, features reported")
+
+
+def test_approximate_clustering():
+    """Test that sampled clustering tracks the exact transitivity."""
+    print("\n" + "="*60)
+    print("TEST: Approximate Clustering Coefficient")
+    print("="*60)
+
+    cyclopropane = load_molecule('data/molecules/cyclopropane.json')
+    exact = CrystallizationDetector(clustering_mode="exact")
+    approx = CrystallizationDetector(clustering_mode="approx", clustering_samples=20000)
+
+    exact_value = exact.extract_structural_features(cyclopropane).clustering
+    approx_value = approx.extract_structural_features(cyclopropane).clustering
+
+    print(f"\nExact:  {exact_value:.4f}")
+    print(f"Approx: {approx_value:.4f}")
+    assert abs(approx_value - exact_value) < 0.02
+
+    print("\n✓ Sampled estimate within tolerance")
+
+
 def main():
     """Run crystallization detection tests."""
     print("\n" + "="*60)
@@ -247,6 +477,30 @@ def main():
     # Test 2: Ethane (decomposes cleanly)
     ethane_violation = test_hypothetical_ethane()
 
+    # Test 3: Memoized feature extraction
+    test_feature_cache()
+
+    # Test 4: In-place edits are not served stale
+    test_in_place_bond_edit()
+
+    # Test 5: Duplicate bonds are not extra edges
+    test_duplicate_bonds()
+
+    # Test 6: Ring sizes and cycle counts
+    test_ring_sizes()
+
+    # Test 7: Resonance/symmetry flags
+    test_feature_flags()
+
+    # Test 8: Batch API
+    test_batch_measurement()
+
+    # Test 9: Exact additivity fast path
+    test_negligible_violation()
+
+    # Test 10: Sampled clustering for large graphs
+    test_approximate_clustering()
+
     # Summary
     print("\n" + "="*60)
     print("SUMMARY: Crystallization Detection")
@@ -277,4 +531,10 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    # Collect the report in memory and write it out in one go
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            main()
+    finally:
+        sys.stdout.write(buffer.getvalue())
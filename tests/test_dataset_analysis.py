@@ -4,17 +4,36 @@ Automated analysis of molecular dataset for crystallization patterns.
 Processes all molecules in data/molecules/ and generates comprehensive report.
 """
 
-import sys
-sys.path.insert(0, '/run/media/Barzin/SyncSpace-ext4/Codebases/Deus Ex Machina')
-
+import argparse
+import hashlib
 import json
-import glob
+import io
+import os
+import pickle
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
 from dataclasses import dataclass
+from pathlib import Path
 from typing import List, Tuple, Dict
 from src.crystallization.detector import CrystallizationDetector, AdditivityViolation
 
+# Optional faster JSON parser for the molecule files
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Measured violations are pickled here between runs, under the repository
+# root rather than the working directory. Loading a pickle can run arbitrary
+# code, so only point this at a directory you trust.
+VIOLATION_CACHE_DIR = Path(__file__).resolve().parent.parent / '.cache' / 'violations'
 
-@dataclass
+
+@dataclass(slots=True)
 class MolecularStructure:
     """Simple molecular structure representation."""
     name: str
@@ -28,8 +47,9 @@ class MolecularStructure:
 
 def load_molecule(filepath: str) -> MolecularStructure:
     """Load molecule from JSON file."""
-    with open(filepath, 'r') as f:
-        data = json.load(f)
+    with open(filepath, 'rb') as f:
+        raw = f.read()
+    data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
 
     return MolecularStructure(
         name=data['name'],
@@ -42,76 +62,123 @@ def load_molecule(filepath: str) -> MolecularStructure:
     )
 
 
+# Reference-energy key and fallback (kJ/mol) per (element, element, order);
+# bonds not listed contribute nothing
+_BOND_ENERGY_KEYS = {
+    ('C', 'C', 1): ('C-C_single', 346),
+    ('C', 'H', 1): ('C-H', 413),
+    ('H', 'C', 1): ('C-H', 413),
+    ('C', 'C', 2): ('C=C_double', 602),
+    ('C', 'C', 3): ('C-C_triple', 835),
+}
+
+# Aromatic C-C bonds as localized cyclohexatriene, indexed by atom_i parity
+_AROMATIC_KEYS = (('C=C_double', 602), ('C-C_single', 346))
+
+
 def naive_bond_energy(structure: MolecularStructure) -> float:
     """
     Compute naive additive energy by summing individual bond energies.
     """
+    atoms = structure.atoms
+    reference = structure.reference_energies
     total_energy = 0.0
 
     for atom_i, atom_j, bond_order in structure.bonds:
-        elem_i = structure.atoms[atom_i]['element']
-        elem_j = structure.atoms[atom_j]['element']
+        elem_i = atoms[atom_i]['element']
+        elem_j = atoms[atom_j]['element']
 
-        # Handle different bond orders
         if abs(bond_order - 1.5) < 0.01:  # Aromatic
-            if elem_i == 'C' and elem_j == 'C':
-                # Cyclohexatriene reference: alternating single/double
-                bond_index = atom_i
-                if bond_index % 2 == 0:
-                    energy = structure.reference_energies.get('C=C_double', 602)
-                else:
-                    energy = structure.reference_energies.get('C-C_single', 346)
-            else:
-                energy = 0.0
-        elif bond_order == 1:  # Single
-            if elem_i == 'C' and elem_j == 'C':
-                energy = structure.reference_energies.get('C-C_single', 346)
-            elif {elem_i, elem_j} == {'C', 'H'}:
-                energy = structure.reference_energies.get('C-H', 413)
-            else:
-                energy = 0.0
-        elif bond_order == 2:  # Double
-            if elem_i == 'C' and elem_j == 'C':
-                energy = structure.reference_energies.get('C=C_double', 602)
-            else:
-                energy = 0.0
-        elif bond_order == 3:  # Triple
-            if elem_i == 'C' and elem_j == 'C':
-                energy = structure.reference_energies.get('C-C_triple', 835)
-            else:
-                energy = 0.0
+            if elem_i != 'C' or elem_j != 'C':
+                continue
+            key = _AROMATIC_KEYS[atom_i % 2]
         else:
-            energy = 0.0
+            key = _BOND_ENERGY_KEYS.get((elem_i, elem_j, bond_order))
+            if key is None:
+                continue
 
-        total_energy += energy
+        total_energy += reference.get(*key)
 
     return total_energy
 
 
-def analyze_dataset():
-    """Analyze all molecules in dataset and generate comprehensive report."""
+def _violation_cache_salt() -> bytes:
+    """Digest of the code behind a measurement (the detector and this script)."""
+    digest = hashlib.blake2b()
+    for path in (sys.modules[CrystallizationDetector.__module__].__file__, __file__):
+        digest.update(Path(path).read_bytes())
+    return digest.digest()
+
+
+def cached_violation(filepath: str, salt: bytes, measure) -> AdditivityViolation:
+    """
+    Return the violation for a molecule file, measuring it only on a cache miss.
+
+    Entries are keyed by the file contents under salt, so editing the molecule
+    or the measuring code makes the old entry unreachable. The key only names
+    the entry: it does not authenticate it, and entries are unpickled as-is.
+    """
+    key = hashlib.blake2b(Path(filepath).read_bytes(), key=salt, digest_size=16).hexdigest()
+    cache_path = VIOLATION_CACHE_DIR / f"{key}.pkl"
+
+    try:
+        return pickle.loads(cache_path.read_bytes())
+    except Exception:
+        pass  # Missing, truncated or stale entry: measure again
+
+    violation = measure()
+
+    # Write to a temporary file and rename it into place, so a concurrent or
+    # interrupted run never leaves a partial entry behind
+    VIOLATION_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=VIOLATION_CACHE_DIR, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(pickle.dumps(violation))
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return violation
+
+
+def analyze_dataset(verbose: bool = False, use_cache: bool = True):
+    """
+    Analyze all molecules in dataset and generate comprehensive report.
+
+    The per-molecule detailed analysis is only printed when verbose is set;
+    the summary table and pattern analysis are always shown. With use_cache,
+    violations measured by earlier runs are read from VIOLATION_CACHE_DIR.
+    """
     print("\n" + "="*70)
     print("DATASET ANALYSIS: Crystallization Patterns")
     print("="*70)
 
     # Load all molecules
-    molecule_files = glob.glob('data/molecules/*.json')
+    molecule_files = [entry.path for entry in os.scandir('data/molecules')
+                      if entry.name.endswith('.json')]
     print(f"\nFound {len(molecule_files)} molecules")
 
+    # Load files concurrently (I/O bound); map() keeps the sorted order
+    molecule_files.sort()
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        molecules = list(pool.map(load_molecule, molecule_files))
+
     detector = CrystallizationDetector(violation_threshold=0.05)
+    salt = _violation_cache_salt() if use_cache else None
     results = []
 
     # Analyze each molecule
-    for filepath in sorted(molecule_files):
-        molecule = load_molecule(filepath)
-
-        violation = detector.measure_additivity_violation(
-            structure=molecule,
-            naive_fn=naive_bond_energy,
-            actual_value=molecule.actual_energy,
-            confidence=0.90
-        )
-
+    for filepath, molecule in zip(molecule_files, molecules):
+        def measure(molecule=molecule):
+            return detector.measure_additivity_violation(
+                structure=molecule,
+                naive_fn=naive_bond_energy,
+                actual_value=molecule.actual_energy,
+                confidence=0.90
+            )
+
+        violation = cached_violation(filepath, salt, measure) if use_cache else measure()
         results.append((molecule, violation))
 
     # Summary table
@@ -130,58 +197,70 @@ def analyze_dataset():
               f"{violation.classification:<18}")
 
     # Detailed analysis
-    print("\n" + "="*70)
-    print("DETAILED ANALYSIS")
-    print("="*70)
-
-    for molecule, violation in results:
-        print(f"\n{'='*70}")
-        print(f"Molecule: {molecule.name} ({molecule.formula})")
-        print(f"{'='*70}")
-
-        # Energy analysis
-        print(f"\nEnergy Analysis:")
-        print(f"  Naive: {violation.naive_value:.0f} kJ/mol")
-        print(f"  Actual: {violation.actual_value:.0f} kJ/mol")
-        print(f"  Violation: {violation.violation:+.0f} kJ/mol ({violation.relative_violation:+.1%})")
-
-        # Structural features
-        features = violation.structural_features
-        print(f"\nStructural Features:")
-        print(f"  Atoms: {features['num_nodes']}, Bonds: {features['num_edges']}")
-        print(f"  Cycles: {features['num_cycles']}, Symmetry: {features['symmetry_order']}")
-        print(f"  Conjugation: {features['conjugation']:.2f}")
-
-        # Classification
-        print(f"\nClassification: {violation.classification}")
-        print(f"Reasoning: {violation.reasoning}")
-
-        # Interpretation
-        print(f"\nInterpretation:")
-        if violation.violation > 0:
-            print(f"  → Bonds STRONGER than expected (+{violation.violation:.0f} kJ/mol)")
-            print(f"  → System MORE stable (resonance, delocalization)")
-        elif violation.violation < 0:
-            print(f"  → Bonds WEAKER than expected ({violation.violation:.0f} kJ/mol)")
-            print(f"  → System LESS stable (ring strain, stress)")
-        else:
-            print(f"  → Additivity works (no special structure)")
+    if verbose:
+        print("\n" + "="*70)
+        print("DETAILED ANALYSIS")
+        print("="*70)
+
+        for molecule, violation in results:
+            print(f"\n{'='*70}")
+            print(f"Molecule: {molecule.name} ({molecule.formula})")
+            print(f"{'='*70}")
+
+            # Energy analysis
+            print(f"\nEnergy Analysis:")
+            print(f"  Naive: {violation.naive_value:.0f} kJ/mol")
+            print(f"  Actual: {violation.actual_value:.0f} kJ/mol")
+            print(f"  Violation: {violation.violation:+.0f} kJ/mol ({violation.relative_violation:+.1%})")
+
+            # Structural features
+            features = violation.structural_features
+            print(f"\nStructural Features:")
+            print(f"  Atoms: {features['num_nodes']}, Bonds: {features['num_edges']}")
+            print(f"  Cycles: {features['num_cycles']}, Symmetry: {features['symmetry_order']}")
+            print(f"  Conjugation: {features['conjugation']:.2f}")
+
+            # Classification
+            print(f"\nClassification: {violation.classification}")
+            print(f"Reasoning: {violation.reasoning}")
+
+            # Interpretation
+            print(f"\nInterpretation:")
+            if violation.violation > 0:
+                print(f"  → Bonds STRONGER than expected (+{violation.violation:.0f} kJ/mol)")
+                print(f"  → System MORE stable (resonance, delocalization)")
+            elif violation.violation < 0:
+                print(f"  → Bonds WEAKER than expected ({violation.violation:.0f} kJ/mol)")
+                print(f"  → System LESS stable (ring strain, stress)")
+            else:
+                print(f"  → Additivity works (no special structure)")
 
-        # Notes
-        if molecule.notes:
-            print(f"\nNotes:")
-            for note in molecule.notes[:3]:  # First 3 notes
-                print(f"  • {note}")
+            # Notes
+            if molecule.notes:
+                print(f"\nNotes:")
+                for note in molecule.notes[:3]:  # First 3 notes
+                    print(f"  • {note}")
 
     # Pattern analysis
     print("\n" + "="*70)
     print("PATTERN ANALYSIS")
     print("="*70)
 
-    # Categorize by violation sign
-    positive = [(m, v) for m, v in results if v.violation > 50]
-    negative = [(m, v) for m, v in results if v.violation < -50]
-    neutral = [(m, v) for m, v in results if -50 <= v.violation <= 50]
+    # Categorize by violation sign and by cycles in a single pass
+    positive, negative, neutral = [], [], []
+    has_cycles, no_cycles = [], []
+    for m, v in results:
+        if v.violation > 50:
+            positive.append((m, v))
+        elif v.violation < -50:
+            negative.append((m, v))
+        else:
+            neutral.append((m, v))
+
+        if v.structural_features.num_cycles > 0:
+            has_cycles.append((m, v))
+        else:
+            no_cycles.append((m, v))
 
     print(f"\nViolation Sign Distribution:")
     print(f"  Positive (>+50 kJ/mol): {len(positive)} molecules")
@@ -198,16 +277,13 @@ def analyze_dataset():
 
     # Conjugation correlation
     print(f"\nConjugation vs Violation:")
-    sorted_by_conj = sorted(results, key=lambda x: x[1].structural_features.get('conjugation', 0.0), reverse=True)
+    sorted_by_conj = sorted(results, key=lambda x: x[1].structural_features.conjugation, reverse=True)
     for m, v in sorted_by_conj[:5]:  # Top 5 by conjugation
-        conj = v.structural_features.get('conjugation', 0.0)
+        conj = v.structural_features.conjugation
         print(f"  • {m.name}: conjugation={conj:.2f}, violation={v.violation:+.0f} kJ/mol")
 
     # Cycles correlation
     print(f"\nCycles vs Violation:")
-    has_cycles = [(m, v) for m, v in results if v.structural_features.get('num_cycles', 0) > 0]
-    no_cycles = [(m, v) for m, v in results if v.structural_features.get('num_cycles', 0) == 0]
-
     if has_cycles:
         avg_viol_cycles = sum(v.violation for _, v in has_cycles) / len(has_cycles)
         print(f"  With cycles ({len(has_cycles)}): avg violation = {avg_viol_cycles:+.0f} kJ/mol")
@@ -241,4 +317,17 @@ def analyze_dataset():
 
 
 if __name__ == '__main__':
-    analyze_dataset()
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--verbose', action='store_true',
+                        help='include the per-molecule detailed analysis')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='measure every molecule even if a cached result exists')
+    args = parser.parse_args()
+
+    # Collect the report in memory and write it out in one go
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            analyze_dataset(verbose=args.verbose, use_cache=not args.no_cache)
+    finally:
+        sys.stdout.write(buffer.getvalue())
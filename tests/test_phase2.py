@@ -2,12 +2,16 @@
 Test ElementGenerator and ConfidenceScorer (Phase 2).
 """
 
-import sys
-sys.path.insert(0, '/run/media/Barzin/SyncSpace-ext4/Codebases/Deus Ex Machina')
-
 from src.theory.generator import ElementGenerator
-from src.theory.confidence import ConfidenceScorer
+from src.theory.confidence import ConfidenceScorer, PROPERTY_NAMES
 from src.core.element import ElementStatus
+from src.core.element_table import ElementTable
+
+
+# Shared across tests; both are stateless apart from their caches
+_GEN = ElementGenerator(model="pyykkö_2011", confidence_profile="default")
+_SCORERS = {profile: ConfidenceScorer(profile=profile)
+            for profile in ("default", "conservative", "optimistic")}
 
 
 def test_confidence_scorer():
@@ -16,7 +20,7 @@ def test_confidence_scorer():
     print("TEST: ConfidenceScorer")
     print("="*60)
 
-    scorer = ConfidenceScorer(profile="default")
+    scorer = _SCORERS["default"]
     print(f"Scorer: {scorer}\n")
 
     # Test different Z ranges
@@ -31,8 +35,13 @@ def test_confidence_scorer():
         (173, "Beyond limit", "beyond_qed_limit"),
     ]
 
-    for Z, name, expected_range in test_cases:
-        scores = scorer.get_all_confidences(Z)
+    # All Z at once, one list per property
+    batch = scorer.get_all_confidences_batch(Z for Z, _, _ in test_cases)
+
+    for i, (Z, name, expected_range) in enumerate(test_cases):
+        scores = {prop: column[i] for prop, column in batch.items()}
+        assert scores == scorer.get_all_confidences(Z)
+
         print(f"{name} (Z={Z}):")
         print(f"  Electron config: {scores['electron_configuration']:.2f}")
         print(f"  Atomic radius:   {scores['atomic_radius']:.2f}")
@@ -48,7 +57,7 @@ def test_element_generator():
     print("TEST: ElementGenerator")
     print("="*60)
 
-    gen = ElementGenerator(model="pyykkö_2011", confidence_profile="default")
+    gen = _GEN
     print(f"Generator: {gen}\n")
 
     # Test elements across different regimes
@@ -62,7 +71,7 @@ def test_element_generator():
         print(f"  Config: {elem.electron_configuration}")
         print(f"  Valence: {elem.valence_electrons}")
         print(f"  Block: {elem.block}")
-        print(f"  Status: {elem.status.value}")
+        print(f"  Status: {elem.status.label}")
         print(f"  Config confidence: {elem.confidence['electron_configuration']:.2f}")
         print()
 
@@ -75,7 +84,7 @@ def test_element_status_classification():
     print("TEST: Element Status Classification")
     print("="*60)
 
-    gen = ElementGenerator()
+    gen = _GEN
 
     status_tests = [
         (1, ElementStatus.OBSERVED),
@@ -93,10 +102,10 @@ def test_element_status_classification():
     for Z, expected_status in status_tests:
         elem = gen.generate(Z)
         if elem.status == expected_status:
-            print(f"✓ Z={Z:3d}: {elem.status.value:20s} (expected: {expected_status.value})")
+            print(f"✓ Z={Z:3d}: {elem.status.label:20s} (expected: {expected_status.label})")
             passed += 1
         else:
-            print(f"✗ Z={Z:3d}: {elem.status.value:20s} (expected: {expected_status.value})")
+            print(f"✗ Z={Z:3d}: {elem.status.label:20s} (expected: {expected_status.label})")
 
     print(f"\nPassed: {passed}/{len(status_tests)}")
     print()
@@ -111,15 +120,151 @@ def test_confidence_profiles():
     Z = 120  # Test element in theoretical range
 
     for profile in ["default", "conservative", "optimistic"]:
-        scorer = ConfidenceScorer(profile=profile)
+        scorer = _SCORERS[profile]
         config_conf = scorer.electron_config_confidence(Z)
         radius_conf = scorer.atomic_radius_confidence(Z)
 
         print(f"{profile.capitalize():12s}: config={config_conf:.2f}, radius={radius_conf:.2f}")
 
+    # Scorers share the parsed file but not the profile objects
+    scorer = ConfidenceScorer(profile="default")
+    scorer.profile["z_ranges"].clear()
+    assert ConfidenceScorer(profile="default").z_ranges == _SCORERS["default"].z_ranges
+    assert _SCORERS["default"].z_ranges
+
     print("\n✓ Profile comparison complete\n")
 
 
+def test_electronegativity():
+    """Test tabulated (Z≤118) and extrapolated (Z>118) electronegativity."""
+    print("="*60)
+    print("TEST: Electronegativity")
+    print("="*60)
+
+    gen = _GEN
+    cases = [
+        (1, 2.20),     # H
+        (2, None),     # He (noble gas, undefined)
+        (6, 2.55),     # C
+        (9, 3.98),     # F
+        (79, 2.54),    # Au
+        (118, None),   # Og (no Pauling value)
+        (119, 0.8),    # Uue, alkali-like extrapolation
+        (120, 1.2),    # Ubn, alkaline-earth-like extrapolation
+    ]
+
+    for Z, expected in cases:
+        en = gen.generate(Z).electronegativity
+        print(f"Z={Z:3d}: EN={en} (expected: {expected})")
+        assert en == expected
+
+    print("\n✓ Electronegativity test complete\n")
+
+
+def test_element_table():
+    """Test SoA ElementTable filtering and round-trip to Element objects."""
+    print("="*60)
+    print("TEST: ElementTable (column storage)")
+    print("="*60)
+
+    gen = _GEN
+    elements = [gen.generate(Z) for Z in range(1, 174)]
+    table = ElementTable.from_elements(elements)
+    print(f"{table}\n")
+
+    # Round-trip preserves every element
+    assert table.to_elements() == elements
+
+    # Filters match the equivalent list traversal
+    mask = table.filter(atomic_number__lt=118)
+    assert table.to_elements(mask) == [e for e in elements if e.atomic_number < 118]
+
+    mask = table.filter(status=ElementStatus.SUPERCRITICAL, block='p')
+    expected = [e for e in elements
+                if e.status == ElementStatus.SUPERCRITICAL and e.block == 'p']
+    assert table.to_elements(mask) == expected
+    print(f"Supercritical p-block elements: {len(expected)}")
+
+    # Confidence matrix columns line up with the per-element dicts
+    config_conf = table.confidence_column('electron_configuration')
+    assert list(config_conf) == [e.confidence['electron_configuration'] for e in elements]
+
+    print("\n✓ ElementTable test complete\n")
+
+
+def test_generate_many():
+    """Test batch generation matches per-element generate()."""
+    print("="*60)
+    print("TEST: ElementGenerator.generate_many")
+    print("="*60)
+
+    gen = _GEN
+    Zs = list(range(1, 174))
+    table = gen.generate_many(Zs)
+    print(f"{table}\n")
+
+    assert table.to_elements() == [ElementGenerator().generate(Z) for Z in Zs]
+
+    # Rows follow the requested order
+    assert list(gen.generate_many([120, 6]).atomic_number) == [120, 6]
+
+    try:
+        gen.generate_many([1, 201])
+        assert False, "Z=201 should be rejected"
+    except ValueError:
+        pass
+
+    print("✓ generate_many test complete\n")
+
+
+def test_generate_view():
+    """Test ElementView carries the same values as generate()."""
+    print("="*60)
+    print("TEST: ElementGenerator.generate_view")
+    print("="*60)
+
+    gen = _GEN
+    for Z in (1, 6, 79, 118, 120, 173):
+        view = gen.generate_view(Z)
+        elem = gen.generate(Z)
+        print(f"{view}: confidence={view.confidence}")
+
+        assert view.atomic_number == elem.atomic_number
+        assert view.symbol == elem.symbol and view.name == elem.name
+        assert view.electron_configuration == elem.electron_configuration
+        assert view.valence_electrons == elem.valence_electrons
+        assert view.block == elem.block and view.status == elem.status
+        assert view.electronegativity == elem.electronegativity
+        assert dict(zip(PROPERTY_NAMES, view.confidence)) == elem.confidence
+
+    print("\n✓ generate_view test complete\n")
+
+
+def test_property_cache():
+    """Test generators share computed properties only with identical settings."""
+    print("="*60)
+    print("TEST: ElementGenerator property cache")
+    print("="*60)
+
+    class FixedENGenerator(ElementGenerator):
+        def _compute_electronegativity(self, Z, valence=None):
+            return 1.0
+
+    gen = _GEN
+    assert ElementGenerator()._properties is gen._properties
+
+    # A subclass with its own theory gets its own cache entries
+    custom = FixedENGenerator()
+    assert custom._properties is not gen._properties
+    print(f"C: base EN={gen.generate(6).electronegativity}, "
+          f"subclass EN={custom.generate(6).electronegativity}")
+    assert custom.generate(6).electronegativity == 1.0
+    assert gen.generate(6).electronegativity == 2.55
+    assert ElementGenerator().generate(6).electronegativity == 2.55
+
+    print("\n✓ Property cache test complete\n")
+
+
 def main():
     """Run all Phase 2 tests."""
     print("\n" + "="*60)
@@ -130,6 +275,11 @@ def main():
     test_element_generator()
     test_element_status_classification()
     test_confidence_profiles()
+    test_electronegativity()
+    test_element_table()
+    test_generate_many()
+    test_generate_view()
+    test_property_cache()
 
     print("="*60)
     print("ALL PHASE 2 TESTS COMPLETE")
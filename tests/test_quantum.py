@@ -2,10 +2,13 @@
 Test electron configuration generator against known elements.
 """
 
+import io
 import sys
-sys.path.insert(0, '/run/media/Barzin/SyncSpace-ext4/Codebases/Deus Ex Machina')
+from contextlib import redirect_stdout
 
-from src.theory.quantum import madelung_rule, count_valence, orbital_type
+from src.theory.quantum import (
+    madelung_rule, madelung_rule_batch, count_valence, orbital_type, valence_and_block
+)
 
 
 def test_element(Z: int, name: str, expected_config: str, expected_valence: int, expected_block: str):
@@ -27,6 +30,9 @@ def test_element(Z: int, name: str, expected_config: str, expected_valence: int,
     block = orbital_type(config)
     print(f"Orbital type (block): {block} (expected: {expected_block})")
 
+    # Combined single-pass helper must agree with the separate functions
+    combined_match = valence_and_block(config) == (valence, block)
+
     # Validate
     config_match = config == expected_config
     valence_match = valence == expected_valence
@@ -35,13 +41,38 @@ def test_element(Z: int, name: str, expected_config: str, expected_valence: int,
     print(f"\n✓ Configuration: {'PASS' if config_match else 'FAIL'}")
     print(f"✓ Valence:       {'PASS' if valence_match else 'FAIL'}")
     print(f"✓ Block:         {'PASS' if block_match else 'FAIL'}")
+    print(f"✓ Combined:      {'PASS' if combined_match else 'FAIL'}")
 
-    overall = config_match and valence_match and block_match
+    overall = config_match and valence_match and block_match and combined_match
     print(f"\nOverall: {'✓ PASS' if overall else '✗ FAIL'}")
 
     return overall
 
 
+def test_batch():
+    """Batch configurations match per-element madelung_rule()."""
+    print(f"\n{'='*60}")
+    print("Testing madelung_rule_batch")
+    print(f"{'='*60}")
+
+    Zs = list(range(1, 174))
+    passed = (
+        madelung_rule_batch(Zs) == [madelung_rule(Z) for Z in Zs]
+        and madelung_rule_batch(Zs, use_noble_gas_core=False)
+        == [madelung_rule(Z, use_noble_gas_core=False) for Z in Zs]
+    )
+
+    try:
+        madelung_rule_batch([1, 174])
+        passed = False
+    except ValueError:
+        pass
+
+    print(f"\nOverall: {'✓ PASS' if passed else '✗ FAIL'}")
+    assert passed
+    return passed
+
+
 def main():
     """Run tests for specified elements."""
     print("\n" + "="*60)
@@ -96,6 +127,9 @@ def main():
         expected_block='s'
     ))
 
+    # Test 6: Batch API
+    results.append(test_batch())
+
     # Summary
     print("\n" + "="*60)
     print("TEST SUMMARY")
@@ -112,4 +146,10 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    # Collect the report in memory and write it out in one go
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            main()
+    finally:
+        sys.stdout.write(buffer.getvalue())
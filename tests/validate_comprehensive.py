@@ -3,10 +3,12 @@ Comprehensive validation of electron configuration generator.
 Tests key elements across all periods and blocks.
 """
 
+import io
 import sys
-sys.path.insert(0, '/run/media/Barzin/SyncSpace-ext4/Codebases/Deus Ex Machina')
+from contextlib import redirect_stdout
+from typing import Optional
 
-from src.theory.quantum import madelung_rule, count_valence, orbital_type
+from src.theory.quantum import madelung_rule, madelung_rule_batch, count_valence, orbital_type
 
 
 # Reference data: (Z, symbol, name, expected_config, valence, block)
@@ -59,36 +61,46 @@ REFERENCE_ELEMENTS = [
     (120, 'Ubn', 'Unbinilium', '[Og] 8s2', 2, 's'),
 ]
 
+# madelung_rule() returns interned strings; interning the expected configs
+# too lets matching comparisons succeed on identity
+REFERENCE_ELEMENTS = [(Z, symbol, name, sys.intern(config), valence, block)
+                      for Z, symbol, name, config, valence, block in REFERENCE_ELEMENTS]
+
+# Column view of REFERENCE_ELEMENTS, for whole-table comparisons
+(REFERENCE_Z, REFERENCE_SYMBOLS, REFERENCE_NAMES,
+ REFERENCE_CONFIGS, REFERENCE_VALENCES, REFERENCE_BLOCKS) = zip(*REFERENCE_ELEMENTS)
+
+
+# Detail line per check, indexed by whether it passed
+_CONFIG_LINES = ("  Config:  %(value)s (expected: %(expected)s) ✗", "  Config:  %(value)s ✓")
+_VALENCE_LINES = ("  Valence: %(value)s (expected: %(expected)s) ✗", "  Valence: %(value)s ✓")
+_BLOCK_LINES = ("  Block:   %(value)s (expected: %(expected)s) ✗", "  Block:   %(value)s ✓")
+
 
 def validate_element(Z: int, symbol: str, name: str, expected_config: str,
-                     expected_valence: int, expected_block: str, verbose: bool = False) -> bool:
-    """Validate a single element."""
-    config = madelung_rule(Z, use_noble_gas_core=True)
+                     expected_valence: int, expected_block: str, verbose: bool = False,
+                     config: Optional[str] = None) -> bool:
+    """Validate a single element (config: already-generated configuration, if any)."""
+    if config is None:
+        config = madelung_rule(Z, use_noble_gas_core=True)
     valence = count_valence(config)
     block = orbital_type(config)
 
     config_match = config == expected_config
     valence_match = valence == expected_valence
     block_match = block == expected_block
+    passed = all((config_match, valence_match, block_match))
 
-    if verbose or not (config_match and valence_match and block_match):
-        print(f"\n{symbol} (Z={Z}, {name}):")
-        if not config_match:
-            print(f"  Config:  {config} (expected: {expected_config}) ✗")
-        else:
-            print(f"  Config:  {config} ✓")
+    # Nothing is formatted unless the element is reported
+    if verbose or not passed:
+        print('\n'.join((
+            '\n%s (Z=%d, %s):' % (symbol, Z, name),
+            _CONFIG_LINES[config_match] % {'value': config, 'expected': expected_config},
+            _VALENCE_LINES[valence_match] % {'value': valence, 'expected': expected_valence},
+            _BLOCK_LINES[block_match] % {'value': block, 'expected': expected_block},
+        )))
 
-        if not valence_match:
-            print(f"  Valence: {valence} (expected: {expected_valence}) ✗")
-        else:
-            print(f"  Valence: {valence} ✓")
-
-        if not block_match:
-            print(f"  Block:   {block} (expected: {expected_block}) ✗")
-        else:
-            print(f"  Block:   {block} ✓")
-
-    return config_match and valence_match and block_match
+    return passed
 
 
 def main():
@@ -97,14 +109,17 @@ def main():
     print("COMPREHENSIVE VALIDATION: Z=1-120 KEY ELEMENTS")
     print("="*60)
 
-    results = []
-    failures = []
+    # Generate every configuration in one batched call, then compare by column
+    generated = madelung_rule_batch(REFERENCE_Z)
+    valences = [count_valence(config) for config in generated]
+    blocks = [orbital_type(config) for config in generated]
 
-    for Z, symbol, name, config, valence, block in REFERENCE_ELEMENTS:
-        result = validate_element(Z, symbol, name, config, valence, block, verbose=False)
-        results.append(result)
-        if not result:
-            failures.append((Z, symbol, name))
+    config_ok = [a == b for a, b in zip(generated, REFERENCE_CONFIGS)]
+    valence_ok = [a == b for a, b in zip(valences, REFERENCE_VALENCES)]
+    block_ok = [a == b for a, b in zip(blocks, REFERENCE_BLOCKS)]
+
+    results = [all(checks) for checks in zip(config_ok, valence_ok, block_ok)]
+    failures = [i for i, passed in enumerate(results) if not passed]
 
     # Summary
     print(f"\nTotal elements tested: {len(results)}")
@@ -114,11 +129,9 @@ def main():
 
     if failures:
         print(f"\nFailed elements:")
-        for Z, symbol, name in failures:
+        for i in failures:
             # Re-run with verbose to show details
-            expected = next((e for e in REFERENCE_ELEMENTS if e[0] == Z), None)
-            if expected:
-                validate_element(*expected, verbose=True)
+            validate_element(*REFERENCE_ELEMENTS[i], verbose=True, config=generated[i])
     else:
         print("\n✓ ALL TESTS PASSED")
 
@@ -135,12 +148,18 @@ def main():
         (82, 'Pb', 'Lead'),
     ]
 
-    for Z, symbol, name in spot_check:
-        config = madelung_rule(Z, use_noble_gas_core=True)
+    spot_configs = madelung_rule_batch(Z for Z, _, _ in spot_check)
+    for (Z, symbol, name), config in zip(spot_check, spot_configs):
         valence = count_valence(config)
         block = orbital_type(config)
         print(f"{symbol:3s} (Z={Z:3d}): {config:30s} | valence={valence} | block={block}")
 
 
 if __name__ == '__main__':
-    main()
+    # Collect the report in memory and write it out in one go
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            main()
+    finally:
+        sys.stdout.write(buffer.getvalue())